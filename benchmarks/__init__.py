@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""MongoDBQueriesManager benchmarks.
+
+Run a benchmark module from the repository root (ie, `python -m benchmarks.bench_parser`), or all of them with
+`python -m benchmarks`.
+"""
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Run all the benchmarks modules (`bench_*.py` with a `BENCHMARKS` list), with JSON output and regressions check.
+
+Usage:
+    python -m benchmarks --json results.json
+    python -m benchmarks --compare results.json --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.util
+import json
+import pkgutil
+import platform
+import sys
+from typing import Any
+
+import benchmarks
+from benchmarks.utils import compare_results, measure_stats
+
+
+def run_suite(module_filter: str = "", repeat: int = 20) -> dict[str, dict[str, Any]]:
+    """Run the benchmarks of all the benchmarks modules.
+
+    Args:
+        module_filter (str): Run only the modules whose name contains it.
+        repeat (int): Number of repetitions (samples) per benchmark.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Benchmarks results by name.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith("bench_") or module_filter not in module_info.name:
+            continue
+
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for name, func in getattr(module, "BENCHMARKS", []):
+            stats = measure_stats(func, repeat=repeat)
+            results[f"{module_info.name}: {name}"] = stats
+            print(
+                f"{module_info.name + ': ' + name:<86} {stats['p50_us']:>10.2f} us/call (p90 {stats['p90_us']:.2f})"
+                f" {stats['ops_per_sec']:>12.0f} ops/s"
+            )
+    return results
+
+
+def main() -> int:
+    """Benchmarks command line.
+
+    Returns:
+        int: Exit status, 1 if a regression is found.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="run only the modules whose name contains FILTER")
+    parser.add_argument("--repeat", type=int, default=20, help="repetitions (samples) per benchmark")
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed median slowdown ratio (default 0.1)")
+    args = parser.parse_args()
+
+    results = run_suite(module_filter=args.filter, repeat=args.repeat)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as json_file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "dateparser": importlib.util.find_spec("dateparser") is not None,
+                    "results": results,
+                },
+                json_file,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as json_file:
+            baseline = json.load(json_file)["results"]
+        regressions = compare_results(results, baseline, threshold=args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Batch parsing of distinct queries, into the current process and into a process pool."""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import partial
+
+from mongo_queries_manager import QueryParser
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERIES = [
+    f"status=sent&price>={index}.5&country=GB,US&limit=100&skip={index}&sort=-timestamp&fields=-_id"
+    for index in range(20000)
+]
+
+
+def parse_batch(workers: int | None = None, chunk_size: int = 256) -> None:
+    """Parse all the string queries, results are discarded.
+
+    Args:
+        workers (Optional[int]): Number of process pool workers.
+        chunk_size (int): Number of string queries sent at once to a worker.
+    """
+    deque(QueryParser().parse_many(STRING_QUERIES, workers=workers, chunk_size=chunk_size), maxlen=0)
+
+
+BENCHMARKS: list[Benchmark] = [
+    (f"QueryParser.parse_many(): {len(STRING_QUERIES)} queries", parse_batch),
+    (f"QueryParser.parse_many(): {len(STRING_QUERIES)} queries, 2 workers", partial(parse_batch, workers=2)),
+    (
+        f"QueryParser.parse_many(): {len(STRING_QUERIES)} queries, 2 workers, chunk 2048",
+        partial(parse_batch, workers=2, chunk_size=2048),
+    ),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, number=1, repeat=3)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Blacklist and allowed fields filtering, with 5 and 500 fields."""
+
+from __future__ import annotations
+
+from functools import partial
+
+from mongo_queries_manager import QueryParser
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = "&".join(f"field_{index}.name=John" for index in range(20))
+
+BENCHMARKS: list[Benchmark] = [
+    *(
+        (
+            f"QueryParser.parse(): blacklist of {size} fields",
+            partial(QueryParser(blacklist=[f"other_{index}" for index in range(size)]).parse, STRING_QUERY),
+        )
+        for size in (5, 500)
+    ),
+    *(
+        (
+            f"QueryParser.parse(): {size} allowed fields",
+            partial(QueryParser(allowed_fields=[f"field_{index}" for index in range(size)]).parse, STRING_QUERY),
+        )
+        for size in (5, 500)
+    ),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, number=500)
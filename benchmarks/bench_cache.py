@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Cached against uncached parsing of a repeated query."""
+
+from __future__ import annotations
+
+from functools import partial
+
+from mongo_queries_manager import QueryCache, QueryParser
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = "status=sent&price>=5.6&country=GB,US&limit=100&skip=50&sort=-timestamp&fields=-_id,-created_at"
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): without cache", partial(QueryParser().parse, STRING_QUERY)),
+    ("QueryParser.parse(): with cache (hit)", partial(QueryParser(cache=QueryCache()).parse, STRING_QUERY)),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
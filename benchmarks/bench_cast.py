@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Value casting (`cast_value_logic`) of a corpus of mixed value types, against the 1.0.1 typing table scan."""
+
+from __future__ import annotations
+
+from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
+
+from benchmarks.legacy import LegacyMongoDBQueriesManager
+from benchmarks.utils import Benchmark, run_benchmarks
+
+VALUES: dict[str, list[str]] = {
+    "float": ["5.6", "-0.25", "1e5"],
+    "int (ascii digits are cast as float)": ["5", "-42", "1000000"],
+    "date": ["2016-01-01", "2016-01-01T10:00:00", "2022-10-29T12:42:07.092062+00:00"],
+    "list": ["GB,US", "fr,en,de", "red,green,blue"],
+    "regex": ["/john/i", "/@gmail\\.com$/", "/^06/"],
+    "constant": ["true", "False", "null"],
+    "string": ["sent", "John", "paris"],
+}
+
+MONGODB_QUERIES_MGR = MongoDBQueriesManager()
+LEGACY_MONGODB_QUERIES_MGR = LegacyMongoDBQueriesManager()
+
+
+def cast_values(values: list[str], mongodb_queries_mgr: MongoDBQueriesManager = MONGODB_QUERIES_MGR) -> None:
+    """Cast a list of values.
+
+    Args:
+        values (List[str]): Values to cast.
+        mongodb_queries_mgr (MongoDBQueriesManager): Manager casting the values, current or 1.0.1.
+    """
+    for value in values:
+        mongodb_queries_mgr.cast_value_logic(value)
+
+
+# Values by benchmark name, each type then all of them.
+CORPUS = {
+    **{f"{name} x{len(values)}": values for name, values in VALUES.items()},
+    "mixed corpus": [value for values in VALUES.values() for value in values],
+}
+
+BENCHMARKS: list[Benchmark] = [
+    benchmark
+    for name, values in CORPUS.items()
+    for benchmark in (
+        (f"1.0.1 cast_value_logic(): {name}", lambda values=values: cast_values(values, LEGACY_MONGODB_QUERIES_MGR)),
+        (f"cast_value_logic(): {name}", lambda values=values: cast_values(values)),
+    )
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, number=5000)
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Custom casters dispatch, with 20 registered casters."""
+
+from __future__ import annotations
+
+from functools import partial
+from uuid import UUID
+
+from mongo_queries_manager import PureCaster, QueryParser
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+CASTERS = {f"caster_{index}": str for index in range(18)} | {"uuid": UUID, "string": str}
+PURE_CASTERS = CASTERS | {"uuid": PureCaster(UUID)}
+
+STRING_QUERY = "&".join(
+    [
+        "user=uuid(12345678-1234-5678-1234-567812345678)",
+        "owner=uuid(12345678-1234-5678-1234-567812345678)",
+        "name=string(John)",
+        "price>=5.6",
+        "status=sent",
+    ]
+)
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): 20 casters", partial(QueryParser(casters=CASTERS).parse, STRING_QUERY)),
+    ("QueryParser.parse(): 20 casters, pure uuid", partial(QueryParser(casters=PURE_CASTERS).parse, STRING_QUERY)),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
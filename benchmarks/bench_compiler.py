@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Compiled parser against the generic parsers, same endpoint schema."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+
+from mongo_queries_manager import CompiledParser, QueryParser, mqm
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+SCHEMA = {"status": str, "price": float, "created_at": datetime, "country": str, "author": {"name": str}}
+BLACKLIST = ["token"]
+
+STRING_QUERIES = {
+    "small": "status=sent&limit=10",
+    "medium": "status=sent&price>=5.6&price<10&country=GB,US,FR&sort=-created_at&limit=10",
+    "large": (
+        "status=sent&price>=5.6&price<10&created_at>2016-01-01T10:00:00&country=GB,US,FR&author.name=John&"
+        "!token&token=abc&sort=-created_at,price&skip=20&limit=10&fields=status,price"
+    ),
+}
+
+PARSERS = {
+    "mqm()": partial(mqm, blacklist=BLACKLIST),
+    "QueryParser.parse()": QueryParser(blacklist=BLACKLIST).parse,
+    "QueryParser.parse(), schema": QueryParser(schema=SCHEMA, unknown_fields="reject", blacklist=BLACKLIST).parse,
+    "CompiledParser.parse()": CompiledParser(SCHEMA, blacklist=BLACKLIST).parse,
+}
+
+BENCHMARKS: list[Benchmark] = [
+    (f"{name}: {size}", partial(parse, string_query))
+    for size, string_query in STRING_QUERIES.items()
+    for name, parse in PARSERS.items()
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
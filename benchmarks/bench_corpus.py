@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Full `mqm()` calls on realistic query corpora, run it with and without the `dateparser` extra."""
+
+from __future__ import annotations
+
+from functools import partial
+
+from mongo_queries_manager import mqm
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+try:
+    import dateparser  # noqa: F401
+
+    DATEPARSER = "with dateparser"
+except ModuleNotFoundError:
+    DATEPARSER = "without dateparser"
+
+CORPORA: dict[str, list[str]] = {
+    "listing": [
+        "status=sent&limit=20&skip=0&sort=-created_at",
+        "status=sent&price>=5.6&price<100&country=GB,US&limit=50&skip=100&sort=-timestamp,_id",
+        "category=books&tags=fiction,history&!archived&limit=20&sort=title&fields=title,author,price",
+        "author.firstName=/john/i&rating>=4&limit=10&fields=-_id,-created_at",
+    ],
+    "dates (isoformat)": [
+        "created_at>=2016-01-01&created_at<2017-01-01T00:00:00&limit=100",
+        "updated_at>2022-10-29T12:42:07.092062+00:00&status!=deleted",
+    ],
+    "dates (partial, dateparser)": [
+        "created_at>=2016-01&limit=100",
+        "updated_at>2022-10-29 &status!=deleted",
+    ],
+    "search and projection": [
+        '$text=coffee shop&fields={"score":{"$meta":"textScore"}},name&limit=10',
+        "$text=lyon&city!=paris,marseille&fields=-_id,name,address",
+    ],
+}
+
+POPULATED_CORPUS = [
+    "populate=author,comments,comments.author&fields=title,author.name,comments.author.name&limit=20",
+    "status=published&populate=publisher,publisher.owner,publisher.owner.company&sort=-published_at",
+]
+
+
+def parse_corpus(string_queries: list[str], populate: bool = False) -> None:
+    """Parse a corpus of string queries with `mqm()`.
+
+    Args:
+        string_queries (List[str]): String queries.
+        populate (bool): Add population into returned queries.
+    """
+    for string_query in string_queries:
+        mqm(string_query, populate=populate)
+
+
+BENCHMARKS: list[Benchmark] = [
+    *(
+        (f"mqm(): {name} x{len(string_queries)} ({DATEPARSER})", partial(parse_corpus, string_queries))
+        for name, string_queries in CORPORA.items()
+    ),
+    (
+        f"mqm(): population x{len(POPULATED_CORPUS)} ({DATEPARSER})",
+        partial(parse_corpus, POPULATED_CORPUS, populate=True),
+    ),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, number=500)
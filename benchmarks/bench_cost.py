@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Admission limits overhead, and rejection of an oversized `$in` list before casting its values."""
+
+from __future__ import annotations
+
+import contextlib
+
+from mongo_queries_manager import QueryLimitError, QueryLimits, QueryParser, estimate_cost, mqm
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = "status=sent,received&price>5&name=/^jo/&sort=-created_at&skip=40&limit=20&populate=user"
+OVERSIZED_QUERY = f"tag={','.join(f'tag{value}' for value in range(5000))}&limit=20"
+
+PARSER = QueryParser(populate=True)
+LIMITS_PARSER = QueryParser(
+    populate=True, limits=QueryLimits(max_arguments=50, max_list_values=100, max_limit=100, max_cost=100)
+)
+MONGODB_QUERY = mqm(STRING_QUERY, populate=True)
+
+
+def reject_oversized() -> None:
+    """Parse a query with an oversized list, rejected by the admission limits."""
+    with contextlib.suppress(QueryLimitError):
+        LIMITS_PARSER.parse(OVERSIZED_QUERY)
+
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): without limits", lambda: PARSER.parse(STRING_QUERY)),
+    ("QueryParser(limits=...).parse()", lambda: LIMITS_PARSER.parse(STRING_QUERY)),
+    ("QueryParser.parse(): oversized list", lambda: PARSER.parse(OVERSIZED_QUERY)),
+    ("QueryParser(limits=...).parse(): oversized list rejected", reject_oversized),
+    ("estimate_cost()", lambda: estimate_cost(MONGODB_QUERY)),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
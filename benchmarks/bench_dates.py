@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Date casting, run it with and without the `dateparser` extra."""
+
+from __future__ import annotations
+
+from functools import partial
+
+from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+try:
+    import dateparser  # noqa: F401
+
+    DATEPARSER = "with dateparser"
+except ModuleNotFoundError:
+    DATEPARSER = "without dateparser"
+
+MONGODB_QUERIES_MGR = MongoDBQueriesManager()
+
+BENCHMARKS: list[Benchmark] = [
+    (f"cast_value_logic(): {value!r} ({DATEPARSER})", partial(MONGODB_QUERIES_MGR.cast_value_logic, value))
+    for value in ("2016-01-01", "2016-01-01T10:00:00", "2022-10-29T12:42:07.092062+00:00", "2016-01", "2022-10-29 ")
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, number=500)
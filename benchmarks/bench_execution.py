@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Execution options overhead, fixed by parser or scaled from the estimated cost of the query."""
+
+from __future__ import annotations
+
+from mongo_queries_manager import ExecutionOptions, QueryParser
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = "status=sent,received&price>5&name=/^jo/&sort=-created_at&skip=40&limit=20"
+
+PARSER = QueryParser()
+FIXED_PARSER = QueryParser(execution=ExecutionOptions(max_time_ms=500, batch_size=100, allow_disk_use=False))
+SCALED_PARSER = QueryParser(execution=ExecutionOptions(max_time_ms=500, time_per_cost=10, batch_size=100))
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): without execution options", lambda: PARSER.parse(STRING_QUERY)),
+    ("QueryParser(execution=...).parse(): fixed", lambda: FIXED_PARSER.parse(STRING_QUERY)),
+    ("QueryParser(execution=...).parse(): scaled from cost", lambda: SCALED_PARSER.parse(STRING_QUERY)),
+    (
+        "QueryParser(execution=...).parse_query().to_find_kwargs()",
+        lambda: FIXED_PARSER.parse_query(STRING_QUERY).to_find_kwargs(),
+    ),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
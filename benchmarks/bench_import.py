@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Package import time (cold start), measured with `python -X importtime` and checked against a budget.
+
+Run it with `python -m benchmarks.bench_import [budget_ms]`, exit with status 1 when the budget is exceeded.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+
+PACKAGE = "mongo_queries_manager"
+
+# Cumulative import time budget of the package, in milliseconds.
+BUDGET_MS = 30.0
+
+
+def import_time(package: str = PACKAGE, repeat: int = 5) -> float:
+    """Measure the best cumulative import time of a package, each import in a fresh interpreter.
+
+    Notes:
+        Bytecode is cached (into a temporary directory) as for an installed package, whatever
+        `PYTHONDONTWRITEBYTECODE`, the first import compiles the modules.
+
+    Args:
+        package (str): Package name.
+        repeat (int): Number of fresh interpreters.
+
+    Returns:
+        float: Best cumulative import time in milliseconds.
+    """
+    timings = []
+    with tempfile.TemporaryDirectory() as pycache_prefix:
+        env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+        env["PYTHONPYCACHEPREFIX"] = pycache_prefix
+        for _ in range(repeat):
+            stderr = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {package}"],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+            ).stderr
+            for line in stderr.splitlines():
+                # 'import time: self [us] | cumulative | imported package'
+                _, cumulative, name = line.split("|")
+                if name.strip() == package:
+                    timings.append(int(cumulative) / 1000)
+    return min(timings)
+
+
+def imported_modules(package: str = PACKAGE) -> set[str]:
+    """List the modules imported by a package in a fresh interpreter.
+
+    Args:
+        package (str): Package name.
+
+    Returns:
+        Set[str]: Top level names of the imported modules.
+    """
+    stdout = subprocess.run(
+        [sys.executable, "-c", f"import sys, {package}; print(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return {module.partition(".")[0] for module in stdout.split()}
+
+
+if __name__ == "__main__":
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else BUDGET_MS
+    elapsed_ms = import_time()
+    print(f"{'import ' + PACKAGE:<72} {elapsed_ms:>10.2f} ms (budget {budget_ms:.2f} ms)")
+    if "dateparser" in imported_modules():
+        sys.exit("dateparser is imported with the package, it must be imported on first use")
+    if elapsed_ms > budget_ms:
+        sys.exit(f"Import time over budget: {elapsed_ms:.2f} ms > {budget_ms:.2f} ms")
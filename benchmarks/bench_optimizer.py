@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Filter optimizer overhead, with repeated range predicates and an impossible range."""
+
+from __future__ import annotations
+
+from mongo_queries_manager import QueryParser, optimize_filter
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = "status=sent&price>5&price>=7&price<100&country=US,GB&!deleted&sort=-created_at&limit=20"
+EMPTY_QUERY = "status=sent&price>100&price<5&limit=20"
+
+PARSER = QueryParser()
+# Scalar fields, contradictions are only detected on them.
+SCHEMA = {"status": str, "price": float, "country": str}
+OPTIMIZER_PARSER = QueryParser(optimize=True, schema=SCHEMA)
+MONGODB_FILTER = {"status": "sent", "price": {"$gte": 7.0, "$lt": 100.0}, "country": {"$in": ["US"]}}
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): without optimizer", lambda: PARSER.parse(STRING_QUERY)),
+    ("QueryParser(optimize=True).parse()", lambda: OPTIMIZER_PARSER.parse(STRING_QUERY)),
+    ("QueryParser(optimize=True).parse(): empty", lambda: OPTIMIZER_PARSER.parse(EMPTY_QUERY)),
+    ("optimize_filter()", lambda: optimize_filter(MONGODB_FILTER, SCHEMA)),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
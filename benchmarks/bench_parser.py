@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Per-call overhead of `mqm()` against a reused `QueryParser` and the 1.0.1 `mqm()` (see `benchmarks.legacy`)."""
+
+from __future__ import annotations
+
+from mongo_queries_manager import QueryParser, mqm
+
+from benchmarks.legacy import legacy_mqm
+from benchmarks.utils import Benchmark, run_benchmarks
+
+SMALL_QUERY = "status=sent&limit=10"
+STRING_QUERY = "status=sent&price>=5.6&country=GB,US&limit=100&skip=50&sort=-timestamp&fields=-_id,-created_at"
+BLACKLIST = ["latitude", "longitude", "token", "where", "callback"]
+CASTERS = {"string": str, "integer": int, "decimal": float, "upper": str.upper, "lower": str.lower}
+
+PARSER = QueryParser(blacklist=BLACKLIST, casters=CASTERS)
+
+BENCHMARKS: list[Benchmark] = [
+    ("1.0.1 mqm(): config built per call", lambda: legacy_mqm(STRING_QUERY, blacklist=BLACKLIST, casters=CASTERS)),
+    ("mqm(): parser reused per config", lambda: mqm(STRING_QUERY, blacklist=BLACKLIST, casters=CASTERS)),
+    ("QueryParser.parse(): config built once", lambda: PARSER.parse(STRING_QUERY)),
+    ("1.0.1 mqm(): small query", lambda: legacy_mqm(SMALL_QUERY, blacklist=BLACKLIST, casters=CASTERS)),
+    ("mqm(): small query", lambda: mqm(SMALL_QUERY, blacklist=BLACKLIST, casters=CASTERS)),
+    ("QueryParser.parse(): small query", lambda: PARSER.parse(SMALL_QUERY)),
+    ("1.0.1 mqm(): empty query", lambda: legacy_mqm("", blacklist=BLACKLIST, casters=CASTERS)),
+    ("mqm(): empty query", lambda: mqm("", blacklist=BLACKLIST, casters=CASTERS)),
+    ("QueryParser.parse(): empty query", lambda: PARSER.parse("")),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
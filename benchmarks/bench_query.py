@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""`MongoQuery` results: lazy projection / population when counting, hashing and fingerprints as cache keys."""
+
+from __future__ import annotations
+
+from mongo_queries_manager import QueryParser, canonicalize, fingerprint, shape_hash
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = (
+    "status=sent&price>=5.6&limit=20&sort=-created_at&populate=author,author.company,tags&"
+    "fields=title,author.name,author.company.name,tags.label"
+)
+
+PARSER = QueryParser(populate=True)
+QUERY = PARSER.parse_query(STRING_QUERY)
+MONGODB_QUERY = PARSER.parse(STRING_QUERY)
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): dict", lambda: PARSER.parse(STRING_QUERY)),
+    ("QueryParser.parse_query(): find kwargs", lambda: PARSER.parse_query(STRING_QUERY).to_find_kwargs()),
+    ("QueryParser.parse_query(): count kwargs (lazy)", lambda: PARSER.parse_query(STRING_QUERY).to_count_kwargs()),
+    ("QueryParser.parse_query(): hash", lambda: hash(PARSER.parse_query(STRING_QUERY))),
+    ("MongoQuery hash", lambda: hash(QUERY)),
+    ("canonicalize()", lambda: canonicalize(MONGODB_QUERY)),
+    ("fingerprint()", lambda: fingerprint(MONGODB_QUERY)),
+    ("shape_hash()", lambda: shape_hash(MONGODB_QUERY)),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
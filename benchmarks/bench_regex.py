@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Regex values: output formats (compiled or not), guard overhead and rewrite of prefix / exact match filters."""
+
+from __future__ import annotations
+
+from mongo_queries_manager import QueryParser
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+STRING_QUERY = r"name=/^john.*doe/&email=/^john@x\.com$/i&city=/par/&price>5&limit=20"
+
+PARSER = QueryParser()
+REWRITE_PARSER = QueryParser(rewrite_regex=True, collation={"locale": "en", "strength": 2})
+OUTPUT_PARSERS = {
+    regex_output: QueryParser(regex_output=regex_output) for regex_output in ("python", "bson", "operator")
+}
+GUARD_PARSER = QueryParser(regex_output="bson", regex_max_length=256, regex_guard=True)
+
+BENCHMARKS: list[Benchmark] = [
+    ("QueryParser.parse(): legacy output", lambda: PARSER.parse(STRING_QUERY)),
+    *(
+        (f"QueryParser(regex_output={regex_output!r}).parse()", lambda parser=parser: parser.parse(STRING_QUERY))
+        for regex_output, parser in OUTPUT_PARSERS.items()
+    ),
+    ("QueryParser(regex_guard=True).parse(): bson output", lambda: GUARD_PARSER.parse(STRING_QUERY)),
+    ("QueryParser(rewrite_regex=True).parse()", lambda: REWRITE_PARSER.parse(STRING_QUERY)),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
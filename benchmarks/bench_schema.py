@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Schema typing against value type guessing and custom casters."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+
+from bson import Decimal128, ObjectId
+from mongo_queries_manager import QueryParser
+from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+SCHEMA = {"_id": ObjectId, "zip": str, "price": Decimal128, "created": datetime, "country": str, "status": str}
+
+# Same filters, typed by guessing / custom casters / schema.
+INFERRED_QUERY = "zip=75001&price>=5.6&created>2016-01-01T10:00:00&country=GB,US,FR&status=sent"
+CASTERS_QUERY = (
+    "_id=oid(5f3f7d3b9c6f1d2b3c4d5e6f)&zip=string(75001)&price>=decimal(5.6)&created>2016-01-01T10:00:00&"
+    "country=GB,US,FR&status=sent"
+)
+SCHEMA_QUERY = (
+    "_id=5f3f7d3b9c6f1d2b3c4d5e6f&zip=75001&price>=5.6&created>2016-01-01T10:00:00&country=GB,US,FR&status=sent"
+)
+
+MONGODB_QUERIES_MGR = MongoDBQueriesManager()
+
+# Cast of a single value, guessed by the type regex or cast with the schema caster.
+VALUES = {"str": ("75001", str), "float": ("5.6", float), "date": ("2016-01-01T10:00:00", datetime.fromisoformat)}
+
+BENCHMARKS: list[Benchmark] = [
+    *(
+        (
+            f"filter_item_logic(): {name}, {mode}",
+            partial(MONGODB_QUERIES_MGR.filter_item_logic, "key", "=", value, cast),
+        )
+        for name, (value, schema_cast) in VALUES.items()
+        for mode, cast in (("guessed", None), ("schema", schema_cast))
+    ),
+    ("QueryParser.parse(): type guessing", partial(QueryParser().parse, INFERRED_QUERY)),
+    (
+        "QueryParser.parse(): custom casters",
+        partial(QueryParser(casters={"oid": ObjectId, "string": str, "decimal": Decimal128}).parse, CASTERS_QUERY),
+    ),
+    ("QueryParser.parse(): schema", partial(QueryParser(schema=SCHEMA).parse, SCHEMA_QUERY)),
+    (
+        "QueryParser.parse(): schema, reject unknown fields",
+        partial(QueryParser(schema=SCHEMA, unknown_fields="reject").parse, SCHEMA_QUERY),
+    ),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Parsing stages: filter, sort, projection and population (deep trees)."""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any
+
+from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
+
+from benchmarks.utils import Benchmark, run_benchmarks
+
+MONGODB_QUERIES_MGR = MongoDBQueriesManager()
+
+FILTERS = {
+    "$eq": "status=sent",
+    "$gte": "price>=5.6",
+    "$ne": "status!=draft",
+    "$in": "country=GB,US,FR",
+    "$nin": "country!=GB,US,FR",
+    "$exists": "!email",
+    "$eq regex": "author.firstName=/john/i",
+    "$gt date": "created_at>2016-01-01T10:00:00",
+}
+
+# Population trees, paths are sorted by level as done by the parser.
+POPULATIONS = {
+    "wide (8 paths)": [f"ref{index}" for index in range(8)],
+    "deep (6 levels)": ["a", "a.b", "a.b.c", "a.b.c.d", "a.b.c.d.e", "a.b.c.d.e.f"],
+    "tree (3 levels x 3 children)": sorted(
+        [f"p{a}" for a in range(3)]
+        + [f"p{a}.p{b}" for a in range(3) for b in range(3)]
+        + [f"p{a}.p{b}.p{c}" for a in range(3) for b in range(3) for c in range(3)],
+        key=lambda path: path.count("."),
+    ),
+}
+
+
+def build_population(paths: list[str]) -> dict[str, Any]:
+    """Build a population tree with `format_populate_value`.
+
+    Args:
+        paths (List[str]): Population paths, sorted by level.
+
+    Returns:
+        Dict[str, Any]: Mongodb query with the population tree.
+    """
+    mongodb_query: dict[str, Any] = {"population": []}
+    for path in paths:
+        MONGODB_QUERIES_MGR.format_populate_value(mongodb_query, population_value=path)
+    return mongodb_query
+
+
+DEEP_POPULATION = build_population(POPULATIONS["deep (6 levels)"])["population"]
+
+BENCHMARKS: list[Benchmark] = [
+    *((f"filter_logic(): {name}", partial(MONGODB_QUERIES_MGR.filter_logic, arg)) for name, arg in FILTERS.items()),
+    ("sort_logic(): 3 keys", partial(MONGODB_QUERIES_MGR.sort_logic, "sort=-created_at,_id,+price")),
+    ("projection_logic(): 3 fields", partial(MONGODB_QUERIES_MGR.projection_logic, "fields=id,url,-_id", None)),
+    (
+        "projection_logic(): json field",
+        partial(MONGODB_QUERIES_MGR.projection_logic, 'fields={"tags":{"$slice":5}}', None),
+    ),
+    (
+        "projection_logic(): deep population field",
+        partial(MONGODB_QUERIES_MGR.projection_logic, "fields=a.b.c.d.e.f.name,title", DEEP_POPULATION),
+    ),
+    *((f"format_populate_value(): {name}", partial(build_population, paths)) for name, paths in POPULATIONS.items()),
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Query string tokenization, for queries with 5, 50 and 500 arguments.
+
+The 1.0.1 path (`startswith` dispatch and `find_operator` of each argument, see `benchmarks.legacy`) is timed as
+reference.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+from mongo_queries_manager import QueryParser
+
+from benchmarks.legacy import legacy_mqm
+from benchmarks.utils import Benchmark, run_benchmarks
+
+ARGUMENTS = [
+    "status=sent",
+    "price>=5.6",
+    "price<100",
+    "country=GB,US",
+    "name=John",
+    "!deleted_at",
+    "rating!=3",
+    "sort=-created_at",
+    "limit=100",
+    "skip=50",
+]
+
+
+def build_string_query(size: int) -> str:
+    """Build a string query with `size` arguments, with unique filter keys.
+
+    Args:
+        size (int): Number of arguments.
+
+    Returns:
+        str: String query.
+    """
+    args = []
+    for index in range(size):
+        arg = ARGUMENTS[index % len(ARGUMENTS)]
+        args.append(arg if arg.startswith(("sort=", "limit=", "skip=")) else f"f{index}_{arg.lstrip('!')}")
+    return "&".join(args)
+
+
+PARSER = QueryParser(populate=True)
+
+BENCHMARKS: list[Benchmark] = [
+    benchmark
+    for size in (5, 50, 500)
+    for benchmark in (
+        (f"1.0.1 mqm(): {size} arguments", partial(legacy_mqm, build_string_query(size), populate=True)),
+        (f"QueryParser.parse(): {size} arguments", partial(PARSER.parse, build_string_query(size))),
+    )
+]
+
+if __name__ == "__main__":
+    run_benchmarks(BENCHMARKS, number=200)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Copy of the parsing path of the 1.0.1 release, the "before" of the benchmarks.
+
+The argument loop (`startswith` dispatch of each argument), `filter_logic` (`find_operator` then `split`) and
+`cast_value_logic` (scan of the typing table) are copied as released. Cursor modifiers, projection and population use
+the methods of `MongoDBQueriesManager`, unchanged since.
+"""
+
+from __future__ import annotations
+
+__all__ = ["LegacyMongoDBQueriesManager", "legacy_mqm"]
+
+import re
+from collections.abc import Callable
+from datetime import datetime
+from re import Pattern
+from typing import Any
+from urllib import parse
+
+from mongo_queries_manager.mongodb_queries_manager import (
+    CustomCasterFail,
+    FilterError,
+    ListOperatorError,
+    MongoDBQueriesManager,
+)
+
+try:
+    from dateparser import parse as dateparser_parse
+
+    def _date_parse(date: str) -> datetime | str:
+        """Cast string date into datetime using dateparse library (extra dep), not cached.
+
+        Args:
+            date (str): Date as string format.
+
+        Returns:
+            Union[datetime, str]: Cast value.
+        """
+        return dateparser_parse(date, languages=["fr", "en"]) or date
+
+except ModuleNotFoundError:
+
+    def _date_parse(date: str) -> datetime | str:
+        """Cast string date into datetime (only isoformat supported).
+
+        Args:
+            date (str): Date as string format.
+
+        Returns:
+            Union[datetime, str]: Cast value.
+        """
+        try:
+            return datetime.fromisoformat(date)
+        except (ValueError, TypeError):
+            return date
+
+
+class LegacyMongoDBQueriesManager(MongoDBQueriesManager):
+    """MongoDBQueriesManager with the 1.0.1 filter parsing and value casting."""
+
+    regex_dict: dict[str | Pattern[str], Any] = {
+        re.compile(r"^[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?$"): float,
+        re.compile(r"^[-+]?\d+$"): int,
+        re.compile(
+            r"^[12]\d{3}(-(0[1-9]|1[0-2])(-(0[1-9]|[12][0-9]|3[01]))?)(T|"
+            r" )?(([01][0-9]|2[0-3]):[0-5]\d(:[0-5]\d(\.\d+)?)?(Z|[+-]\d{2}:\d{2})?)?$"
+        ): _date_parse,
+        re.compile(r"^[A-Za-z ]+(?=(,?,))(?:\1[A-Za-z ]+)+$"): lambda list_value: list_value.split(","),
+        re.compile(
+            r"\/((?![*+?])(?:[^\r\n\[/\\]|\\.|\[(?:[^\r\n\]\\]|\\.)*\])+)"
+            r"\/((?:g(?:im?|mi?)?|i(?:gm?|mg?)?|m(?:gi?|ig?)?)?)"
+        ): re.compile,
+        "true": lambda boolean: True,
+        "false": lambda boolean: False,
+        "null": lambda null: None,
+        "none": lambda none: None,
+    }
+
+    def __init__(self, casters: dict[str, Callable[[Any], Any]] | None = None) -> None:  # noqa: D107
+        self.custom_cast_dict = casters
+
+    def filter_logic(self, filter_params: str) -> dict[str, Any]:
+        """Build filter.
+
+        Args:
+            filter_params (str): Filter params from url query (ie, 'name=John')
+
+        Returns:
+            Dict[str, Any]: Dictionary with MongoDB filter
+        """
+        operator = self.find_operator(filter_params=filter_params)
+
+        if operator != "":
+            try:
+                key, value = filter_params.split(operator)
+            except ValueError as err:
+                raise FilterError(f"Fail to split filter {filter_params} with operator {operator}") from err
+        else:
+            key, value = "", filter_params
+
+        value = self.cast_value_logic(value)
+
+        # $eq logic
+        if operator == "=" and not isinstance(value, list):
+            return {key: value}
+
+        # $in, $nin, $exists logic
+        if isinstance(value, list):
+            # Cast list items
+            casted_list_item = [self.cast_value_logic(item) for item in value]
+
+            if operator == "=":
+                return {key: {"$in": casted_list_item}}
+            if operator == "!=":
+                return {key: {"$nin": casted_list_item}}
+            raise ListOperatorError("List operator not found")
+
+        # $exists logic
+        if operator in ["", "!"]:
+            return {value: {self.mongodb_operator[operator]: operator == ""}}
+
+        # $gt, $gte, $lt, $lte, $ne, logic
+        return {key: {self.mongodb_operator[operator]: value}}
+
+    def cast_value_logic(self, value: str) -> Any:
+        """Cast value into right type.
+
+        Args:
+            value (str): Value to cast
+
+        Returns:
+            Any: Cast value
+        """
+        if self.custom_cast_dict is not None:
+            for rule, func in self.custom_cast_dict.items():
+                if value.startswith(f"{rule}(") and value.endswith(")"):
+                    try:
+                        casted_value = func(value.replace(f"{rule}(", "")[:-1])
+                    except Exception as err:
+                        raise CustomCasterFail(f"Fail to cast {value} with caster {rule}") from err
+
+                    return casted_value
+
+        for regex, cast in self.regex_dict.items():
+            if isinstance(regex, Pattern):
+                if regex.match(value):
+                    return cast(value)
+            elif regex == value.lower():
+                return cast(value)
+        return value
+
+    @staticmethod
+    def find_operator(filter_params: str) -> str:
+        """Return the right operator.
+
+        Args:
+            filter_params (str): Filter params (ie, 'name=John')
+
+        Returns:
+            str: Return operator
+        """
+        for operator in ["<=", ">=", "!=", "=", ">", "<", "!"]:
+            if filter_params.find(operator) > -1:
+                return operator
+        return ""
+
+
+def _is_blacklisted_value(blacklist: list[str], arg: str) -> bool:
+    """Check if a value is blacklisted.
+
+    Args:
+        blacklist (List[str]): Filter on all keys except the ones specified.
+        arg (str): Argument to check.
+
+    Returns:
+        bool: True if the value is blacklisted, False otherwise.
+    """
+    return any(arg.startswith(f"{key}=") for key in blacklist)
+
+
+def _parse_query_operation(
+    mongodb_query: dict[str, Any], arg: str, mongodb_queries_mgr: MongoDBQueriesManager, populate: bool
+) -> dict[str, Any]:
+    """Parse query operation into mongodb query, dispatched with `startswith`.
+
+    Args:
+        mongodb_query (Dict[str, Any]): The actual mongodb query.
+        arg (str): Query operation argument to convert.
+        mongodb_queries_mgr (MongoDBQueriesManager): MongoDBQueriesManager object.
+        populate (bool): True if the query need to be populated, False otherwise.
+
+    Returns:
+        Dict[str, Any]: The updated mongodb query.
+    """
+    if arg.startswith("populate="):
+        return mongodb_query
+    if arg.startswith("sort="):
+        mongodb_query["sort"] = mongodb_queries_mgr.sort_logic(sort_params=arg)
+    elif arg.startswith("limit="):
+        mongodb_query["limit"] = mongodb_queries_mgr.limit_logic(limit_param=arg)
+    elif arg.startswith("skip="):
+        mongodb_query["skip"] = mongodb_queries_mgr.skip_logic(skip_param=arg)
+    elif arg.startswith("fields="):
+        mongodb_query["projection"] = mongodb_queries_mgr.projection_logic(
+            projection_param=arg, population=mongodb_query["population"] if populate else None
+        )
+    elif arg.startswith("$text="):
+        mongodb_query["filter"] = {
+            **mongodb_query["filter"],
+            "$text": {"$search": mongodb_queries_mgr.text_operator_logic(text_param=arg)},
+        }
+    elif arg != "":
+        for key, sub_filter in mongodb_queries_mgr.filter_logic(filter_params=arg).items():
+            if key not in mongodb_query["filter"]:
+                mongodb_query["filter"][key] = sub_filter
+                continue
+
+            mongodb_query["filter"][key] = {
+                **mongodb_query["filter"][key],
+                **sub_filter,
+            }
+
+    return mongodb_query
+
+
+def legacy_mqm(
+    string_query: str,
+    blacklist: list[str] | None = None,
+    casters: dict[str, Callable[[Any], Any]] | None = None,
+    populate: bool = False,
+) -> dict[str, Any]:
+    """Convert a string query into a MongoDB query dict, as `mqm()` of the 1.0.1 release.
+
+    Args:
+        string_query (str): A query string of the requested API URL.
+        blacklist (Optional[List[str]]): Filter on all keys except the ones specified.
+        casters (Optional[Dict[str, Callable]]): Custom caster dict, used to define custom type.
+        populate (bool): Add population into returned query (Manual implementation).
+
+    Returns:
+        Dict[str, Any]: Return a mongodb query in dict format.
+    """
+    args: list[str] = list(parse.unquote(string_query).split("&"))
+    mongodb_queries_mgr = LegacyMongoDBQueriesManager(casters=casters)
+    mongodb_query: dict[str, Any] = {
+        "filter": {},
+        "sort": None,
+        "skip": 0,
+        "limit": 0,
+        "projection": None,
+    }
+
+    if populate:
+        mongodb_query["population"] = []
+
+        populates_values: list[str] = []
+        for arg in args:
+            if arg.startswith("populate=") and arg != "populate=":
+                populates_values = (
+                    arg.split("=")[1].split(",") if arg.split("=")[1].find(",") > 0 else [arg.split("=")[1]]
+                )
+
+        for populate_value in sorted(populates_values, key=lambda value: value.count(".")):
+            mongodb_queries_mgr.format_populate_value(mongodb_query, population_value=populate_value)
+
+    for arg in args:
+        # Skip blacklisted value
+        if blacklist and _is_blacklisted_value(blacklist, arg):
+            continue
+
+        mongodb_query = _parse_query_operation(
+            mongodb_query=mongodb_query, arg=arg, mongodb_queries_mgr=mongodb_queries_mgr, populate=populate
+        )
+
+    return mongodb_query
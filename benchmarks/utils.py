@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Benchmarks utils functions."""
+
+from __future__ import annotations
+
+__all__ = ["Benchmark", "compare_results", "measure_stats", "run_benchmarks"]
+
+import math
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+Benchmark = tuple[str, Callable[[], object]]
+
+
+def measure(func: Callable[[], object], number: int, repeat: int) -> float:
+    """Measure the best time per call of a function.
+
+    Args:
+        func (Callable): Function to measure.
+        number (int): Number of calls per repetition.
+        repeat (int): Number of repetitions.
+
+    Returns:
+        float: Best time per call in seconds.
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def percentile(samples: list[float], rank: float) -> float:
+    """Nearest rank percentile of sorted samples.
+
+    Args:
+        samples (List[float]): Sorted samples.
+        rank (float): Percentile rank, between 0 and 100.
+
+    Returns:
+        float: Percentile value.
+    """
+    index = max(0, math.ceil(rank / 100 * len(samples)) - 1)
+    return samples[index]
+
+
+def measure_stats(
+    func: Callable[[], object], number: int | None = None, repeat: int = 20, max_time: float = 2.0
+) -> dict[str, Any]:
+    """Measure the time per call of a function, with percentiles over the repetitions.
+
+    Args:
+        func (Callable): Function to measure.
+        number (Optional[int]): Number of calls per repetition, None to calibrate it (~0.02s per repetition).
+        repeat (int): Number of repetitions (samples).
+        max_time (float): With a calibrated number, repetitions are reduced (down to 5) to run in about max_time.
+
+    Returns:
+        Dict[str, Any]: Times per call in microseconds (min / mean / p50 / p90 / p99) and ops/s (from p50).
+    """
+    timer = timeit.Timer(func)
+    if number is None:
+        number, elapsed = timer.autorange()
+        per_call = elapsed / number
+        number = max(1, number // 10)
+        repeat = min(repeat, max(5, int(max_time / (per_call * number))))
+    samples = sorted(sample / number * 1e6 for sample in timer.repeat(number=number, repeat=repeat))
+    p50_us = percentile(samples, 50)
+    return {
+        "ops_per_sec": 1e6 / p50_us,
+        "min_us": samples[0],
+        "mean_us": sum(samples) / len(samples),
+        "p50_us": p50_us,
+        "p90_us": percentile(samples, 90),
+        "p99_us": percentile(samples, 99),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def compare_results(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float = 0.1
+) -> list[str]:
+    """Compare benchmarks results with a baseline, on the median time per call.
+
+    Args:
+        results (Dict[str, Dict[str, Any]]): Benchmarks results by name.
+        baseline (Dict[str, Dict[str, Any]]): Baseline benchmarks results by name.
+        threshold (float): Allowed slowdown ratio (ie, 0.1 for 10%).
+
+    Returns:
+        List[str]: Names of the regressed benchmarks.
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        ratio = stats["p50_us"] / baseline[name]["p50_us"]
+        status = "REGRESSION" if ratio > 1 + threshold else "ok"
+        print(f"{name:<86} {baseline[name]['p50_us']:>10.2f} -> {stats['p50_us']:>10.2f} us ({ratio:>5.2f}x) {status}")
+        if status != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def run_benchmarks(benchmarks: list[Benchmark], number: int = 2000, repeat: int = 5) -> None:
+    """Run and print a list of benchmarks.
+
+    Args:
+        benchmarks (List[Benchmark]): Benchmark names and functions.
+        number (int): Number of calls per repetition.
+        repeat (int): Number of repetitions.
+    """
+    for name, func in benchmarks:
+        per_call = measure(func, number=number, repeat=repeat)
+        print(f"{name:<72} {per_call * 1e6:>10.2f} us/call {1 / per_call:>12.0f} ops/s")
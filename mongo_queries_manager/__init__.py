@@ -6,10 +6,14 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
-from urllib import parse
-
-from mongo_queries_manager.helpers import is_blacklisted_value, parse_query_operation
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from mongo_queries_manager.cache import DocumentCache, MemoryDocumentCache, QueryCache
+from mongo_queries_manager.canonical import canonicalize, fingerprint, shape_hash
+from mongo_queries_manager.compiler import CompiledParser
+from mongo_queries_manager.cost import QueryLimits, estimate_cost
+from mongo_queries_manager.execution import ExecutionOptions
 from mongo_queries_manager.mongodb_queries_manager import (
     CustomCasterFail,
     FilterError,
@@ -17,17 +21,61 @@ from mongo_queries_manager.mongodb_queries_manager import (
     ListOperatorError,
     LogicalPopulationError,
     LogicalSubPopulationError,
-    MongoDBQueriesManager,
     MongoDBQueriesManagerBaseError,
+    PaginationError,
     ProjectionError,
+    PureCaster,
+    QueryLimitError,
+    RegexError,
+    SchemaError,
     SkipError,
     TextOperatorError,
 )
+from mongo_queries_manager.optimizer import OptimizedFilter, optimize_filter
+from mongo_queries_manager.pagination import encode_page_token
+from mongo_queries_manager.pipeline import to_pipeline
+from mongo_queries_manager.population import (
+    find_populated,
+    find_populated_async,
+    populate_documents,
+    populate_documents_async,
+)
+from mongo_queries_manager.query import MongoQuery
+from mongo_queries_manager.query_parser import BatchResult, QueryParser
+from mongo_queries_manager.regex import RegexRewrite, rewrite_regex
+
+if TYPE_CHECKING:
+    from mongo_queries_manager.loader import PopulationLoader
 
 __version__ = "1.0.1"
 
 __all__ = [
     "mqm",
+    "QueryParser",
+    "BatchResult",
+    "MongoQuery",
+    "CompiledParser",
+    "QueryCache",
+    "PureCaster",
+    "encode_page_token",
+    "to_pipeline",
+    "canonicalize",
+    "fingerprint",
+    "shape_hash",
+    "optimize_filter",
+    "OptimizedFilter",
+    "rewrite_regex",
+    "RegexRewrite",
+    "QueryLimits",
+    "estimate_cost",
+    "ExecutionOptions",
+    "find_populated",
+    "populate_documents",
+    "find_populated_async",
+    "populate_documents_async",
+    "PopulationLoader",
+    "DocumentCache",
+    "MemoryDocumentCache",
     "MongoDBQueriesManagerBaseError",
     "SkipError",
     "LimitError",
@@ -38,19 +86,53 @@ __all__ = [
     "ProjectionError",
     "LogicalPopulationError",
     "LogicalSubPopulationError",
+    "PaginationError",
+    "SchemaError",
+    "RegexError",
+    "QueryLimitError",
 ]
 
 
-def _sort_population(populate: str) -> int:
-    """Used to sort population list by level (.) into populate value.
+def __getattr__(name: str) -> Any:
+    """Import the `PopulationLoader` on first use, it imports asyncio (cold start of the sync API).
+
+    Args:
+        name (str): Attribute name.
+
+    Returns:
+        Any: Attribute value.
+    """
+    if name == "PopulationLoader":
+        from mongo_queries_manager.loader import PopulationLoader  # noqa: PLC0415
+
+        return PopulationLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=32)
+def _config_parser(
+    blacklist: tuple[str, ...] | None,
+    casters: tuple[tuple[str, Callable[[Any], Any]], ...] | None,
+    populate: bool,
+    cache: QueryCache | None,
+) -> QueryParser:
+    """Build the parser of a `mqm()` configuration, reused by the next calls with the same one.
 
     Args:
-        populate (str): Populate value.
+        blacklist (Optional[Tuple[str, ...]]): Filter on all keys except the ones specified.
+        casters (Optional[Tuple[Tuple[str, Callable], ...]]): Custom casters, as dict items.
+        populate (bool): Add population into returned query (Manual implementation).
+        cache (Optional[QueryCache]): Cache of parsed queries.
 
     Returns:
-        int: Return the number of . (level) into populate value.
+        QueryParser: Configured parser.
     """
-    return populate.count(".")
+    return QueryParser(
+        blacklist=None if blacklist is None else list(blacklist),
+        casters=None if casters is None else dict(casters),
+        populate=populate,
+        cache=cache,
+    )
 
 
 def mqm(
@@ -58,48 +140,32 @@ def mqm(
     blacklist: list[str] | None = None,
     casters: dict[str, Callable[[Any], Any]] | None = None,
     populate: bool = False,
+    cache: QueryCache | None = None,
 ) -> dict[str, Any]:
     """This method convert a string query into a MongoDB query dict.
 
+    Notes:
+        The parsers of the last 32 configurations are reused (configurations with unhashable casters are rebuilt on
+        every call), use a `QueryParser` to parse many queries with the same one.
+
     Args:
         string_query (str): A query string of the requested API URL.
         blacklist (Optional[List[str]]): Filter on all keys except the ones specified.
         populate (bool): Add population into returned query (Manual implementation).
         casters (Optional[Dict[str, Callable]]): Custom caster dict, used to define custom type.
+        cache (Optional[QueryCache]): Cache of parsed queries.
 
     Returns:
         Dict[str, Any]: Return a mongodb query in dict format.
     """
-    args: list[str] = list(parse.unquote(string_query).split("&"))
-    mongodb_queries_mgr: MongoDBQueriesManager = MongoDBQueriesManager(casters=casters)
-    mongodb_query: dict[str, Any] = {
-        "filter": {},
-        "sort": None,
-        "skip": 0,
-        "limit": 0,
-        "projection": None,
-    }
-
-    if populate:
-        mongodb_query["population"] = []
-
-        populates_values = []
-        for arg in args:
-            if arg.startswith("populate=") and arg != "populate=":
-                populates_values = (
-                    arg.split("=")[1].split(",") if arg.split("=")[1].find(",") > 0 else [arg.split("=")[1]]
-                )
-
-        for populate_value in sorted(populates_values, key=_sort_population):
-            mongodb_queries_mgr.format_populate_value(mongodb_query, population_value=populate_value)
-
-    for arg in args:
-        # Skip blacklisted value
-        if blacklist and is_blacklisted_value(blacklist, arg):
-            continue
-
-        mongodb_query = parse_query_operation(
-            mongodb_query=mongodb_query, arg=arg, mongodb_queries_mgr=mongodb_queries_mgr, populate=populate
+    try:
+        parser = _config_parser(
+            None if blacklist is None else tuple(blacklist),
+            None if casters is None else tuple(casters.items()),
+            populate,
+            cache,
         )
-
-    return mongodb_query
+    except TypeError:
+        # Unhashable caster.
+        parser = QueryParser(blacklist=blacklist, casters=casters, populate=populate, cache=cache)
+    return parser.parse(string_query)
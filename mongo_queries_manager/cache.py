@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Cache module.
+
+This module contain a bounded LRU cache of parsed queries, and the cache of populated documents (TTL + LRU).
+"""
+
+from __future__ import annotations
+
+__all__ = ["DocumentCache", "MemoryDocumentCache", "QueryCache"]
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from threading import Lock
+from typing import Any
+
+
+def _copy_query(value: Any) -> Any:
+    """Copy the structure (dict / list) of a parsed query or a document, leaf values are shared.
+
+    Args:
+        value (Any): Parsed query / document or one of its values.
+
+    Returns:
+        Any: Structural copy of the value.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_query(sub_value) for key, sub_value in value.items()}
+    if isinstance(value, list):
+        return [_copy_query(item) for item in value]
+    return value
+
+
+class QueryCache:
+    """QueryCache class.
+
+    A size bounded LRU cache of parsed queries, shareable between parsers (the parser configuration is part of the
+    key). Results are copied in and out of the cache, so callers can mutate them.
+
+    Attributes:
+        maxsize (int): Maximum number of cached queries.
+        hits (int): Number of cache hits.
+        misses (int): Number of cache misses.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize QueryCache class.
+
+        Args:
+            maxsize (int): Maximum number of cached queries.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._queries: OrderedDict[Hashable, dict[str, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached queries."""
+        return len(self._queries)
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        """Get a copy of a cached query.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: Copy of the cached query, None if not cached.
+        """
+        with self._lock:
+            mongodb_query = self._queries.get(key)
+            if mongodb_query is None:
+                self.misses += 1
+                return None
+
+            self._queries.move_to_end(key)
+            self.hits += 1
+
+        copied_query: dict[str, Any] = _copy_query(mongodb_query)
+        return copied_query
+
+    def put(self, key: Hashable, mongodb_query: dict[str, Any]) -> None:
+        """Cache a copy of a query, evict the least recently used query if the cache is full.
+
+        Args:
+            key (Hashable): Cache key.
+            mongodb_query (Dict[str, Any]): Parsed query.
+        """
+        mongodb_query = _copy_query(mongodb_query)
+        with self._lock:
+            self._queries[key] = mongodb_query
+            self._queries.move_to_end(key)
+            if len(self._queries) > self.maxsize:
+                self._queries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached queries and reset counters."""
+        with self._lock:
+            self._queries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class DocumentCache(ABC):
+    """DocumentCache interface, cache of the populated documents.
+
+    A document is cached by collection name, id and projection (ie, a Redis hash per collection and id, with a field
+    per projection), the population executors only query the missing documents.
+    """
+
+    @abstractmethod
+    def get_many(self, collection: str, ids: list[Any], projection: str) -> dict[Any, dict[str, Any]]:
+        """Get copies of cached documents.
+
+        Args:
+            collection (str): Collection name.
+            ids (List[Any]): Documents ids.
+            projection (str): Projection key of the documents.
+
+        Returns:
+            Dict[Any, Dict[str, Any]]: Cached documents by id (missing and expired ones are omitted).
+        """
+
+    @abstractmethod
+    def set_many(self, collection: str, documents: dict[Any, dict[str, Any]], projection: str) -> None:
+        """Cache copies of documents.
+
+        Args:
+            collection (str): Collection name.
+            documents (Dict[Any, Dict[str, Any]]): Documents by id.
+            projection (str): Projection key of the documents.
+        """
+
+    @abstractmethod
+    def invalidate(self, collection: str, ids: Iterable[Any]) -> None:
+        """Remove cached documents (all their projections), ie, after an update.
+
+        Args:
+            collection (str): Collection name.
+            ids (Iterable[Any]): Documents ids.
+        """
+
+    @abstractmethod
+    def clear(self, collection: str | None = None) -> None:
+        """Remove all cached documents of a collection.
+
+        Args:
+            collection (Optional[str]): Collection name, None for all collections.
+        """
+
+
+class MemoryDocumentCache(DocumentCache):
+    """MemoryDocumentCache class.
+
+    In-process DocumentCache backend, a size bounded LRU cache whose documents expire `ttl` seconds after caching.
+
+    Attributes:
+        maxsize (int): Maximum number of cached documents (one per projection).
+        ttl (float): Time to live of cached documents in seconds.
+        hits (int): Number of found documents.
+        misses (int): Number of missing or expired documents.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0) -> None:
+        """Initialize MemoryDocumentCache class.
+
+        Args:
+            maxsize (int): Maximum number of cached documents (one per projection).
+            ttl (float): Time to live of cached documents in seconds.
+        """
+        if maxsize <= 0 or ttl <= 0:
+            raise ValueError("Cache maxsize and ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # (collection, id, projection) -> (expiration time, document)
+        self._documents: OrderedDict[tuple[str, Any, str], tuple[float, dict[str, Any]]] = OrderedDict()
+        # (collection, id) -> projections, used by invalidation
+        self._projections: dict[tuple[str, Any], set[str]] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of cached documents."""
+        return len(self._documents)
+
+    def _remove(self, key: tuple[str, Any, str]) -> None:
+        """Remove a cached document (lock must be held).
+
+        Args:
+            key (Tuple[str, Any, str]): Collection, id and projection.
+        """
+        self._documents.pop(key, None)
+        projections = self._projections.get(key[:2])
+        if projections is not None:
+            projections.discard(key[2])
+            if not projections:
+                del self._projections[key[:2]]
+
+    def get_many(self, collection: str, ids: list[Any], projection: str) -> dict[Any, dict[str, Any]]:
+        """Get copies of cached documents.
+
+        Args:
+            collection (str): Collection name.
+            ids (List[Any]): Documents ids.
+            projection (str): Projection key of the documents.
+
+        Returns:
+            Dict[Any, Dict[str, Any]]: Cached documents by id (missing and expired ones are omitted).
+        """
+        now = time.monotonic()
+        documents = {}
+        with self._lock:
+            for document_id in ids:
+                key = (collection, document_id, projection)
+                cached = self._documents.get(key)
+                if cached is None or cached[0] <= now:
+                    if cached is not None:
+                        self._remove(key)
+                    self.misses += 1
+                    continue
+
+                self._documents.move_to_end(key)
+                self.hits += 1
+                documents[document_id] = cached[1]
+
+        return {document_id: _copy_query(document) for document_id, document in documents.items()}
+
+    def set_many(self, collection: str, documents: dict[Any, dict[str, Any]], projection: str) -> None:
+        """Cache copies of documents, evict the least recently used documents if the cache is full.
+
+        Args:
+            collection (str): Collection name.
+            documents (Dict[Any, Dict[str, Any]]): Documents by id.
+            projection (str): Projection key of the documents.
+        """
+        expiration = time.monotonic() + self.ttl
+        copied_documents = {document_id: _copy_query(document) for document_id, document in documents.items()}
+        with self._lock:
+            for document_id, document in copied_documents.items():
+                key = (collection, document_id, projection)
+                self._documents[key] = (expiration, document)
+                self._documents.move_to_end(key)
+                self._projections.setdefault((collection, document_id), set()).add(projection)
+
+            while len(self._documents) > self.maxsize:
+                self._remove(next(iter(self._documents)))
+
+    def invalidate(self, collection: str, ids: Iterable[Any]) -> None:
+        """Remove cached documents (all their projections), ie, after an update.
+
+        Args:
+            collection (str): Collection name.
+            ids (Iterable[Any]): Documents ids.
+        """
+        with self._lock:
+            for document_id in ids:
+                for projection in list(self._projections.get((collection, document_id), ())):
+                    self._remove((collection, document_id, projection))
+
+    def clear(self, collection: str | None = None) -> None:
+        """Remove all cached documents of a collection.
+
+        Args:
+            collection (Optional[str]): Collection name, None for all collections (and reset counters).
+        """
+        with self._lock:
+            if collection is None:
+                self._documents.clear()
+                self._projections.clear()
+                self.hits = 0
+                self.misses = 0
+                return
+
+            for key in [key for key in self._documents if key[0] == collection]:
+                self._remove(key)
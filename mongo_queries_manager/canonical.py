@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Canonical query module.
+
+This module contain the canonical form of a parsed query (equivalent queries have the same canonical form), its
+fingerprint and the fingerprint of its shape (without literal values).
+"""
+
+from __future__ import annotations
+
+__all__ = ["canonicalize", "fingerprint", "shape_hash"]
+
+from collections.abc import Mapping
+from contextlib import suppress
+from hashlib import blake2b
+from typing import Any
+
+from mongo_queries_manager.regex import is_regex
+
+# Logical operators, their sub filters order doesn't matter.
+_LOGICAL_OPERATORS = frozenset({"$and", "$or", "$nor"})
+
+# Operators of a values list, their values order and duplicates don't matter.
+_SET_OPERATORS = frozenset({"$in", "$nin", "$all"})
+
+# Placeholder of the literal values into a query shape, and of the regex (any output format) which are planned apart.
+_LITERAL = "?"
+_REGEX = {"$regex": _LITERAL}
+
+
+def _is_operator_dict(value: Any) -> bool:
+    """Check if a filter value is an operator dict (ie, {'$gt': 5}), not an embedded document.
+
+    Args:
+        value (Any): Filter value.
+
+    Returns:
+        bool: True if all the keys are operators.
+    """
+    return isinstance(value, dict) and bool(value) and all(str(key).startswith("$") for key in value)
+
+
+def _literal_shape(value: Any) -> Any:
+    """Placeholder of a literal value into a query shape, a regex (or a list with a regex) keeps its kind.
+
+    Args:
+        value (Any): Literal value (ie, 'sent', re.compile('/jo/') or ['GB', 'US']).
+
+    Returns:
+        Any: Placeholder (ie, '?', {'$regex': '?'} or [{'$regex': '?'}]).
+    """
+    if isinstance(value, list):
+        return [_REGEX] if any(is_regex(item) for item in value) else _LITERAL
+    return _REGEX if is_regex(value) else _LITERAL
+
+
+def _kind(value: Any) -> str:
+    """Kind of a value, numbers (int / float) are the same kind for MongoDB (ie, 1 and 1.0), not booleans.
+
+    Args:
+        value (Any): Value.
+
+    Returns:
+        str: Kind, 'number' or the type name.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return "number"
+    return type(value).__name__
+
+
+def _sorted_values(values: list[Any]) -> list[Any]:
+    """Sort and deduplicate the values of a set operator, by kind then value (or representation).
+
+    Args:
+        values (List[Any]): Values.
+
+    Returns:
+        List[Any]: Sorted unique values (the first of equal values is kept).
+    """
+    # Typed keys, True and 1 are different values for MongoDB. Unhashable values (ie, documents) are only sorted.
+    with suppress(TypeError):
+        values = list({(_kind(value), value): value for value in reversed(values)}.values())
+    try:
+        return sorted(values, key=lambda value: (_kind(value), value))
+    except TypeError:
+        return sorted(values, key=lambda value: (_kind(value), repr(value)))
+
+
+def _canonical_filter(mongodb_filter: dict[str, Any], shape: bool) -> dict[str, Any]:
+    """Canonical form of a filter, keys sorted.
+
+    Args:
+        mongodb_filter (Dict[str, Any]): MongoDB filter.
+        shape (bool): Replace the literal values by a placeholder.
+
+    Returns:
+        Dict[str, Any]: Canonical filter.
+    """
+    canonical_filter: dict[str, Any] = {}
+    for key in sorted(mongodb_filter):
+        value = mongodb_filter[key]
+        if key in _LOGICAL_OPERATORS and isinstance(value, list):
+            sub_filters = [_canonical_filter(sub_filter, shape) for sub_filter in value]
+            canonical_filter[key] = sorted(sub_filters, key=repr)
+        else:
+            canonical_filter[key] = _canonical_condition(value, shape)
+    return canonical_filter
+
+
+def _canonical_condition(value: Any, shape: bool) -> Any:
+    """Canonical form of the condition of a filter key, operators sorted.
+
+    Args:
+        value (Any): Filter value (ie, {'$in': ['US', 'GB']} or 'sent').
+        shape (bool): Replace the literal values by a placeholder.
+
+    Returns:
+        Any: Canonical condition.
+    """
+    if shape and is_regex(value):
+        return _REGEX
+    if not _is_operator_dict(value):
+        # Equality with a literal value (embedded documents are compared as is).
+        return _literal_shape(value) if shape else value
+
+    condition: dict[str, Any] = {}
+    for operator in sorted(value):
+        operand = value[operator]
+        if shape and operator != "$elemMatch" and not _is_operator_dict(operand):
+            # The '$regex' operator already keeps the regex kind.
+            condition[operator] = _LITERAL if operator == "$regex" else _literal_shape(operand)
+        elif operator in _SET_OPERATORS and isinstance(operand, list):
+            condition[operator] = _sorted_values(operand)
+        elif operator == "$elemMatch" and isinstance(operand, dict) and not _is_operator_dict(operand):
+            condition[operator] = _canonical_filter(operand, shape)
+        else:
+            condition[operator] = _canonical_condition(operand, shape)
+    return condition
+
+
+def _canonical_population(population: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Canonical form of a population, items sorted by path with canonical projection / sub population.
+
+    Args:
+        population (List[Dict[str, Any]]): Population.
+
+    Returns:
+        List[Dict[str, Any]]: Canonical population.
+    """
+    canonical_population = []
+    for item in sorted(population, key=lambda item: item["path"]):
+        canonical_item = dict(item)
+        if item.get("projection"):
+            canonical_item["projection"] = dict(sorted(item["projection"].items()))
+        if item.get("population"):
+            canonical_item["population"] = _canonical_population(item["population"])
+        canonical_population.append(canonical_item)
+    return canonical_population
+
+
+def _canonical_sort(sort: list[tuple[str, int]] | None) -> list[tuple[str, int]] | None:
+    """Normalized sort, (key, direction) tuples without repeated keys (the first direction is kept).
+
+    Args:
+        sort (Optional[List[Tuple[str, int]]]): Sort keys.
+
+    Returns:
+        Optional[List[Tuple[str, int]]]: Normalized sort keys, None without sort.
+    """
+    if not sort:
+        return None
+
+    directions: dict[str, int] = {}
+    for key, direction in sort:
+        directions.setdefault(key, int(direction))
+    return list(directions.items())
+
+
+def canonicalize(mongodb_query: Mapping[str, Any]) -> dict[str, Any]:
+    """Convert a parsed query into its canonical form, equivalent queries have the same canonical form.
+
+    Notes:
+        Filter keys and operators are sorted, `$in` / `$nin` / `$all` values are sorted and deduplicated, logical
+        sub filters are sorted. Sort keys order is kept (repeated keys removed), projection keys are sorted and
+        population items are sorted by path, collation keys are sorted. Leaf values are shared with the parsed query.
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Query from `mqm()` / `QueryParser.parse()` (or a `MongoQuery`).
+
+    Returns:
+        Dict[str, Any]: Canonical query.
+    """
+    canonical_query: dict[str, Any] = {
+        "filter": _canonical_filter(mongodb_query["filter"], shape=False),
+        "sort": _canonical_sort(mongodb_query["sort"]),
+        "skip": mongodb_query["skip"],
+        "limit": mongodb_query["limit"],
+        "projection": dict(sorted(mongodb_query["projection"].items())) if mongodb_query["projection"] else None,
+    }
+    if mongodb_query.get("collation"):
+        # String comparisons depend on the collation.
+        canonical_query["collation"] = dict(sorted(mongodb_query["collation"].items()))
+    if "population" in mongodb_query:
+        canonical_query["population"] = _canonical_population(mongodb_query["population"])
+    return canonical_query
+
+
+def _encode(value: Any) -> str:
+    """Type tagged encoding of a canonical value, numbers are encoded by value (ie, 1 and 1.0 are the same).
+
+    Notes:
+        Values which aren't a builtin are encoded with their type and representation (ie, `ObjectId`, `datetime`,
+        `re.Pattern`), a value with the default `object.__repr__` (its memory address) raises a `TypeError`.
+
+    Args:
+        value (Any): Canonical value.
+
+    Returns:
+        str: Encoded value.
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return repr(value)
+    if isinstance(value, (int, float)):
+        return f"number({int(value) if isinstance(value, float) and value.is_integer() else value!r})"
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_encode(item) for item in value)}]"
+    if isinstance(value, dict):
+        return f"{{{', '.join(f'{_encode(key)}: {_encode(item)}' for key, item in value.items())}}}"
+    representation = repr(value)
+    if representation == object.__repr__(value):
+        raise TypeError(f"Value of type {type(value).__qualname__} has no stable representation")
+    return f"{type(value).__module__}.{type(value).__qualname__}({representation})"
+
+
+def _digest(value: Any) -> str:
+    """Stable digest of a value encoding (the same across processes, unlike `hash`).
+
+    Args:
+        value (Any): Canonical value.
+
+    Returns:
+        str: Hexadecimal digest (32 characters).
+    """
+    return blake2b(_encode(value).encode(), digest_size=16).hexdigest()
+
+
+def fingerprint(mongodb_query: Mapping[str, Any]) -> str:
+    """Fingerprint of the canonical form of a parsed query, equivalent queries have the same fingerprint.
+
+    Notes:
+        Numbers are compared by value (ie, 'price=1' and 'price=1.0'). A value without a stable representation (an
+        object with the default `object.__repr__`, ie from a custom caster) raises a `TypeError`.
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Query from `mqm()` / `QueryParser.parse()` (or a `MongoQuery`).
+
+    Returns:
+        str: Hexadecimal fingerprint, usable as a shared result cache key.
+    """
+    return _digest(canonicalize(mongodb_query))
+
+
+def shape_hash(mongodb_query: Mapping[str, Any]) -> str:
+    """Fingerprint of the shape of a parsed query, its filter without literal values, sort, projection and collation.
+
+    Notes:
+        Queries with the same shape only differ by their values (and skip / limit / population), they use the same
+        MongoDB plan cache entry. A regex value keeps its kind (ie, 'name=/jo/' is {'$regex': '?'}, not '?').
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Query from `mqm()` / `QueryParser.parse()` (or a `MongoQuery`).
+
+    Returns:
+        str: Hexadecimal shape fingerprint.
+    """
+    return _digest(
+        (
+            _canonical_filter(mongodb_query["filter"], shape=True),
+            _canonical_sort(mongodb_query["sort"]),
+            sorted(mongodb_query["projection"].items()) if mongodb_query["projection"] else None,
+            sorted(mongodb_query["collation"].items()) if mongodb_query.get("collation") else None,
+        )
+    )
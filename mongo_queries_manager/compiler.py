@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""CompiledParser module.
+
+This module contain a parser generated from a field schema, the fields, operators and casters of an endpoint are
+written into the source of its parse function (no type guessing, no operator table, no dispatch table).
+"""
+
+from __future__ import annotations
+
+__all__ = ["CompiledParser"]
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+from urllib import parse
+
+from mongo_queries_manager.helpers import merge_sub_filter
+from mongo_queries_manager.mongodb_queries_manager import FilterError, MongoDBQueriesManager, SchemaError
+from mongo_queries_manager.schema import compile_schema
+
+# Filter operators with their mongodb operator, by order of precedence ('!' / no operator are $exists).
+_FILTER_OPERATORS = (("<=", "$lte"), (">=", "$gte"), ("!=", "$ne"), ("=", "$eq"), (">", "$gt"), ("<", "$lt"))
+
+_PARSE_TEMPLATE = """\
+def parse(string_query):
+    mongodb_filter = {{}}
+    mongodb_query = {{"filter": mongodb_filter, "sort": None, "skip": 0, "limit": 0, "projection": None}}
+    projection_args = []
+    for arg in unquote(string_query).split("&"):
+        if arg == "":
+            continue
+        key, separator, value = arg.partition("=")
+        if separator:
+            if key == "populate":
+                continue
+            if key == "sort":
+{sort}
+                continue
+            if key == "limit":
+{limit}
+                continue
+            if key == "skip":
+{skip}
+                continue
+            if key == "fields":
+{fields}
+                continue
+            if key == "$text":
+{text}
+                continue
+{split}
+        else:
+            # $exists operation field is the value (ie, '!email')
+            index = arg.find("!")
+            key = arg[index + 1 :]
+            if key in FIELDS:
+                sub_filter = {{"$exists": index == -1}}
+            elif key in BLACKLIST:
+                continue
+            else:
+                raise SchemaError(f"Unknown field {{key}}")
+            if key in mongodb_filter:
+                merge_sub_filter(mongodb_filter, key, sub_filter, arg)
+            else:
+                mongodb_filter[key] = sub_filter
+            continue
+{filters}
+        if key in mongodb_filter:
+            merge_sub_filter(mongodb_filter, key, sub_filter, arg)
+        else:
+            mongodb_filter[key] = sub_filter
+    for arg in projection_args:
+        projection = projection_logic(arg, None)
+        if projection is not None:
+            check_fields(projection, PROJECTION_FIELDS, "projection")
+        mongodb_query["projection"] = projection
+    return mongodb_query
+"""
+
+
+def _indent(source: str, level: int) -> str:
+    """Indent source lines.
+
+    Args:
+        source (str): Source lines.
+        level (int): Indentation level (4 spaces).
+
+    Returns:
+        str: Indented source lines.
+    """
+    return "\n".join(f"{'    ' * level}{line}" if line else line for line in source.splitlines())
+
+
+def _check_fields(keys: Iterable[Any], allowed_fields: frozenset[str], section: str) -> None:
+    """Check that the fields of a sort / projection are allowed.
+
+    Args:
+        keys (Iterable[Any]): Fields of the section.
+        allowed_fields (FrozenSet[str]): Allowed fields.
+        section (str): Section name, used into the error message.
+    """
+    for key in keys:
+        if key not in allowed_fields:
+            raise SchemaError(f"Unknown {section} field {key}")
+
+
+def _filter_source(caster: Callable[[str], Any], name: str) -> str:
+    """Source of the filter of a declared field (branch body), a string value is used as is.
+
+    Args:
+        caster (Callable): Schema caster of the field.
+        name (str): Name of the caster into the parse function namespace.
+
+    Returns:
+        str: Source of the field branch.
+    """
+    value = "value" if caster is str else f"{name}(value)"
+    items = "value.split(',')" if caster is str else f"[{name}(item) for item in value.split(',')]"
+    operators = "".join(
+        f"elif operator == {operator!r}:\n    sub_filter = {{{mongodb_operator!r}: {value}}}\n"
+        for operator, mongodb_operator in _FILTER_OPERATORS
+        if operator not in ("=", "!=")
+    )
+    cast = (
+        f"if operator == '=':\n"
+        f"    sub_filter = {{'$in': {items}}} if value.find(',') > -1 else {value}\n"
+        f"elif operator == '!=':\n"
+        f"    sub_filter = {{'$nin': {items}}} if value.find(',') > -1 else {{'$ne': {value}}}\n"
+        f"{operators}"
+    )
+    if caster is not str:
+        cast = (
+            f"try:\n{_indent(cast, 1)}\n"
+            f"except Exception as err:\n"
+            f"    raise SchemaError(f'Fail to cast {{value}} of field {{key}}') from err\n"
+        )
+    return (
+        f"if value.find(operator) > -1:\n"
+        f"    raise FilterError(f'Fail to split filter {{arg}} with operator {{operator}}')\n"
+        f"{cast}"
+    )
+
+
+class CompiledParser:
+    """CompiledParser class.
+
+    A parser generated once per endpoint, `parse` is equivalent to a `QueryParser` with the same schema and
+    blacklist (with `unknown_fields='reject'`), and rejects the sort / projection fields which aren't allowed.
+    Population and keyset pagination aren't supported ('populate' is ignored).
+
+    Attributes:
+        parse (Callable[[str], Dict[str, Any]]): Generated parse function, string query to mongodb query.
+        source (str): Source of the generated parse function.
+    """
+
+    __slots__ = ("parse", "source")
+
+    def __init__(
+        self,
+        schema: Mapping[str, Any],
+        *,
+        blacklist: list[str] | None = None,
+        sort_fields: list[str] | None = None,
+        projection_fields: list[str] | None = None,
+    ) -> None:
+        """Initialize CompiledParser class, generate and compile the parse function.
+
+        Args:
+            schema (Mapping[str, Any]): Type of the filter fields by dotted path, or nested (see `QueryParser`).
+            blacklist (Optional[List[str]]): Keys ignored by the parser (whatever the operator).
+            sort_fields (Optional[List[str]]): Allowed sort fields, the schema fields by default.
+            projection_fields (Optional[List[str]]): Allowed projection fields, the schema fields by default.
+        """
+        mongodb_queries_mgr = MongoDBQueriesManager()
+        casters = compile_schema(schema)
+        for field in casters:
+            # A field must be split and cast as itself ($exists operation).
+            if mongodb_queries_mgr.split_operation(field) != ("", "", field) or (
+                mongodb_queries_mgr.cast_value_logic(field) != field
+            ):
+                raise ValueError(f"Schema field {field} isn't a valid field name")
+
+        blacklist_keys = frozenset(blacklist or ())
+        fields = {field: caster for field, caster in casters.items() if field not in blacklist_keys}
+        namespace: dict[str, Any] = {
+            "unquote": parse.unquote,
+            "merge_sub_filter": merge_sub_filter,
+            "check_fields": _check_fields,
+            "sort_logic": MongoDBQueriesManager.sort_logic,
+            "limit_logic": MongoDBQueriesManager.limit_logic,
+            "skip_logic": MongoDBQueriesManager.skip_logic,
+            "projection_logic": MongoDBQueriesManager.projection_logic,
+            "text_operator_logic": MongoDBQueriesManager.text_operator_logic,
+            "FilterError": FilterError,
+            "SchemaError": SchemaError,
+            "FIELDS": frozenset(fields),
+            "BLACKLIST": blacklist_keys,
+            "SORT_FIELDS": frozenset(casters if sort_fields is None else sort_fields),
+            "PROJECTION_FIELDS": frozenset(casters if projection_fields is None else projection_fields),
+        }
+        # Branches of the declared fields, then the blacklisted / unknown fields.
+        branches = []
+        for index, (field, caster) in enumerate(fields.items()):
+            namespace[f"cast_{index}"] = caster
+            branches.append((f"key == {field!r}", _filter_source(caster, f"cast_{index}")))
+        branches.append(("key in BLACKLIST", "continue"))
+        filters = "".join(
+            f"{'if' if index == 0 else 'elif'} {condition}:\n{_indent(body, 1)}\n"
+            for index, (condition, body) in enumerate(branches)
+        )
+        filters += 'else:\n    raise SchemaError(f"Unknown field {key}")'
+
+        # Cursor modifiers / text search, by control key.
+        control_sources = {
+            "sort": (
+                'mongodb_query["sort"] = sort_logic(arg)\n'
+                'if mongodb_query["sort"] is not None:\n'
+                '    check_fields([sort_key for sort_key, _ in mongodb_query["sort"]], SORT_FIELDS, "sort")'
+            ),
+            "limit": 'mongodb_query["limit"] = limit_logic(arg)',
+            "skip": 'mongodb_query["skip"] = skip_logic(arg)',
+            "fields": "projection_args.append(arg)",
+            "$text": 'mongodb_filter["$text"] = {"$search": text_operator_logic(arg)}',
+        }
+        split = "".join(
+            f"{'if' if index == 0 else 'elif'} (index := arg.find({operator!r})) > -1:\n"
+            f"    key, operator, value = arg[:index], {operator!r}, arg[index + {len(operator)} :]\n"
+            for index, (operator, _) in enumerate(_FILTER_OPERATORS)
+        )
+        self.source = _PARSE_TEMPLATE.format(
+            **{
+                # Blacklisted control keys are ignored.
+                key.lstrip("$"): _indent("pass" if key in blacklist_keys else source, 4)
+                for key, source in control_sources.items()
+            },
+            split=_indent(split, 2),
+            filters=_indent(filters, 2),
+        )
+        exec(compile(self.source, f"<CompiledParser {sorted(casters)}>", "exec"), namespace)
+        self.parse: Callable[[str], dict[str, Any]] = namespace["parse"]
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Query cost module.
+
+This module contain the cost model of a parsed query (filter predicates, `$in` values, regex, `$text`, skip, limit and
+population) and the admission limits of a parser.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "QueryLimits",
+    "check_limit",
+    "check_limits",
+    "check_populate_depth",
+    "check_skip",
+    "estimate_cost",
+    "populate_cost",
+]
+
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+from mongo_queries_manager.mongodb_queries_manager import QueryLimitError
+from mongo_queries_manager.regex import is_regex
+
+# Cost of any query (one round trip).
+BASE_COST = 1.0
+# Cost of each filter predicate.
+PREDICATE_COST = 1.0
+# Cost of each value of a `$in` / `$nin` / `$all` list.
+LIST_VALUE_COST = 0.01
+# Cost of a regex predicate, a scan of the matched index keys or of the collection.
+REGEX_COST = 10.0
+# Cost of a `$text` search, and its extra cost with regex predicates (text scan and regex on its results).
+TEXT_COST = 20.0
+TEXT_WITH_REGEX_COST = 50.0
+# Cost of each skipped document, read then discarded by the server.
+SKIPPED_DOCUMENT_COST = 0.001
+# Cost of each returned document, and of a query without limit.
+DOCUMENT_COST = 0.01
+UNLIMITED_COST = 10.0
+# Cost of each populated path by level, a level is a query which waits for its parent level.
+POPULATED_PATH_COST = 5.0
+
+_LOGICAL_OPERATORS = frozenset({"$and", "$or", "$nor"})
+_LIST_OPERATORS = frozenset({"$in", "$nin", "$all"})
+
+
+class QueryLimits(NamedTuple):
+    """Admission limits of a parser, a query over a limit raises `QueryLimitError` (None for no limit).
+
+    Attributes:
+        max_arguments (Optional[int]): Maximum number of non empty query arguments, checked while splitting the query.
+        max_list_values (Optional[int]): Maximum number of values of a `$in` / `$nin` list, checked before casting them.
+        max_skip (Optional[int]): Maximum skip value.
+        max_limit (Optional[int]): Maximum limit value, a query without limit is over it.
+        max_populate_depth (Optional[int]): Maximum population level (ie, 3 for 'user.company.country').
+        text_with_regex (bool): Allow `$text` combined with regex filters.
+        max_cost (Optional[float]): Maximum estimated cost (see `estimate_cost`), checked before the population.
+    """
+
+    max_arguments: int | None = None
+    max_list_values: int | None = None
+    max_skip: int | None = None
+    max_limit: int | None = None
+    max_populate_depth: int | None = None
+    text_with_regex: bool = True
+    max_cost: float | None = None
+
+
+def _filter_cost(mongodb_filter: Mapping[str, Any]) -> tuple[float, bool, bool]:
+    """Estimate the cost of a filter.
+
+    Args:
+        mongodb_filter (Mapping[str, Any]): MongoDB filter.
+
+    Returns:
+        Tuple[float, bool, bool]: Cost, True if it has a `$text` search and True if it has regex predicates.
+    """
+    cost = 0.0
+    has_text = has_regex = False
+    for key, condition in mongodb_filter.items():
+        if key == "$text":
+            cost += TEXT_COST
+            has_text = True
+        elif key in _LOGICAL_OPERATORS and isinstance(condition, list):
+            for sub_filter in condition:
+                sub_cost, sub_text, sub_regex = _filter_cost(sub_filter)
+                cost += sub_cost
+                has_text, has_regex = has_text or sub_text, has_regex or sub_regex
+        elif is_regex(condition):
+            cost += REGEX_COST
+            has_regex = True
+        elif isinstance(condition, dict) and condition and all(str(operator).startswith("$") for operator in condition):
+            for operator, operand in condition.items():
+                if is_regex(operand):
+                    cost += REGEX_COST
+                    has_regex = True
+                elif operator in _LIST_OPERATORS and isinstance(operand, list):
+                    cost += PREDICATE_COST + LIST_VALUE_COST * len(operand)
+                else:
+                    cost += PREDICATE_COST
+        else:
+            cost += PREDICATE_COST
+    return cost, has_text, has_regex
+
+
+def _population_cost(population: list[dict[str, Any]], level: int = 1) -> float:
+    """Estimate the cost of a population.
+
+    Args:
+        population (List[Dict[str, Any]]): Population (or sub population).
+        level (int): Level of the population.
+
+    Returns:
+        float: Cost.
+    """
+    return sum(
+        POPULATED_PATH_COST * level + _population_cost(item.get("population") or [], level + 1) for item in population
+    )
+
+
+def populate_cost(populate: str) -> float:
+    """Estimate the cost of a populate argument value, before building the population.
+
+    Args:
+        populate (str): Populate argument value (ie, 'user,user.company').
+
+    Returns:
+        float: Cost, the same as the cost of its population.
+    """
+    return sum(POPULATED_PATH_COST * (path.count(".") + 1) for path in set(populate.split(",")) if path)
+
+
+def _query_cost(mongodb_query: Mapping[str, Any]) -> tuple[float, bool, bool]:
+    """Estimate the cost of a parsed query.
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Parsed query.
+
+    Returns:
+        Tuple[float, bool, bool]: Cost, True if it has a `$text` search and True if it has regex predicates.
+    """
+    cost, has_text, has_regex = _filter_cost(mongodb_query["filter"])
+    if has_text and has_regex:
+        cost += TEXT_WITH_REGEX_COST
+    cost += BASE_COST + SKIPPED_DOCUMENT_COST * mongodb_query["skip"]
+    cost += DOCUMENT_COST * mongodb_query["limit"] if mongodb_query["limit"] else UNLIMITED_COST
+    if mongodb_query.get("population"):
+        cost += _population_cost(mongodb_query["population"])
+    return cost, has_text, has_regex
+
+
+def estimate_cost(mongodb_query: Mapping[str, Any]) -> float:
+    """Estimate the cost of a parsed query, usable to rate-limit the requests by cost.
+
+    Notes:
+        The cost is a score: a predicate costs 1, a `$in` value 0.01, a regex 10, a `$text` search 20 (70 with
+        regex), a skipped document 0.001, a returned document 0.01 (10 without limit) and a populated path 5 by level.
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Query from `mqm()` / `QueryParser.parse()` (or a `MongoQuery`).
+
+    Returns:
+        float: Estimated cost.
+    """
+    return _query_cost(mongodb_query)[0]
+
+
+def check_skip(skip: int, limits: QueryLimits) -> None:
+    """Check the skip value of a query.
+
+    Args:
+        skip (int): Skip value from `skip_logic`.
+        limits (QueryLimits): Admission limits.
+    """
+    if limits.max_skip is not None and skip > limits.max_skip:
+        raise QueryLimitError(f"Skip is greater than {limits.max_skip}")
+
+
+def check_limit(limit: int, limits: QueryLimits) -> None:
+    """Check the limit value of a query, 0 is no limit.
+
+    Args:
+        limit (int): Limit value from `limit_logic`.
+        limits (QueryLimits): Admission limits.
+    """
+    if limits.max_limit is not None and (limit == 0 or limit > limits.max_limit):
+        raise QueryLimitError(f"Limit is missing or greater than {limits.max_limit}")
+
+
+def check_populate_depth(populate: str, limits: QueryLimits) -> None:
+    """Check the population levels of a populate value.
+
+    Args:
+        populate (str): Populate argument value (ie, 'user,user.company').
+        limits (QueryLimits): Admission limits.
+    """
+    if limits.max_populate_depth is not None and populate.count(".") >= limits.max_populate_depth:
+        depth = max(path.count(".") + 1 for path in populate.split(","))
+        if depth > limits.max_populate_depth:
+            raise QueryLimitError(f"Population is deeper than {limits.max_populate_depth} levels")
+
+
+def check_limits(mongodb_query: Mapping[str, Any], populate: str, limits: QueryLimits) -> float:
+    """Check the limits of a query parsed without its population, then estimate its cost with the populate value.
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Query without projection and population.
+        populate (str): Populate argument value, empty without population.
+        limits (QueryLimits): Admission limits.
+
+    Returns:
+        float: Estimated cost of the query (see `estimate_cost`).
+    """
+    check_skip(mongodb_query["skip"], limits)
+    check_limit(mongodb_query["limit"], limits)
+    check_populate_depth(populate, limits)
+
+    cost, has_text, has_regex = _query_cost(mongodb_query)
+    if has_text and has_regex and not limits.text_with_regex:
+        raise QueryLimitError("$text can't be combined with regex filters")
+
+    cost += populate_cost(populate)
+    if limits.max_cost is not None and cost > limits.max_cost:
+        raise QueryLimitError(f"Query cost {cost:g} is greater than {limits.max_cost:g}")
+    return cost
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Execution options module.
+
+This module contain the server side execution options of a parsed query (time budget, batch size, disk use and index
+hint), fixed by parser or scaled from the estimated cost of the query.
+"""
+
+from __future__ import annotations
+
+__all__ = ["EXECUTION_KEYS", "ExecutionOptions", "execution_options"]
+
+import math
+from typing import Any, NamedTuple
+
+# Keys of the execution options into a parsed query, keyword arguments of `Collection.find`.
+EXECUTION_KEYS = ("max_time_ms", "batch_size", "allow_disk_use", "hint")
+
+
+class ExecutionOptions(NamedTuple):
+    """Execution options of a parser, added to the parsed queries (None for the server default).
+
+    Attributes:
+        max_time_ms (Optional[int]): Server time budget in milliseconds, the upper bound of the scaled budget.
+        time_per_cost (Optional[float]): Milliseconds by estimated cost unit (see `estimate_cost`), the time budget is
+            scaled from the cost of each query.
+        batch_size (Optional[int]): Maximum batch size, the batch size is the limit of the query when lower or unset
+            (the page is returned in one batch).
+        allow_disk_use (Optional[bool]): Allow the server to use temporary files for large sorts.
+        hint (Optional[Union[str, List[Tuple[str, int]]]]): Index name or keys, forced for every query.
+    """
+
+    max_time_ms: int | None = None
+    time_per_cost: float | None = None
+    batch_size: int | None = None
+    allow_disk_use: bool | None = None
+    hint: str | list[tuple[str, int]] | None = None
+
+
+def execution_options(limit: int, cost: float | None, options: ExecutionOptions) -> dict[str, Any]:
+    """Return the execution options of a parsed query.
+
+    Args:
+        limit (int): Limit of the query, 0 without limit.
+        cost (Optional[float]): Estimated cost of the query, only used with `time_per_cost`.
+        options (ExecutionOptions): Execution options of the parser.
+
+    Returns:
+        Dict[str, Any]: Execution options by their `EXECUTION_KEYS` key, without the unset ones.
+    """
+    max_time_ms = options.max_time_ms
+    if options.time_per_cost is not None and cost is not None:
+        # At least 1 ms, 0 is no time limit for the server.
+        scaled_time_ms = max(1, math.ceil(cost * options.time_per_cost))
+        max_time_ms = scaled_time_ms if max_time_ms is None else min(max_time_ms, scaled_time_ms)
+
+    batch_size = options.batch_size
+    if limit and (batch_size is None or limit < batch_size):
+        batch_size = limit
+
+    values = (max_time_ms, batch_size, options.allow_disk_use, options.hint)
+    return {key: value for key, value in zip(EXECUTION_KEYS, values, strict=True) if value is not None}
@@ -3,16 +3,92 @@
 
 """MongoDBQueriesManager helpers functions."""
 
-__all__ = ["is_blacklisted_value"]
+__all__ = ["FieldTrie", "chunked", "ensure_population_paths", "is_blacklisted_value", "merge_sub_filter"]
 
-from typing import Any
+import warnings
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, TypeVar
 
-from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
+from mongo_queries_manager.mongodb_queries_manager import FilterError, MongoDBQueriesManager
+
+_T = TypeVar("_T")
+
+
+class FieldTrie:
+    """FieldTrie class.
+
+    Prefix tree of dotted field paths, a field matches when one of the paths is the field or one of its parents
+    (ie, 'author' matches 'author' and 'author.name').
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self, fields: Iterable[str]) -> None:
+        """Initialize FieldTrie class.
+
+        Args:
+            fields (Iterable[str]): Dotted field paths.
+        """
+        self._root: dict[str, Any] = {}
+        for field in fields:
+            node = self._root
+            *parents, last = field.split(".")
+            for part in parents:
+                child = node.setdefault(part, {})
+                if child is True:
+                    # A parent path is already matched.
+                    break
+                node = child
+            else:
+                node[last] = True
+
+    def match(self, field: str) -> bool:
+        """Check if a field is one of the paths or one of their sub fields.
+
+        Args:
+            field (str): Dotted field path.
+
+        Returns:
+            bool: True if the field matches, False otherwise.
+        """
+        node = self._root
+        for part in field.split("."):
+            child = node.get(part)
+            if child is None:
+                return False
+            if child is True:
+                return True
+            node = child
+        return False
+
+
+def merge_sub_filter(mongodb_filter: dict[str, Any], key: str, sub_filter: Any, operation: str) -> None:
+    """Merge a sub filter into mongodb filter (ie, range filter 'price>5&price<10').
+
+    Args:
+        mongodb_filter (dict[str, Any]): The actual mongodb filter, updated in place.
+        key (str): Filter key.
+        sub_filter (Any): Sub filter to merge.
+        operation (str): Query operation of the sub filter.
+    """
+    if key not in mongodb_filter:
+        mongodb_filter[key] = sub_filter
+        return
+
+    current_sub_filter = mongodb_filter[key]
+    if not isinstance(current_sub_filter, dict) or not isinstance(sub_filter, dict):
+        raise FilterError(f"Fail to merge filter {operation} with key {key}")
+
+    current_sub_filter.update(sub_filter)
 
 
 def is_blacklisted_value(blacklist: list[str], arg: str) -> bool:
     """Check if a value is blacklisted.
 
+    Notes:
+        Deprecated, `QueryParser(blacklist=...)` matches the blacklist on the argument key, whatever the operator.
+
     Args:
         blacklist (list[str]): Filter on all keys except the ones specified.
         arg (str): Argument to check.
@@ -20,7 +96,10 @@ def is_blacklisted_value(blacklist: list[str], arg: str) -> bool:
     Returns:
         bool: True if the value is blacklisted, False otherwise.
     """
-    return any(arg.startswith(f"{blacklist}=") for blacklist in blacklist)
+    warnings.warn(
+        "is_blacklisted_value is deprecated, use QueryParser(blacklist=...)", DeprecationWarning, stacklevel=2
+    )
+    return any(arg.startswith(f"{key}=") for key in blacklist)
 
 
 def parse_query_operation(
@@ -28,47 +107,71 @@ def parse_query_operation(
 ) -> dict[str, Any]:
     """Parse query operation into mongodb query.
 
+    Notes:
+        Deprecated, `QueryParser.parse()` dispatches the arguments on their key.
+
     Args:
-        mongodb_query (dict[str, Any]): Filter on all keys except the ones specified.
+        mongodb_query (dict[str, Any]): The actual mongodb query, updated in place.
         arg (str): Query operation argument to convert.
-        mongodb_queries_mgr: MongoDBQueriesManager object.
+        mongodb_queries_mgr (MongoDBQueriesManager): MongoDBQueriesManager object.
         populate (bool): True if the query need to be populated, False otherwise.
 
     Returns:
-        bool: True if the value is blacklisted, False otherwise.
+        dict[str, Any]: The updated mongodb query.
     """
-    if arg.startswith("populate="):
-        # Return directly to avoid population parsing issues.
-        return mongodb_query
-    elif arg.startswith("sort="):
+    warnings.warn("parse_query_operation is deprecated, use QueryParser.parse()", DeprecationWarning, stacklevel=2)
+    key = arg.partition("=")[0]
+    if key == "sort":
         mongodb_query["sort"] = mongodb_queries_mgr.sort_logic(sort_params=arg)
-    elif arg.startswith("limit="):
+    elif key == "limit":
         mongodb_query["limit"] = mongodb_queries_mgr.limit_logic(limit_param=arg)
-    elif arg.startswith("skip="):
+    elif key == "skip":
         mongodb_query["skip"] = mongodb_queries_mgr.skip_logic(skip_param=arg)
-    elif arg.startswith("fields="):
-        if not populate:
-            mongodb_query["projection"] = mongodb_queries_mgr.projection_logic(projection_param=arg, population=None)
-            return mongodb_query
-
+    elif key == "fields":
         mongodb_query["projection"] = mongodb_queries_mgr.projection_logic(
-            projection_param=arg, population=mongodb_query["population"]
+            projection_param=arg, population=mongodb_query["population"] if populate else None
         )
+    elif key == "$text":
+        mongodb_query["filter"]["$text"] = {"$search": mongodb_queries_mgr.text_operator_logic(text_param=arg)}
+    elif key != "populate" and arg != "":
+        for filter_key, sub_filter in mongodb_queries_mgr.filter_logic(filter_params=arg).items():
+            merge_sub_filter(mongodb_query["filter"], filter_key, sub_filter, arg)
+    return mongodb_query
 
-    elif arg.startswith("$text="):
-        mongodb_query["filter"] = {
-            **mongodb_query["filter"],
-            "$text": {"$search": mongodb_queries_mgr.text_operator_logic(text_param=arg)},
-        }
-    elif arg != "":
-        for key, sub_filter in mongodb_queries_mgr.filter_logic(filter_params=arg).items():
-            if key not in mongodb_query["filter"]:
-                mongodb_query["filter"][key] = sub_filter
-                continue
-
-            mongodb_query["filter"][key] = {
-                **mongodb_query["filter"][key],
-                **sub_filter,
-            }
 
-    return mongodb_query
+def ensure_population_paths(
+    projection: dict[str, Any] | None, population: list[dict[str, Any]] | None
+) -> dict[str, Any] | None:
+    """Add the population paths into an inclusion projection, the references are needed to populate them.
+
+    Args:
+        projection (Optional[Dict[str, Any]]): Projection (ie, {'title': 1}).
+        population (Optional[List[Dict[str, Any]]]): Population of the same level.
+
+    Returns:
+        Optional[Dict[str, Any]]: Projection including the population paths (a copy if updated).
+    """
+    if not projection or not population:
+        return projection
+
+    # Exclusion projection (only 0 values, '_id' can be excluded from an inclusion projection)
+    if all(value in (0, False) for key, value in projection.items() if key != "_id"):
+        return projection
+
+    missing_paths = {item["path"]: 1 for item in population if item["path"] not in projection}
+    return {**projection, **missing_paths} if missing_paths else projection
+
+
+def chunked(items: Iterable[_T], chunk_size: int) -> Iterator[list[_T]]:
+    """Split items into chunks of a number of items (not of a byte size).
+
+    Args:
+        items (Iterable[T]): Items.
+        chunk_size (int): Number of items per chunk.
+
+    Yields:
+        List[T]: Chunk of items.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
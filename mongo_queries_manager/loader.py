@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""PopulationLoader module.
+
+This module contain a DataLoader like batching of the population queries, the ids requested by all the in-flight
+requests during a short window are queried at once (one `$in` query per collection and projection).
+"""
+
+from __future__ import annotations
+
+__all__ = ["PopulationLoader"]
+
+import asyncio
+from collections import Counter
+from collections.abc import Hashable
+from contextlib import nullcontext
+from typing import Any
+
+from mongo_queries_manager.helpers import chunked
+from mongo_queries_manager.population import (
+    DEFAULT_CHUNK_SIZE,
+    AsyncFindCollection,
+    _find_async,
+    _gather,
+    projection_key,
+)
+
+
+class _Batch:
+    """Ids of a pending batch, with the future of the found documents by id."""
+
+    __slots__ = ("future", "ids")
+
+    def __init__(self) -> None:
+        """Initialize _Batch class."""
+        self.ids: dict[Any, None] = {}
+        self.future: asyncio.Future[dict[Any, dict[str, Any]]] = asyncio.get_running_loop().create_future()
+        # An error is retrieved even if all the requests are cancelled.
+        self.future.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+
+class PopulationLoader:
+    """PopulationLoader class.
+
+    Share one loader between the requests (ie, one per application and event loop), its batches are dispatched
+    `window` seconds after their first load (at the next event loop iteration by default).
+
+    Attributes:
+        window (float): Batching window in seconds.
+        max_batch_size (int): Maximum number of ids per query, a full batch is dispatched at once (a batch over it,
+            with the ids of a large load, is split into queries of this size). Lower it for large ids, the BSON size
+            of the `$in` queries isn't measured.
+        loads (int): Number of loads (one per populated path and request).
+        batches (int): Number of queries.
+        batch_sizes (Counter[int]): Number of queries by number of ids.
+    """
+
+    def __init__(self, window: float = 0.0, max_batch_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """Initialize PopulationLoader class.
+
+        Args:
+            window (float): Batching window in seconds, 0 to batch the loads of the same event loop iteration.
+            max_batch_size (int): Maximum number of ids per batch, a count and not a size (see `DEFAULT_CHUNK_SIZE`).
+        """
+        if window < 0 or max_batch_size <= 0:
+            raise ValueError("Loader window must be positive or zero and max_batch_size positive")
+
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.loads = 0
+        self.batches = 0
+        self.batch_sizes: Counter[int] = Counter()
+        self._batches: dict[Hashable, _Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Mean number of ids per query."""
+        return sum(size * count for size, count in self.batch_sizes.items()) / self.batches if self.batches else 0.0
+
+    async def load(
+        self, collection: AsyncFindCollection, ids: list[Any], projection: dict[str, Any] | None
+    ) -> list[dict[str, Any]]:
+        """Load documents by id, batched with the loads of the same collection and projection.
+
+        Notes:
+            Returned documents are copies (shallow), requests can populate them independently.
+
+        Args:
+            collection (AsyncFindCollection): Collection of the documents.
+            ids (List[Any]): Documents ids.
+            projection (Optional[Dict[str, Any]]): Query projection, must return '_id'.
+
+        Returns:
+            List[Dict[str, Any]]: Found documents.
+        """
+        self.loads += 1
+        key = (collection, projection_key(projection))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch()
+            asyncio.get_running_loop().call_later(self.window, self._dispatch, key, batch, collection, projection)
+
+        batch.ids.update(dict.fromkeys(ids))
+        if len(batch.ids) >= self.max_batch_size:
+            self._dispatch(key, batch, collection, projection)
+
+        # A cancelled request doesn't cancel the batch of the other requests.
+        documents = await asyncio.shield(batch.future)
+        return [dict(documents[item]) for item in ids if item in documents]
+
+    def _dispatch(
+        self, key: Hashable, batch: _Batch, collection: AsyncFindCollection, projection: dict[str, Any] | None
+    ) -> None:
+        """Query a batch (once), new loads go to a new batch.
+
+        Args:
+            key (Hashable): Batch key (collection and projection).
+            batch (_Batch): Batch to query.
+            collection (AsyncFindCollection): Collection of the documents.
+            projection (Optional[Dict[str, Any]]): Query projection.
+        """
+        if self._batches.get(key) is not batch:
+            return
+
+        del self._batches[key]
+        chunks = list(chunked(batch.ids, self.max_batch_size))
+        self.batches += len(chunks)
+        self.batch_sizes.update(len(chunk) for chunk in chunks)
+        task = asyncio.ensure_future(self._query(batch, chunks, collection, projection))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _query(
+        batch: _Batch, chunks: list[list[Any]], collection: AsyncFindCollection, projection: dict[str, Any] | None
+    ) -> None:
+        """Query a batch, one query per chunk of ids, and set its result (or error) for all its requests.
+
+        Args:
+            batch (_Batch): Batch to query.
+            chunks (List[List[Any]]): Ids of the batch, split into chunks of max batch size.
+            collection (AsyncFindCollection): Collection of the documents.
+            projection (Optional[Dict[str, Any]]): Query projection.
+        """
+        try:
+            results = await _gather(_find_async(collection, chunk, projection, nullcontext(), None) for chunk in chunks)
+        except asyncio.CancelledError:
+            batch.future.cancel()
+            raise
+        except Exception as err:
+            batch.future.set_exception(err)
+        else:
+            batch.future.set_result({document["_id"]: document for documents in results for document in documents})
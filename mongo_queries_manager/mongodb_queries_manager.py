@@ -8,42 +8,95 @@ This module contain all methods to convert string query to MongoDB query.
 
 from __future__ import annotations
 
-import json
 import re
 from collections.abc import Callable
+from contextvars import ContextVar
+from datetime import date as date_type
 from datetime import datetime
+from functools import cache, lru_cache
 from re import Pattern
-from typing import Any
+from typing import Any, Generic, TypeVar
 
-try:
-    from dateparser import parse
+# Set when a cast value depends on the current time or on a custom caster, such query can't be cached.
+volatile_cast: ContextVar[bool] = ContextVar("volatile_cast", default=False)
 
-    def _date_parse(date: str) -> datetime | str:
-        """Cast string date into datetime using dateparse library (extra dep).
+_T = TypeVar("_T")
 
-        Args:
-            date (str): Date as string format.
 
-        Returns:
-            Optional[datetime]: Cast value.
-        """
-        return parse(date, languages=["fr", "en"]) or date
+@cache
+def _load_dateparser() -> Callable[..., datetime | None] | None:
+    """Import dateparser library (extra dep) on first use, its import takes hundreds of milliseconds.
 
-except ModuleNotFoundError:
+    Returns:
+        Optional[Callable]: Dateparser parse function, None if dateparser isn't installed.
+    """
+    try:
+        from dateparser import parse  # noqa: PLC0415
+    except ModuleNotFoundError:
+        return None
+    return parse
 
-    def _date_parse(date: str) -> datetime | str:
-        """Cast string date into datetime (only isoformat supported).
 
-        Args:
-            date (str): Date as string format.
+@lru_cache(maxsize=1024)
+def _dateparser_parse(date: str, today: int) -> datetime | None:
+    """Cast string date into datetime using dateparse library (extra dep), memoized.
 
-        Returns:
-            Optional[datetime]: Cast value.
+    Args:
+        date (str): Date as string format.
+        today (int): Current date ordinal, dateparser complete partial dates with the current date.
+
+    Returns:
+        Optional[datetime]: Cast value, None if dateparser fail to parse it.
+    """
+    parse = _load_dateparser()
+    return parse(date, languages=["fr", "en"]) if parse is not None else None
+
+
+def _date_parse(date: str) -> datetime | str:
+    """Cast string date into datetime, isoformat first then dateparse library (extra dep) if installed.
+
+    Args:
+        date (str): Date as string format.
+
+    Returns:
+        Optional[datetime]: Cast value.
+    """
+    try:
+        return datetime.fromisoformat(date)
+    except (ValueError, TypeError):
+        pass
+
+    if _load_dateparser() is None:
+        return date
+
+    # Dateparser complete partial dates with the current date (ie, '2016-01').
+    volatile_cast.set(True)
+    return _dateparser_parse(date, today=date_type.today().toordinal()) or date
+
+
+class _LazyClassAttribute(Generic[_T]):
+    """Class attribute computed on first access, then stored on the class (ie, compiled regex)."""
+
+    __slots__ = ("func", "name")
+
+    def __init__(self, func: Callable[[type[Any]], _T]) -> None:
+        """Initialize _LazyClassAttribute class.
+
+        Args:
+            func (Callable[[type], _T]): Compute the attribute value from the owner class.
         """
-        try:
-            return datetime.fromisoformat(date)
-        except (ValueError, TypeError):
-            return date
+        self.func = func
+        self.name = func.__name__
+
+    def __set_name__(self, owner: type[Any], name: str) -> None:
+        """Store the attribute name."""
+        self.name = name
+
+    def __get__(self, instance: object, owner: type[Any]) -> _T:
+        """Compute the attribute value and replace the descriptor with it."""
+        value = self.func(owner)
+        setattr(owner, self.name, value)
+        return value
 
 
 ASCENDING = 1  # Ascending sort order.
@@ -91,6 +144,75 @@ class LogicalSubPopulationError(MongoDBQueriesManagerBaseError):
     """Raised when method fail to find logical sub population item."""
 
 
+class PaginationError(MongoDBQueriesManagerBaseError):
+    """Raised when a keyset pagination token is invalid."""
+
+
+class SchemaError(MongoDBQueriesManagerBaseError):
+    """Raised when a field isn't declared into the schema or its value fail to be cast."""
+
+
+class QueryLimitError(MongoDBQueriesManagerBaseError):
+    """Raised when a query is over an admission limit of the parser (see `QueryLimits`)."""
+
+
+class RegexError(MongoDBQueriesManagerBaseError):
+    """Raised when a regex value is invalid, too long or may backtrack catastrophically."""
+
+
+@lru_cache(maxsize=1024)
+def compile_regex(pattern: str, flags: int = 0) -> Pattern[str]:
+    """Compile a regex, memoized (the same regex values are sent by many requests).
+
+    Args:
+        pattern (str): Regex pattern.
+        flags (int): Regex flags (ie, `re.IGNORECASE`).
+
+    Returns:
+        re.Pattern: Compiled regex.
+    """
+    return re.compile(pattern, flags)
+
+
+class PureCaster:
+    """PureCaster class.
+
+    Wrap a custom caster to declare it as pure, its results are memoized by value (ie, `ObjectId` / `Decimal128`).
+    A pure caster must always return the same immutable value for the same input. The memoized values are shared by
+    all the parsers using the same `PureCaster` (not between the process pool workers of `parse_many`).
+
+    Attributes:
+        func (Callable): Custom caster.
+        maxsize (int): Maximum number of memoized values.
+        memoized (Callable): Custom caster with memoization.
+    """
+
+    __slots__ = ("func", "maxsize", "memoized")
+
+    def __init__(self, func: Callable[[str], Any], maxsize: int = 4096) -> None:
+        """Initialize PureCaster class.
+
+        Args:
+            func (Callable): Custom caster.
+            maxsize (int): Maximum number of memoized values.
+        """
+        self.func = func
+        self.maxsize = maxsize
+        self.memoized: Callable[[str], Any] = lru_cache(maxsize=maxsize)(func)
+
+    def __call__(self, value: str) -> Any:
+        """Cast value with the custom caster (without memoization)."""
+        return self.func(value)
+
+    def __reduce__(self) -> tuple[type[PureCaster], tuple[Callable[[str], Any], int]]:
+        """Pickle the custom caster without its memoized values (process pool workers).
+
+        Returns:
+            Tuple[type, Tuple[Callable, int]]: Class and arguments.
+        """
+        return PureCaster, (self.func, self.maxsize)
+
+
 class MongoDBQueriesManager:
     """MongoDBQueriesManager class.
 
@@ -98,6 +220,10 @@ class MongoDBQueriesManager:
 
     Attributes:
         mongodb_operator (Dict[str, str]): MongoDB operator, used to convert query operators into MongoDB operators
+        operators (Tuple[str, ...]): Query operators, by order of precedence
+        type_patterns (Tuple[Tuple[str, str, Callable], ...]): Value types (name, regex, cast) by order of precedence
+        type_regex (re.Pattern): All value types regex, used to cast a value with a single match
+        constant_values (Dict[str, Any]): Case insensitive constant values (ie, 'true' / 'null')
         regex_dict (Dict[Union[str, re.Pattern], Any]): Contain all typing for cast into right format
     """
 
@@ -112,29 +238,77 @@ class MongoDBQueriesManager:
         "": "$exists",
     }
 
-    regex_dict: dict[str | Pattern[str], Any] = {
-        re.compile(r"^[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?$"): float,
-        re.compile(r"^[-+]?\d+$"): int,
-        re.compile(
+    operators: tuple[str, ...] = ("<=", ">=", "!=", "=", ">", "<", "!")
+
+    # Value types (name, regex, cast), by order of precedence.
+    type_patterns: tuple[tuple[str, str, Callable[[str], Any]], ...] = (
+        ("float", r"^[-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?$", float),
+        ("int", r"^[-+]?\d+$", int),
+        (
+            "date",
             r"^[12]\d{3}(-(0[1-9]|1[0-2])(-(0[1-9]|[12][0-9]|3[01]))?)(T|"
-            r" )?(([01][0-9]|2[0-3]):[0-5]\d(:[0-5]\d(\.\d+)?)?(Z|[+-]\d{2}:\d{2})?)?$"
-        ): _date_parse,
-        re.compile(r"^[A-Za-z ]+(?=(,?,))(?:\1[A-Za-z ]+)+$"): lambda list_value: list_value.split(","),
-        re.compile(
+            r" )?(([01][0-9]|2[0-3]):[0-5]\d(:[0-5]\d(\.\d+)?)?(Z|[+-]\d{2}:\d{2})?)?$",
+            _date_parse,
+        ),
+        (
+            "list",
+            r"^[A-Za-z ]+(?=(?P<list_separator>,?,))(?:(?P=list_separator)[A-Za-z ]+)+$",
+            lambda list_value: list_value.split(","),
+        ),
+        (
+            "regex",
             r"\/((?![*+?])(?:[^\r\n\[/\\]|\\.|\[(?:[^\r\n\]\\]|\\.)*\])+)"
-            r"\/((?:g(?:im?|mi?)?|i(?:gm?|mg?)?|m(?:gi?|ig?)?)?)"
-        ): re.compile,
-        "true": lambda boolean: True,
-        "false": lambda boolean: False,
-        "null": lambda null: None,
-        "none": lambda none: None,
-    }
+            r"\/((?:g(?:im?|mi?)?|i(?:gm?|mg?)?|m(?:gi?|ig?)?)?)",
+            compile_regex,
+        ),
+    )
+
+    # All value types in a single regex, the matched type is the name of the last matched group.
+    # Compiled on first use.
+    @_LazyClassAttribute
+    def type_regex(cls: type[MongoDBQueriesManager]) -> Pattern[str]:
+        """Single regex of all value types."""
+        return re.compile("|".join(f"(?P<{name}>{pattern})" for name, pattern, _ in cls.type_patterns))
+
+    type_casts: dict[str, Callable[[str], Any]] = {name: cast for name, _, cast in type_patterns}
+
+    # Case insensitive constant values.
+    constant_values: dict[str, Any] = {"true": True, "false": False, "null": None, "none": None}
+
+    # Legacy typing table, compiled on first use.
+    @_LazyClassAttribute
+    def regex_dict(cls: type[MongoDBQueriesManager]) -> dict[str | Pattern[str], Any]:
+        """Contain all typing for cast into right format."""
+        return {
+            **{re.compile(pattern): cast for _, pattern, cast in cls.type_patterns},
+            "true": lambda boolean: True,
+            "false": lambda boolean: False,
+            "null": lambda null: None,
+            "none": lambda none: None,
+        }
 
     custom_cast_dict: dict[str, Callable[[Any], Any]] | None
 
-    def __init__(self, casters: dict[str, Callable[[Any], Any]] | None = None) -> None:
-        """Initialize MongoDBQueriesManager class."""
+    def __init__(
+        self,
+        casters: dict[str, Callable[[Any], Any]] | None = None,
+        regex_cast: Callable[[str], Any] | None = None,
+    ) -> None:
+        """Initialize MongoDBQueriesManager class.
+
+        Args:
+            casters (Optional[Dict[str, Callable]]): Custom caster dict, used to define custom type.
+            regex_cast (Optional[Callable]): Caster of the regex values ('/pattern/flags'), instead of compiling the
+                whole value.
+        """
         self.custom_cast_dict = casters
+        if regex_cast is not None:
+            self.type_casts = {**self.type_casts, "regex": regex_cast}
+        # Custom casters by name with their purity, pure casters are memoized.
+        self._custom_casters: dict[str, tuple[Callable[[Any], Any], bool]] = {
+            rule: (func.memoized, True) if isinstance(func, PureCaster) else (func, False)
+            for rule, func in (casters or {}).items()
+        }
 
     def filter_logic(self, filter_params: str) -> dict[str, Any]:
         """Build filter.
@@ -145,41 +319,81 @@ class MongoDBQueriesManager:
         Returns:
             Dict[str, Any]: Dictionary with MongoDB filter
         """
-        operator = self.find_operator(filter_params=filter_params)
+        key, sub_filter = self.filter_item_logic(*self.split_operation(filter_params))
+        return {key: sub_filter}
 
-        if operator != "":
-            try:
-                key, value = filter_params.split(operator)
-            except ValueError as err:
-                raise FilterError(f"Fail to split filter {filter_params} with operator {operator}") from err
-        else:
-            key, value = "", filter_params
+    def filter_item_logic(
+        self, key: str, operator: str, value: str, cast: Callable[[str], Any] | None = None
+    ) -> tuple[str, Any]:
+        """Build filter item from an operation already split by `split_operation`.
 
-        value = self.cast_value_logic(value)
+        Args:
+            key (str): Operation key (ie, 'name')
+            operator (str): Operation operator (ie, '=')
+            value (str): Operation value (ie, 'John')
+            cast (Optional[Callable]): Schema caster of the field, used instead of the value type guessing
+                (comma separated values are a list with '=' / '!=')
+
+        Returns:
+            Tuple[str, Any]: Filter key and MongoDB sub filter
+        """
+        if operator != "" and value.find(operator) > -1:
+            raise FilterError(f"Fail to split filter {key}{operator}{value} with operator {operator}")
+
+        # $exists operation value is the field, it isn't cast
+        if cast is not None and operator not in ("", "!"):
+            return self._schema_filter_item_logic(key, operator, value, cast)
+
+        casted_value = self.cast_value_logic(value)
 
         # $eq logic
-        if operator == "=" and isinstance(value, list) is False:
-            return {key: value}
+        if operator == "=" and isinstance(casted_value, list) is False:
+            return key, casted_value
 
         # $in, $nin, $exists logic
-        if isinstance(value, list):
+        if isinstance(casted_value, list):
             # Cast list items
-            casted_list_item = []
-            for item in value:
-                casted_list_item.append(self.cast_value_logic(item))
+            casted_list_item = [self.cast_value_logic(item) for item in casted_value]
 
             if operator == "=":
-                return {key: {"$in": casted_list_item}}
+                return key, {"$in": casted_list_item}
             if operator == "!=":
-                return {key: {"$nin": casted_list_item}}
+                return key, {"$nin": casted_list_item}
             raise ListOperatorError("List operator not found")
 
         # $exists logic
-        if operator in ["", "!"]:
-            return {value: {self.mongodb_operator[operator]: operator == ""}}
+        if operator in ("", "!"):
+            return casted_value, {self.mongodb_operator[operator]: operator == ""}
 
         # $gt, $gte, $lt, $lte, $ne, logic
-        return {key: {self.mongodb_operator[operator]: value}}
+        return key, {self.mongodb_operator[operator]: casted_value}
+
+    def _schema_filter_item_logic(
+        self, key: str, operator: str, value: str, cast: Callable[[str], Any]
+    ) -> tuple[str, Any]:
+        """Build filter item of a field declared into the schema, its value is cast with the schema caster.
+
+        Args:
+            key (str): Operation key (ie, 'zip')
+            operator (str): Operation operator (ie, '=')
+            value (str): Operation value (ie, '01234')
+            cast (Callable): Schema caster of the field
+
+        Returns:
+            Tuple[str, Any]: Filter key and MongoDB sub filter
+        """
+        try:
+            if operator in ("=", "!=") and value.find(",") > -1:
+                casted_list_item = [cast(item) for item in value.split(",")]
+                return key, {"$in" if operator == "=" else "$nin": casted_list_item}
+
+            casted_value = cast(value)
+        except Exception as err:
+            raise SchemaError(f"Fail to cast {value} of field {key}") from err
+
+        if operator == "=":
+            return key, casted_value
+        return key, {self.mongodb_operator[operator]: casted_value}
 
     def cast_value_logic(self, value: str) -> Any:
         """Cast value into right type.
@@ -190,24 +404,48 @@ class MongoDBQueriesManager:
         Returns:
             Any: Cast value
         """
-        if self.custom_cast_dict is not None:
-            for rule, func in self.custom_cast_dict.items():
-                if value.startswith(f"{rule}(") and value.endswith(")"):
-                    try:
-                        casted_value = func(value.replace(f"{rule}(", "")[:-1])
-                    except Exception as err:
-                        raise CustomCasterFail(f"Fail to cast {value} with caster {rule}") from err
-
-                    return casted_value
-
-        for regex, cast in self.regex_dict.items():
-            if isinstance(regex, Pattern):
-                if regex.match(value):
-                    return cast(value)
-            elif regex == value.lower():
-                return cast(value)
+        if self._custom_casters and value.endswith(")"):
+            # Custom caster format: 'rule(value)'
+            rule, separator, sub_value = value[:-1].partition("(")
+            if separator and rule in self._custom_casters:
+                func, pure = self._custom_casters[rule]
+                if not pure:
+                    volatile_cast.set(True)
+
+                try:
+                    return func(sub_value)
+                except Exception as err:
+                    raise CustomCasterFail(f"Fail to cast {value} with caster {rule}") from err
+
+        match = self.type_regex.match(value)
+        if match is not None:
+            return self.type_casts[match.lastgroup](value)  # type: ignore[index]
+
+        lower_value = value.lower()
+        if lower_value in self.constant_values:
+            return self.constant_values[lower_value]
         return value
 
+    @classmethod
+    def split_operation(cls, operation: str) -> tuple[str, str, str]:
+        """Split a query operation into key, operator and value.
+
+        Notes:
+            Operators are searched by order of precedence (ie, 'price>=5' -> ('price', '>=', '5')).
+            Without operator, the whole operation is returned as value (ie, 'phone' -> ('', '', 'phone')).
+
+        Args:
+            operation (str): Query operation (ie, 'name=John')
+
+        Returns:
+            Tuple[str, str, str]: Key, operator and value of the operation
+        """
+        for operator in cls.operators:
+            index = operation.find(operator)
+            if index > -1:
+                return operation[:index], operator, operation[index + len(operator) :]
+        return "", "", operation
+
     @staticmethod
     def find_operator(filter_params: str) -> str:
         """Return the right operator.
@@ -218,7 +456,7 @@ class MongoDBQueriesManager:
         Returns:
             str: Return operator
         """
-        for operator in ["<=", ">=", "!=", "=", ">", "<", "!"]:
+        for operator in MongoDBQueriesManager.operators:
             if filter_params.find(operator) > -1:
                 return operator
         return ""
@@ -379,6 +617,9 @@ class MongoDBQueriesManager:
             if param.startswith("-"):
                 projection_params_final[param[1:]] = 0
             elif param.startswith("{") and param.endswith("}"):
+                # Imported on first json projection only (cold start).
+                import json  # noqa: PLC0415
+
                 try:
                     json_value = json.loads(param)
                     projection_params_final[next(iter(json_value))] = json_value[next(iter(json_value))]
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Filter optimizer module.
+
+This module contain the simplification of the predicates of a parsed filter (tightest bounds, single value lists,
+duplicates) and the detection of the filters which can't match any document.
+"""
+
+from __future__ import annotations
+
+__all__ = ["OptimizedFilter", "optimize_filter", "optimize_predicates"]
+
+from collections.abc import Collection, Hashable, Iterable, Mapping
+from re import Pattern
+from typing import Any, NamedTuple
+
+from mongo_queries_manager.helpers import merge_sub_filter
+
+# Number types, compared by value (bool is a different BSON type).
+_NUMBER_TYPES = frozenset({int, float})
+
+# Values types which aren't compared (regex, embedded documents and arrays), with the unhashable values.
+_UNOPTIMIZABLE_TYPES = (Pattern, dict, list)
+
+# Condition of a field which can't match any document.
+EMPTY_CONDITION: dict[str, Any] = {"$in": []}
+
+
+class OptimizedFilter(NamedTuple):
+    """Result of a filter optimization.
+
+    Attributes:
+        filter (Dict[str, Any]): Optimized filter, an impossible condition is replaced by {'$in': []}.
+        empty (bool): True if the filter provably doesn't match any document.
+    """
+
+    filter: dict[str, Any]
+    empty: bool
+
+
+class _Unoptimizable(Exception):
+    """Raised when the conditions of a field can't be optimized (ie, regex or not comparable values)."""
+
+
+class _Contradiction(Exception):
+    """Raised when the conditions of a field can't match any value."""
+
+
+class _ExistsContradiction(_Contradiction):
+    """Raised when the conditions of a field contradict its $exists, whatever the field (scalar or array)."""
+
+
+def _is_number(value: Any) -> bool:
+    """Check if a value is a number (bool is a different BSON type)."""
+    return type(value) in _NUMBER_TYPES
+
+
+def _key(value: Any) -> Hashable:
+    """Typed key of a value, True and 1 are different values for MongoDB (5 and 5.0 are the same).
+
+    Args:
+        value (Any): Value.
+
+    Returns:
+        Hashable: Typed key.
+    """
+    if isinstance(value, _UNOPTIMIZABLE_TYPES) or not isinstance(value, Hashable):
+        raise _Unoptimizable
+    # Numbers are compared by value (ie, 5 and 5.0).
+    return ("number" if _is_number(value) else type(value)), value
+
+
+def _is_simple(condition: Any) -> bool:
+    """Check if a condition can't be simplified alone (a value or a single operator, except a values list).
+
+    Args:
+        condition (Any): Condition of a field.
+
+    Returns:
+        bool: True if the condition is kept as is.
+    """
+    if not isinstance(condition, dict):
+        return True
+    return len(condition) == 1 and "$in" not in condition and "$nin" not in condition
+
+
+def _compare(value: Any, other: Any) -> int:
+    """Compare two values of the same BSON type.
+
+    Args:
+        value (Any): Value.
+        other (Any): Other value.
+
+    Returns:
+        int: -1, 0 or 1 if value is lower than, equal to or greater than other.
+    """
+    if not (type(value) is type(other) or (_is_number(value) and _is_number(other))) or value is None:
+        raise _Unoptimizable
+    try:
+        return int(value > other) - int(value < other)
+    except TypeError as err:
+        # ie, naive and aware datetimes
+        raise _Unoptimizable from err
+
+
+class _FieldConditions:
+    """Predicates of a field, collected from its conditions then resolved into a single condition.
+
+    Notes:
+        The predicates of an array field can be matched by different items: only the predicates of the same kind are
+        combined (equalities, a `$in`, `$ne` / `$nin`, or bounds of each side).
+    """
+
+    __slots__ = ("eq", "exists", "in_count", "in_values", "lower", "ne", "others", "scalar", "upper")
+
+    def __init__(self, scalar: bool) -> None:
+        """Initialize _FieldConditions class.
+
+        Args:
+            scalar (bool): The field is a scalar (not an array).
+        """
+        self.scalar = scalar
+        self.in_count = 0
+        self.eq: dict[Hashable, Any] = {}
+        self.ne: dict[Hashable, Any] = {}
+        self.in_values: dict[Hashable, Any] | None = None
+        self.lower: tuple[Any, bool] | None = None
+        self.upper: tuple[Any, bool] | None = None
+        self.exists: bool | None = None
+        self.others: dict[str, Any] = {}
+
+    def add(self, condition: Any) -> None:
+        """Add the predicates of a condition (ie, 'sent' or {'$gt': 5, '$lt': 10}).
+
+        Args:
+            condition (Any): Condition of the field.
+        """
+        is_operator_dict = isinstance(condition, dict) and all(str(key).startswith("$") for key in condition)
+        for operator, operand in condition.items() if is_operator_dict and condition else (("$eq", condition),):
+            if operator == "$eq":
+                self.eq[_key(operand)] = operand
+            elif operator == "$ne":
+                self.ne[_key(operand)] = operand
+            elif operator in ("$in", "$nin") and isinstance(operand, list):
+                values = {_key(value): value for value in operand}
+                self.in_count += operator == "$in"
+                if operator == "$nin":
+                    self.ne.update(values)
+                elif self.in_values is None:
+                    self.in_values = values
+                else:
+                    self.in_values = {key: value for key, value in self.in_values.items() if key in values}
+            elif operator in ("$gt", "$gte", "$lt", "$lte"):
+                self._add_bound(operator, operand)
+            elif operator == "$exists":
+                if self.exists is not None and self.exists != bool(operand):
+                    raise _ExistsContradiction
+                self.exists = bool(operand)
+            else:
+                # Same merge as the parser, the last operand wins.
+                self.others[operator] = operand
+
+    def _add_bound(self, operator: str, operand: Any) -> None:
+        """Add a bound predicate, the tightest bound of each side is kept.
+
+        Args:
+            operator (str): Range operator (ie, '$gte').
+            operand (Any): Bound value.
+        """
+        if operand is None:
+            # Null bounds match missing fields.
+            raise _Unoptimizable
+        if operator in ("$gt", "$gte"):
+            self.lower = self._tightest(self.lower, (operand, operator == "$gte"), direction=1)
+        else:
+            self.upper = self._tightest(self.upper, (operand, operator == "$lte"), direction=-1)
+
+    @staticmethod
+    def _tightest(bound: tuple[Any, bool] | None, other: tuple[Any, bool], direction: int) -> tuple[Any, bool]:
+        """Return the tightest of two bounds of the same side.
+
+        Args:
+            bound (Optional[Tuple[Any, bool]]): Current bound (value, inclusive).
+            other (Tuple[Any, bool]): Other bound (value, inclusive).
+            direction (int): 1 for lower bounds, -1 for upper bounds.
+
+        Returns:
+            Tuple[Any, bool]: Tightest bound.
+        """
+        if bound is None:
+            return other
+        comparison = _compare(other[0], bound[0]) * direction
+        if comparison > 0 or (comparison == 0 and not other[1]):
+            return other
+        return bound
+
+    def _in_range(self, value: Any) -> bool:
+        """Check if a value is into the bounds."""
+        if self.lower is not None:
+            comparison = _compare(value, self.lower[0])
+            if comparison < 0 or (comparison == 0 and not self.lower[1]):
+                return False
+        if self.upper is not None:
+            comparison = _compare(value, self.upper[0])
+            if comparison > 0 or (comparison == 0 and not self.upper[1]):
+                return False
+        return True
+
+    def _may_be_in_range(self, value: Any) -> bool:
+        """Check if a value may be into the bounds, a value of another type is kept."""
+        try:
+            return self._in_range(value)
+        except _Unoptimizable:
+            return True
+
+    def resolve(self) -> Any:
+        """Resolve the predicates into a single condition.
+
+        Returns:
+            Any: Condition, a value for an equality.
+        """
+        # A missing field only matches null equalities, $ne and $nin (array or not).
+        if self.exists is False and (
+            self.lower is not None
+            or self.upper is not None
+            or any(value is not None for value in self.eq.values())
+            or (self.in_values is not None and all(value is not None for value in self.in_values.values()))
+        ):
+            raise _ExistsContradiction
+
+        if not self.scalar:
+            kinds = (len(self.eq), self.in_count, bool(self.ne), self.lower is not None or self.upper is not None)
+            if sum(kinds) > 1:
+                raise _Unoptimizable
+
+        if len(self.eq) > 1:
+            raise _Contradiction
+
+        # Candidate values of an equality / $in, filtered by the other predicates.
+        if self.eq and self.in_values is not None:
+            candidates: dict[Hashable, Any] | None = {
+                key: value for key, value in self.eq.items() if key in self.in_values
+            }
+        else:
+            candidates = self.eq or self.in_values
+
+        if candidates is None:
+            condition = self._range_condition()
+        else:
+            values = [
+                value
+                for key, value in candidates.items()
+                if key not in self.ne and self._in_range(value) and (self.exists is not False or value is None)
+            ]
+            if not values:
+                raise _Contradiction
+            condition = {"$eq": values[0]} if len(values) == 1 else {"$in": values}
+            if self.exists is not None and None in values:
+                condition["$exists"] = self.exists
+
+        condition.update(self.others)
+        return condition["$eq"] if list(condition) == ["$eq"] else condition
+
+    def _range_condition(self) -> dict[str, Any]:
+        """Resolve the bounds, $ne / $nin and $exists predicates (without equality).
+
+        Returns:
+            Dict[str, Any]: Condition.
+        """
+        condition: dict[str, Any] = {}
+        if self.lower is not None and self.upper is not None:
+            comparison = _compare(self.lower[0], self.upper[0])
+            if comparison > 0 or (comparison == 0 and not (self.lower[1] and self.upper[1])):
+                raise _Contradiction
+            if comparison == 0 and self.scalar:
+                # Single value range (ie, 'price>=5&price<=5').
+                if _key(self.lower[0]) in self.ne or self.exists is False:
+                    raise _Contradiction
+                return {"$eq": self.lower[0]}
+
+        if self.lower is not None:
+            condition["$gte" if self.lower[1] else "$gt"] = self.lower[0]
+        if self.upper is not None:
+            condition["$lte" if self.upper[1] else "$lt"] = self.upper[0]
+        # Bounds (not null) don't match missing fields.
+        has_bounds = bool(condition)
+        if has_bounds and self.exists is False:
+            raise _Contradiction
+
+        # Excluded values out of the bounds are redundant.
+        ne_values = [value for value in self.ne.values() if not has_bounds or self._may_be_in_range(value)]
+        if len(ne_values) == 1:
+            condition["$ne"] = ne_values[0]
+        elif ne_values:
+            condition["$nin"] = ne_values
+        if self.exists is False or (self.exists and not has_bounds):
+            condition["$exists"] = self.exists
+        return condition
+
+
+def optimize_predicates(
+    predicates: Iterable[tuple[str, Any, str]], scalar_fields: Collection[str] = ()
+) -> OptimizedFilter:
+    """Combine the predicates of a filter, the conditions of a repeated key are merged and simplified.
+
+    Notes:
+        Two predicates of an array field can be matched by two different items (ie, 'tags>5&tags<3' matches
+        [1, 10]): only the scalar fields have range and equality contradictions (an empty filter) and combined
+        predicates of different kinds, the conditions of the other fields are merged as the parser does. A field which
+        must not exist ($exists: false) can't match a value predicate, the contradiction applies to every field.
+        Fields with regex, not comparable values or unknown operators are merged as the parser does.
+
+    Args:
+        predicates (Iterable[Tuple[str, Any, str]]): Filter key, condition and query operation (used into errors).
+        scalar_fields (Collection[str]): Fields known to be scalar (not arrays), ie the scalar fields of a schema.
+
+    Returns:
+        OptimizedFilter: Optimized filter, and True if it provably doesn't match any document.
+    """
+    conditions: dict[str, list[tuple[Any, str]]] = {}
+    for key, condition, operation in predicates:
+        conditions.setdefault(key, []).append((condition, operation))
+
+    optimized_filter: dict[str, Any] = {}
+    empty = False
+    for key, key_conditions in conditions.items():
+        if key.startswith("$"):
+            # Top level operators ($text / $or) are kept as is.
+            for condition, operation in key_conditions:
+                merge_sub_filter(optimized_filter, key, condition, operation)
+            continue
+
+        if len(key_conditions) == 1 and _is_simple(key_conditions[0][0]):
+            optimized_filter[key] = key_conditions[0][0]
+            continue
+
+        field_conditions = _FieldConditions(scalar=key in scalar_fields)
+        try:
+            for condition, _ in key_conditions:
+                field_conditions.add(condition)
+            optimized_filter[key] = field_conditions.resolve()
+        except _Contradiction as err:
+            if field_conditions.scalar or isinstance(err, _ExistsContradiction):
+                optimized_filter[key] = dict(EMPTY_CONDITION)
+                empty = True
+            else:
+                for condition, operation in key_conditions:
+                    merge_sub_filter(optimized_filter, key, condition, operation)
+        except _Unoptimizable:
+            for condition, operation in key_conditions:
+                merge_sub_filter(optimized_filter, key, condition, operation)
+    return OptimizedFilter(optimized_filter, empty)
+
+
+def optimize_filter(mongodb_filter: Mapping[str, Any], scalar_fields: Collection[str] = ()) -> OptimizedFilter:
+    """Optimize a parsed filter (see `optimize_predicates`).
+
+    Notes:
+        A parsed filter has already merged its repeated keys (the last operand wins), use `QueryParser(optimize=True)`
+        to combine all the predicates of the string query.
+
+    Args:
+        mongodb_filter (Mapping[str, Any]): Filter from `mqm()` / `QueryParser.parse()`.
+        scalar_fields (Collection[str]): Fields known to be scalar (not arrays).
+
+    Returns:
+        OptimizedFilter: Optimized filter, and True if it provably doesn't match any document.
+    """
+    return optimize_predicates(((key, condition, key) for key, condition in mongodb_filter.items()), scalar_fields)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Keyset pagination module.
+
+This module contain the page tokens encoding and the range filters used instead of `skip` (keyset pagination),
+a page is found with the index whatever its depth.
+"""
+
+from __future__ import annotations
+
+__all__ = ["decode_page_token", "encode_page_token", "keyset_filter", "keyset_sort"]
+
+import base64
+import binascii
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from mongo_queries_manager.mongodb_queries_manager import ASCENDING, PaginationError
+
+# Tie-breaker key, always unique.
+TIE_BREAKER = "_id"
+
+
+def keyset_sort(sort: list[tuple[str, int]] | None, reverse: bool = False) -> list[tuple[str, int]]:
+    """Add the tie-breaker key to a sort, pages must be in a total order.
+
+    Args:
+        sort (Optional[List[Tuple[str, int]]]): Sort from `sort_logic`.
+        reverse (bool): Reverse all the sort directions (ie, 'before' page).
+
+    Returns:
+        List[Tuple[str, int]]: Sort with the tie-breaker key.
+    """
+    keyset = list(sort or [])
+    if all(key != TIE_BREAKER for key, _ in keyset):
+        keyset.append((TIE_BREAKER, ASCENDING))
+    return [(key, -direction) for key, direction in keyset] if reverse else keyset
+
+
+def _get_field(document: Mapping[str, Any], field: str) -> Any:
+    """Get a dotted field value of a document.
+
+    Args:
+        document (Mapping[str, Any]): Document.
+        field (str): Dotted field path.
+
+    Returns:
+        Any: Field value, None if missing.
+    """
+    value: Any = document
+    for part in field.split("."):
+        if not isinstance(value, Mapping):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode a BSON value not supported by JSON (`json.dumps` default hook).
+
+    Args:
+        value (Any): BSON value.
+
+    Returns:
+        Any: Tagged value (ie, {'$date': '2016-01-01T00:00:00'}).
+    """
+    if isinstance(value, datetime):
+        return {"$date": value.isoformat()}
+    if type(value).__name__ == "ObjectId":
+        return {"$oid": str(value)}
+    raise PaginationError(f"Fail to encode {value!r} into page token")
+
+
+def _decode_value(value: dict[str, Any]) -> Any:
+    """Decode a tagged BSON value (`json.loads` object hook).
+
+    Args:
+        value (Dict[str, Any]): JSON object.
+
+    Returns:
+        Any: BSON value.
+    """
+    if value.keys() == {"$date"}:
+        return datetime.fromisoformat(value["$date"])
+    if value.keys() == {"$oid"}:
+        try:
+            from bson import ObjectId  # noqa: PLC0415
+        except ModuleNotFoundError as err:
+            raise PaginationError("Fail to decode page token ObjectId, pymongo is required") from err
+        if not ObjectId.is_valid(value["$oid"]):
+            raise PaginationError(f"Fail to decode page token ObjectId {value['$oid']}")
+        return ObjectId(value["$oid"])
+    return value
+
+
+def encode_page_token(document: Mapping[str, Any], sort: list[tuple[str, int]] | None) -> str:
+    """Encode the page token of a document, used as 'after' (next page) or 'before' (previous page) argument.
+
+    Args:
+        document (Mapping[str, Any]): Last document of a page (or first one for the previous page).
+        sort (Optional[List[Tuple[str, int]]]): Sort of the page query.
+
+    Returns:
+        str: URL safe page token.
+    """
+    import json  # noqa: PLC0415
+
+    keys = [[key, _get_field(document, key)] for key, _ in keyset_sort(sort)]
+    token = json.dumps(keys, default=_encode_value, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(token).rstrip(b"=").decode()
+
+
+def decode_page_token(token: str) -> list[tuple[str, Any]]:
+    """Decode a page token.
+
+    Args:
+        token (str): URL safe page token.
+
+    Returns:
+        List[Tuple[str, Any]]: Sort keys with their values.
+    """
+    import json  # noqa: PLC0415
+
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)), object_hook=_decode_value)
+        if not isinstance(keys, list) or not all(isinstance(key, list) and len(key) == 2 for key in keys):  # noqa: PLR2004
+            raise ValueError("Page token must be a list of [key, value]")
+    except (binascii.Error, ValueError, TypeError) as err:
+        raise PaginationError(f"Fail to decode page token {token}") from err
+    return [(key, value) for key, value in keys]
+
+
+def keyset_filter(sort: list[tuple[str, int]], keys: list[tuple[str, Any]], before: bool = False) -> dict[str, Any]:
+    """Build the range filter of the documents after (or before) the page token keys.
+
+    Notes:
+        For 'created_at' descending and '_id' ascending, after (date, id):
+        {'$or': [{'created_at': {'$lt': date}}, {'created_at': None}, {'created_at': date, '_id': {'$gt': id}}]}
+
+        Null and missing values sort first, but range operators don't match them (type bracketing): a '$lt' branch
+        has a null branch (except the tie-breaker), a null key has no '$lt' branch and its '$gt' branch is '$ne' null.
+
+    Args:
+        sort (List[Tuple[str, int]]): Keyset sort from `keyset_sort` (not reversed).
+        keys (List[Tuple[str, Any]]): Decoded page token keys.
+        before (bool): Filter documents before the keys, instead of after.
+
+    Returns:
+        Dict[str, Any]: MongoDB filter.
+    """
+    if [key for key, _ in sort] != [key for key, _ in keys]:
+        raise PaginationError("Page token doesn't match the query sort")
+
+    branches: list[dict[str, Any]] = []
+    for index, (key, direction) in enumerate(sort):
+        prefix, value = dict(keys[:index]), keys[index][1]
+        if (direction == ASCENDING) != before:
+            branches.append({**prefix, key: {"$gt": value} if value is not None else {"$ne": None}})
+        elif value is not None:
+            branches.append({**prefix, key: {"$lt": value}})
+            if key != TIE_BREAKER:
+                branches.append({**prefix, key: None})
+    return {"$or": branches}
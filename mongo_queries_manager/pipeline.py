@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Aggregation pipeline module.
+
+This module contain the conversion of a parsed query into a single aggregation pipeline, the population is done with
+`$lookup` stages (instead of one query per populated document).
+"""
+
+from __future__ import annotations
+
+__all__ = ["to_pipeline"]
+
+from collections.abc import Mapping
+from typing import Any
+
+from mongo_queries_manager.helpers import ensure_population_paths
+
+# Prefix of the temporary fields used to unwrap single references.
+LOOKUP_FIELD_PREFIX = "_lookup_"
+
+
+def _lookup_stages(
+    population: list[dict[str, Any]], collections: dict[str, str], parent_path: str = ""
+) -> list[dict[str, Any]]:
+    """Build the `$lookup` stages of a population level, with a sub pipeline per populated path.
+
+    Notes:
+        A reference is replaced by its document, a list of references by the list of documents.
+
+    Args:
+        population (List[Dict[str, Any]]): Population of the level.
+        collections (Dict[str, str]): Collection name by population path (from the root, ie, 'user.settings').
+        parent_path (str): Population path of the level, empty at the root.
+
+    Returns:
+        List[Dict[str, Any]]: Aggregation pipeline stages.
+    """
+    stages: list[dict[str, Any]] = []
+    for item in population:
+        path = item["path"]
+        full_path = f"{parent_path}.{path}" if parent_path else path
+        sub_population = item.get("population")
+
+        sub_pipeline: list[dict[str, Any]] = []
+        projection = ensure_population_paths(item["projection"], sub_population)
+        if projection:
+            sub_pipeline.append({"$project": projection})
+        if sub_population:
+            sub_pipeline.extend(_lookup_stages(sub_population, collections, parent_path=full_path))
+
+        lookup_field = LOOKUP_FIELD_PREFIX + path.replace(".", "_")
+        stages.append(
+            {
+                "$lookup": {
+                    "from": collections.get(full_path, path.rsplit(".", 1)[-1]),
+                    "localField": path,
+                    "foreignField": "_id",
+                    "pipeline": sub_pipeline,
+                    "as": lookup_field,
+                }
+            }
+        )
+        stages.append(
+            {
+                "$set": {
+                    path: {
+                        "$cond": {
+                            "if": {"$isArray": f"${path}"},
+                            "then": f"${lookup_field}",
+                            "else": {"$arrayElemAt": [f"${lookup_field}", 0]},
+                        }
+                    }
+                }
+            }
+        )
+        stages.append({"$unset": lookup_field})
+    return stages
+
+
+def to_pipeline(mongodb_query: Mapping[str, Any], collections: dict[str, str] | None = None) -> list[dict[str, Any]]:
+    """Convert a parsed query into an aggregation pipeline (`collection.aggregate(pipeline)`).
+
+    Notes:
+        Stages order: $match, $sort, $skip, $limit, $project then $lookup (only the returned page is populated).
+        Population paths are kept by inclusion projections. JSON projections (ie, '$slice') are used as is.
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Query from `mqm()` / `QueryParser.parse()` (or a `MongoQuery`).
+        collections (Optional[Dict[str, str]]): Collection name by population path (from the root, ie,
+            'user.settings'), default to the last part of the path.
+
+    Returns:
+        List[Dict[str, Any]]: Aggregation pipeline.
+    """
+    pipeline: list[dict[str, Any]] = []
+    if mongodb_query["filter"]:
+        pipeline.append({"$match": mongodb_query["filter"]})
+    if mongodb_query["sort"]:
+        pipeline.append({"$sort": dict(mongodb_query["sort"])})
+    if mongodb_query["skip"]:
+        pipeline.append({"$skip": mongodb_query["skip"]})
+    if mongodb_query["limit"]:
+        pipeline.append({"$limit": mongodb_query["limit"]})
+
+    population = mongodb_query.get("population")
+    projection = ensure_population_paths(mongodb_query["projection"], population)
+    if projection:
+        pipeline.append({"$project": projection})
+    if population:
+        pipeline.extend(_lookup_stages(population, collections or {}))
+    return pipeline
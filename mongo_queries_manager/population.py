@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Population executor module.
+
+This module contain the population of the documents found with a parsed query (`populate=True`), with one `$in`
+query per populated path and level instead of one query per document (N+1 queries).
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "AsyncFindCollection",
+    "FindCollection",
+    "find_populated",
+    "find_populated_async",
+    "populate_documents",
+    "populate_documents_async",
+    "projection_key",
+]
+
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, Protocol
+
+from mongo_queries_manager.execution import EXECUTION_KEYS
+from mongo_queries_manager.helpers import chunked, ensure_population_paths
+
+if TYPE_CHECKING:
+    from mongo_queries_manager.cache import DocumentCache
+    from mongo_queries_manager.loader import PopulationLoader
+
+# Number of ids per `$in` query, a rough stand-in for the BSON document size limit (16MB): the ids aren't measured.
+# About 1MB of ObjectId (~20 bytes per array item), ids over ~250 bytes (ie, long strings or compound ids) need a
+# smaller `chunk_size`.
+DEFAULT_CHUNK_SIZE = 50000
+
+
+class FindCollection(Protocol):
+    """Collection interface used by the executor (ie, `pymongo.collection.Collection`)."""
+
+    name: str
+
+    def find(self, *args: Any, **kwargs: Any) -> Iterable[dict[str, Any]]:
+        """Find documents (`find(filter, projection=..., ...)`)."""
+
+
+class AsyncCursor(Protocol):
+    """Cursor interface used by the async executor (ie, Motor / PyMongo async cursor)."""
+
+    def to_list(self, length: int | None) -> Awaitable[list[dict[str, Any]]]:
+        """Fetch all the documents of the cursor."""
+
+
+class AsyncFindCollection(Protocol):
+    """Collection interface used by the async executor (ie, Motor / PyMongo async collection)."""
+
+    name: str
+
+    def find(self, *args: Any, **kwargs: Any) -> AsyncCursor:
+        """Find documents (`find(filter, projection=..., ...)`)."""
+
+
+# Return the collection of a population path from the root (ie, 'user.settings').
+CollectionResolver = Callable[[str], FindCollection]
+AsyncCollectionResolver = Callable[[str], AsyncFindCollection]
+
+
+def _level_projection(item: dict[str, Any]) -> tuple[dict[str, Any] | None, bool]:
+    """Build the projection of a population level query, '_id' is always returned to map the documents.
+
+    Args:
+        item (Dict[str, Any]): Population item (ie, {'path': 'user', 'projection': {'name': 1}}).
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], bool]: Query projection, True if '_id' must be removed from the documents.
+    """
+    projection = ensure_population_paths(item["projection"], item.get("population"))
+    if not projection or projection.get("_id", 1):
+        return projection, False
+    return {key: value for key, value in projection.items() if key != "_id"} or None, True
+
+
+def projection_key(projection: dict[str, Any] | None) -> str:
+    """Build a key of a projection, documents found with the same projection have the same key.
+
+    Args:
+        projection (Optional[Dict[str, Any]]): Query projection.
+
+    Returns:
+        str: Projection key.
+    """
+    return repr(sorted(projection.items())) if projection else ""
+
+
+def _cached_references(
+    cache: DocumentCache | None, collection: FindCollection | AsyncFindCollection, ids: list[Any], projection_id: str
+) -> tuple[dict[Any, dict[str, Any]], list[Any]]:
+    """Get the cached referenced documents, with the ids to query.
+
+    Args:
+        cache (Optional[DocumentCache]): Cache of the populated documents.
+        collection (Union[FindCollection, AsyncFindCollection]): Collection of the references.
+        ids (List[Any]): Referenced ids.
+        projection_id (str): Projection key of the level.
+
+    Returns:
+        Tuple[Dict[Any, Dict[str, Any]], List[Any]]: Cached documents by id, missing ids.
+    """
+    if cache is None:
+        return {}, ids
+
+    references = cache.get_many(collection.name, ids, projection_id)
+    return references, [item for item in ids if item not in references]
+
+
+def _collect_ids(documents: Iterable[dict[str, Any]], path: str) -> list[Any]:
+    """Collect the referenced ids of a path, deduplicated.
+
+    Args:
+        documents (Iterable[Dict[str, Any]]): Documents of the level.
+        path (str): Populated path.
+
+    Returns:
+        List[Any]: Referenced ids, in order of appearance.
+    """
+    ids: dict[Any, None] = {}
+    for document in documents:
+        reference = document.get(path)
+        if isinstance(reference, list):
+            ids.update(dict.fromkeys(reference))
+        elif reference is not None:
+            ids[reference] = None
+    return list(ids)
+
+
+def _set_references(
+    documents: Iterable[dict[str, Any]], path: str, references: dict[Any, dict[str, Any]], exclude_id: bool
+) -> None:
+    """Replace the references of a path by their documents (missing references are removed / set to None).
+
+    Args:
+        documents (Iterable[Dict[str, Any]]): Documents of the level, updated in place.
+        path (str): Populated path.
+        references (Dict[Any, Dict[str, Any]]): Referenced documents by id.
+        exclude_id (bool): Remove '_id' from the referenced documents (excluded by the projection).
+    """
+    for document in documents:
+        reference = document.get(path)
+        if isinstance(reference, list):
+            document[path] = [references[item] for item in reference if item in references]
+        elif reference is not None:
+            document[path] = references.get(reference)
+
+    if exclude_id:
+        for reference_document in references.values():
+            reference_document.pop("_id", None)
+
+
+def populate_documents(  # noqa: PLR0913
+    documents: list[dict[str, Any]],
+    population: list[dict[str, Any]] | None,
+    resolver: CollectionResolver,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parent_path: str = "",
+    *,
+    cache: DocumentCache | None = None,
+) -> None:
+    """Populate documents in place, with one `$in` query (per chunk of ids) per populated path and level.
+
+    Args:
+        documents (List[Dict[str, Any]]): Documents to populate, updated in place.
+        population (Optional[List[Dict[str, Any]]]): Population from `mqm(..., populate=True)`.
+        resolver (CollectionResolver): Return the collection of a population path from the root (ie, 'user.settings').
+        chunk_size (int): Maximum number of ids per `$in` query, a count and not a size (see `DEFAULT_CHUNK_SIZE`).
+        parent_path (str): Population path of the documents, empty at the root.
+        cache (Optional[DocumentCache]): Cache of the populated documents, only the missing ones are queried.
+    """
+    for item in population or []:
+        path = item["path"]
+        full_path = f"{parent_path}.{path}" if parent_path else path
+        ids = _collect_ids(documents, path)
+        if not ids:
+            continue
+
+        collection = resolver(full_path)
+        projection, exclude_id = _level_projection(item)
+        projection_id = projection_key(projection)
+        references, missing_ids = _cached_references(cache, collection, ids, projection_id)
+        found_references: dict[Any, dict[str, Any]] = {}
+        for chunk in chunked(missing_ids, chunk_size):
+            for reference_document in collection.find({"_id": {"$in": chunk}}, projection=projection):
+                found_references[reference_document["_id"]] = reference_document
+        if cache is not None and found_references:
+            cache.set_many(collection.name, found_references, projection_id)
+        references.update(found_references)
+
+        if item.get("population"):
+            populate_documents(
+                list(references.values()),
+                item["population"],
+                resolver,
+                chunk_size=chunk_size,
+                parent_path=full_path,
+                cache=cache,
+            )
+        _set_references(documents, path, references, exclude_id)
+
+
+def _find_kwargs(mongodb_query: dict[str, Any]) -> dict[str, Any]:
+    """Return the keyword arguments of the `find` of a parsed query, without its filter.
+
+    Args:
+        mongodb_query (Dict[str, Any]): Query from `mqm(..., populate=True)` / `QueryParser.parse()`.
+
+    Returns:
+        Dict[str, Any]: Projection (with the populated paths), sort, skip and limit, with collation and execution
+            options if set.
+    """
+    find_kwargs = {
+        "projection": ensure_population_paths(mongodb_query["projection"], mongodb_query.get("population")),
+        "sort": mongodb_query["sort"],
+        "skip": mongodb_query["skip"],
+        "limit": mongodb_query["limit"],
+    }
+    if mongodb_query.get("collation") is not None:
+        find_kwargs["collation"] = mongodb_query["collation"]
+    for key in EXECUTION_KEYS:
+        if key in mongodb_query:
+            find_kwargs[key] = mongodb_query[key]
+    return find_kwargs
+
+
+def find_populated(
+    collection: FindCollection,
+    mongodb_query: dict[str, Any],
+    resolver: CollectionResolver,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    *,
+    cache: DocumentCache | None = None,
+) -> list[dict[str, Any]]:
+    """Find the documents of a parsed query (with its collation and execution options), then populate them.
+
+    Args:
+        collection (FindCollection): Collection of the query.
+        mongodb_query (Dict[str, Any]): Query from `mqm(..., populate=True)` / `QueryParser.parse()`.
+        resolver (CollectionResolver): Return the collection of a population path from the root (ie, 'user.settings').
+        chunk_size (int): Maximum number of ids per `$in` query, a count and not a size (see `DEFAULT_CHUNK_SIZE`).
+        cache (Optional[DocumentCache]): Cache of the populated documents, only the missing ones are queried.
+
+    Returns:
+        List[Dict[str, Any]]: Populated documents.
+    """
+    documents = list(collection.find(mongodb_query["filter"], **_find_kwargs(mongodb_query)))
+    populate_documents(documents, mongodb_query.get("population"), resolver, chunk_size=chunk_size, cache=cache)
+    return documents
+
+
+async def _gather(coroutines: Iterable[Coroutine[Any, Any, Any]]) -> list[Any]:
+    """Run coroutines concurrently, the remaining ones are cancelled if one of them fails (or if cancelled).
+
+    Args:
+        coroutines (Iterable[Coroutine]): Coroutines to run.
+
+    Returns:
+        List[Any]: Coroutines results, in order.
+    """
+    # Imported by the async executor only (cold start of the sync API).
+    import asyncio  # noqa: PLC0415
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _find_async(
+    collection: AsyncFindCollection,
+    ids: list[Any],
+    projection: dict[str, Any] | None,
+    limiter: AbstractAsyncContextManager[Any],
+    loader: PopulationLoader | None,
+) -> list[dict[str, Any]]:
+    """Find the documents of a chunk of ids, limited by the concurrency limiter.
+
+    Args:
+        collection (AsyncFindCollection): Collection of the references.
+        ids (List[Any]): Chunk of ids.
+        projection (Optional[Dict[str, Any]]): Query projection.
+        limiter (AbstractAsyncContextManager): Concurrency limit (semaphore).
+        loader (Optional[PopulationLoader]): Batch the query with the ones of the other requests.
+
+    Returns:
+        List[Dict[str, Any]]: Found documents.
+    """
+    async with limiter:
+        if loader is not None:
+            return await loader.load(collection, ids, projection)
+        return await collection.find({"_id": {"$in": ids}}, projection=projection).to_list(None)
+
+
+async def _populate_item_async(  # noqa: PLR0913
+    documents: list[dict[str, Any]],
+    item: dict[str, Any],
+    resolver: AsyncCollectionResolver,
+    *,
+    chunk_size: int,
+    limiter: AbstractAsyncContextManager[Any],
+    loader: PopulationLoader | None,
+    cache: DocumentCache | None,
+    parent_path: str,
+) -> None:
+    """Populate a path of documents in place, then its sub population as soon as the path documents are found.
+
+    Args:
+        documents (List[Dict[str, Any]]): Documents to populate, updated in place.
+        item (Dict[str, Any]): Population item.
+        resolver (AsyncCollectionResolver): Return the collection of a population path from the root.
+        chunk_size (int): Maximum number of ids per `$in` query, a count and not a size (see `DEFAULT_CHUNK_SIZE`).
+        limiter (AbstractAsyncContextManager): Concurrency limit of the queries (semaphore).
+        loader (Optional[PopulationLoader]): Batch the queries with the ones of the other requests.
+        cache (Optional[DocumentCache]): Cache of the populated documents, only the missing ones are queried.
+        parent_path (str): Population path of the documents, empty at the root.
+    """
+    path = item["path"]
+    full_path = f"{parent_path}.{path}" if parent_path else path
+    ids = _collect_ids(documents, path)
+    if not ids:
+        return
+
+    collection = resolver(full_path)
+    projection, exclude_id = _level_projection(item)
+    projection_id = projection_key(projection)
+    references, missing_ids = _cached_references(cache, collection, ids, projection_id)
+    found_references: dict[Any, dict[str, Any]] = {}
+    for chunk_documents in await _gather(
+        _find_async(collection, chunk, projection, limiter, loader) for chunk in chunked(missing_ids, chunk_size)
+    ):
+        for reference_document in chunk_documents:
+            found_references[reference_document["_id"]] = reference_document
+    if cache is not None and found_references:
+        cache.set_many(collection.name, found_references, projection_id)
+    references.update(found_references)
+
+    if item.get("population"):
+        await _gather(
+            _populate_item_async(
+                list(references.values()),
+                sub_item,
+                resolver,
+                chunk_size=chunk_size,
+                limiter=limiter,
+                loader=loader,
+                cache=cache,
+                parent_path=full_path,
+            )
+            for sub_item in item["population"]
+        )
+    _set_references(documents, path, references, exclude_id)
+
+
+async def populate_documents_async(  # noqa: PLR0913
+    documents: list[dict[str, Any]],
+    population: list[dict[str, Any]] | None,
+    resolver: AsyncCollectionResolver,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int | None = None,
+    *,
+    loader: PopulationLoader | None = None,
+    cache: DocumentCache | None = None,
+) -> None:
+    """Populate documents in place, sibling paths (and chunks) are queried concurrently.
+
+    Notes:
+        A sub population starts as soon as its parent path is found. If a query fails or if the population is
+        cancelled, the pending queries are cancelled.
+
+    Args:
+        documents (List[Dict[str, Any]]): Documents to populate, updated in place.
+        population (Optional[List[Dict[str, Any]]]): Population from `mqm(..., populate=True)`.
+        resolver (AsyncCollectionResolver): Return the collection of a population path from the root.
+        chunk_size (int): Maximum number of ids per `$in` query, a count and not a size (see `DEFAULT_CHUNK_SIZE`).
+        max_concurrency (Optional[int]): Maximum number of concurrent queries, None for no limit.
+        loader (Optional[PopulationLoader]): Batch the queries with the ones of the other requests.
+        cache (Optional[DocumentCache]): Cache of the populated documents, only the missing ones are queried.
+    """
+    import asyncio  # noqa: PLC0415
+
+    limiter: AbstractAsyncContextManager[Any] = asyncio.Semaphore(max_concurrency) if max_concurrency else nullcontext()
+    await _gather(
+        _populate_item_async(
+            documents,
+            item,
+            resolver,
+            chunk_size=chunk_size,
+            limiter=limiter,
+            loader=loader,
+            cache=cache,
+            parent_path="",
+        )
+        for item in population or []
+    )
+
+
+async def find_populated_async(  # noqa: PLR0913
+    collection: AsyncFindCollection,
+    mongodb_query: dict[str, Any],
+    resolver: AsyncCollectionResolver,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int | None = None,
+    *,
+    loader: PopulationLoader | None = None,
+    cache: DocumentCache | None = None,
+) -> list[dict[str, Any]]:
+    """Find the documents of a parsed query (with its collation and execution options), then populate them concurrently.
+
+    Args:
+        collection (AsyncFindCollection): Collection of the query.
+        mongodb_query (Dict[str, Any]): Query from `mqm(..., populate=True)` / `QueryParser.parse()`.
+        resolver (AsyncCollectionResolver): Return the collection of a population path from the root.
+        chunk_size (int): Maximum number of ids per `$in` query, a count and not a size (see `DEFAULT_CHUNK_SIZE`).
+        max_concurrency (Optional[int]): Maximum number of concurrent population queries, None for no limit.
+        loader (Optional[PopulationLoader]): Batch the population queries with the ones of the other requests.
+        cache (Optional[DocumentCache]): Cache of the populated documents, only the missing ones are queried.
+
+    Returns:
+        List[Dict[str, Any]]: Populated documents.
+    """
+    documents = await collection.find(mongodb_query["filter"], **_find_kwargs(mongodb_query)).to_list(None)
+    await populate_documents_async(
+        documents,
+        mongodb_query.get("population"),
+        resolver,
+        chunk_size=chunk_size,
+        max_concurrency=max_concurrency,
+        loader=loader,
+        cache=cache,
+    )
+    return documents
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""MongoQuery module.
+
+This module contain an immutable parsed query, a mapping compatible with the dict returned by `mqm()`, with lazy
+projection / population sections.
+"""
+
+from __future__ import annotations
+
+__all__ = ["MongoQuery"]
+
+from collections.abc import Callable, Hashable, Iterator, Mapping
+from typing import Any, cast
+
+from mongo_queries_manager.canonical import fingerprint, shape_hash
+from mongo_queries_manager.execution import EXECUTION_KEYS
+from mongo_queries_manager.pipeline import to_pipeline
+
+# Sections of a parsed query, by order of the dict returned by `mqm()`. Parser options add optional sections
+# (ie, 'empty') between projection and population.
+_SECTIONS = ("filter", "sort", "skip", "limit", "projection")
+
+# Hashable leaf values of the sections, returned as is when hashing a query.
+_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _sections(extra: dict[str, Any], populated: bool) -> tuple[str, ...]:
+    """Return the sections of a parsed query.
+
+    Args:
+        extra (Dict[str, Any]): Optional sections of the parser options.
+        populated (bool): The query has a population section.
+
+    Returns:
+        Tuple[str, ...]: Section names.
+    """
+    return (*_SECTIONS, *extra, *(("population",) if populated else ()))
+
+
+def _extra_sections(mongodb_query: Mapping[str, Any]) -> dict[str, Any]:
+    """Return the optional sections of the parser options of a parsed query (ie, 'empty').
+
+    Args:
+        mongodb_query (Mapping[str, Any]): Mongodb query.
+
+    Returns:
+        Dict[str, Any]: Optional sections, by order.
+    """
+    return {key: value for key, value in mongodb_query.items() if key not in _SECTIONS and key != "population"}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert a section value into a hashable value, equal values are converted into equal values.
+
+    Args:
+        value (Any): Section value (dict / list / tuple of hashable leaf values).
+
+    Returns:
+        Hashable: Hashable value.
+    """
+    if type(value) in _LEAF_TYPES:
+        return cast(Hashable, value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(sub_value)) for key, sub_value in value.items())
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(item) for item in value)
+    if not isinstance(value, Hashable):
+        # ie, `bson.regex.Regex`
+        return type(value), repr(value)
+    return value
+
+
+class MongoQuery(Mapping[str, Any]):
+    """MongoQuery class.
+
+    An immutable parsed query, usable as a mapping (`query["filter"]`) or by attribute (`query.filter`), hashable to
+    be used as a cache key. The sections are the parsed dicts / lists, not copied: a section updated by the caller
+    changes the hash (a query used as a cache key must not be updated).
+
+    Projection and population are computed on first access by a lazy query (see `QueryParser.parse_query`), a
+    parsing error of these sections is raised on this access.
+    """
+
+    __slots__ = (
+        "_extra",
+        "_filter",
+        "_limit",
+        "_load",
+        "_population",
+        "_projection",
+        "_sections",
+        "_skip",
+        "_sort",
+    )
+
+    _filter: dict[str, Any]
+    _sort: list[tuple[str, int]] | None
+    _skip: int
+    _limit: int
+    _projection: dict[str, Any] | None
+    _population: list[dict[str, Any]] | None
+    _extra: dict[str, Any]
+    _load: Callable[[], tuple[dict[str, Any] | None, list[dict[str, Any]] | None]] | None
+    _sections: tuple[str, ...]
+
+    def __init__(  # noqa: PLR0913
+        self,
+        filter: dict[str, Any],
+        sort: list[tuple[str, int]] | None = None,
+        skip: int = 0,
+        limit: int = 0,
+        *,
+        projection: dict[str, Any] | None = None,
+        population: list[dict[str, Any]] | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize MongoQuery class.
+
+        Args:
+            filter (Dict[str, Any]): MongoDB filter.
+            sort (Optional[List[Tuple[str, int]]]): Sort keys.
+            skip (int): Number of skipped documents.
+            limit (int): Maximum number of documents, 0 for no limit.
+            projection (Optional[Dict[str, Any]]): MongoDB projection.
+            population (Optional[List[Dict[str, Any]]]): Population, None without population section.
+            extra (Optional[Dict[str, Any]]): Optional sections of the parser options (ie, 'empty').
+        """
+        extra = extra or {}
+        set_attribute = object.__setattr__
+        set_attribute(self, "_filter", filter)
+        set_attribute(self, "_sort", sort)
+        set_attribute(self, "_skip", skip)
+        set_attribute(self, "_limit", limit)
+        set_attribute(self, "_projection", projection)
+        set_attribute(self, "_population", population)
+        set_attribute(self, "_extra", extra)
+        set_attribute(self, "_load", None)
+        set_attribute(self, "_sections", _sections(extra, population is not None))
+
+    @classmethod
+    def lazy(
+        cls,
+        mongodb_query: Mapping[str, Any],
+        *,
+        load: Callable[[], tuple[dict[str, Any] | None, list[dict[str, Any]] | None]],
+        populated: bool,
+    ) -> MongoQuery:
+        """Build a query with lazy projection and population sections.
+
+        Args:
+            mongodb_query (Mapping[str, Any]): Mongodb query, without projection and population.
+            load (Callable): Compute the projection and population, called once on first access.
+            populated (bool): The query has a population section.
+
+        Returns:
+            MongoQuery: Lazy query.
+        """
+        extra = _extra_sections(mongodb_query)
+        query = cls(
+            mongodb_query["filter"], mongodb_query["sort"], mongodb_query["skip"], mongodb_query["limit"], extra=extra
+        )
+        object.__setattr__(query, "_load", load)
+        object.__setattr__(query, "_sections", _sections(extra, populated))
+        return query
+
+    @classmethod
+    def from_dict(cls, mongodb_query: Mapping[str, Any]) -> MongoQuery:
+        """Build a query from the dict returned by `mqm()`.
+
+        Args:
+            mongodb_query (Mapping[str, Any]): Mongodb query.
+
+        Returns:
+            MongoQuery: Query.
+        """
+        return cls(
+            mongodb_query["filter"],
+            mongodb_query["sort"],
+            mongodb_query["skip"],
+            mongodb_query["limit"],
+            projection=mongodb_query["projection"],
+            population=mongodb_query.get("population"),
+            extra=_extra_sections(mongodb_query),
+        )
+
+    def _materialize(self) -> None:
+        """Compute the lazy sections (once)."""
+        load = self._load
+        if load is not None:
+            projection, population = load()
+            object.__setattr__(self, "_projection", projection)
+            object.__setattr__(self, "_population", population)
+            object.__setattr__(self, "_load", None)
+
+    @property
+    def filter(self) -> dict[str, Any]:
+        """MongoDB filter."""
+        return self._filter
+
+    @property
+    def sort(self) -> list[tuple[str, int]] | None:
+        """Sort keys."""
+        return self._sort
+
+    @property
+    def skip(self) -> int:
+        """Number of skipped documents."""
+        return self._skip
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of documents, 0 for no limit."""
+        return self._limit
+
+    @property
+    def empty(self) -> bool:
+        """True if the optimized filter provably can't match any document (see `QueryParser(optimize=True)`)."""
+        return bool(self._extra.get("empty"))
+
+    @property
+    def collation(self) -> dict[str, Any] | None:
+        """Collation of the query, set by the regex rewrite (see `QueryParser(rewrite_regex=True)`)."""
+        return cast(dict[str, Any] | None, self._extra.get("collation"))
+
+    @property
+    def cost(self) -> float | None:
+        """Estimated cost of the query, set by the admission limits (see `QueryParser(limits=...)`)."""
+        return cast(float | None, self._extra.get("cost"))
+
+    @property
+    def projection(self) -> dict[str, Any] | None:
+        """MongoDB projection (computed on first access)."""
+        self._materialize()
+        return self._projection
+
+    @property
+    def population(self) -> list[dict[str, Any]] | None:
+        """Population, None without population section (computed on first access)."""
+        self._materialize()
+        return self._population
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a section by name."""
+        if key not in self._sections:
+            raise KeyError(key)
+        if key in self._extra:
+            return self._extra[key]
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the section names."""
+        return iter(self._sections)
+
+    def __len__(self) -> int:
+        """Return the number of sections."""
+        return len(self._sections)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute updates, a query is immutable."""
+        raise AttributeError("MongoQuery is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletions, a query is immutable."""
+        raise AttributeError("MongoQuery is immutable")
+
+    def __hash__(self) -> int:
+        """Hash of all the sections, not cached (the sections are mutable dicts / lists shared with the caller)."""
+        return hash(tuple(_freeze(self[section]) for section in self._sections))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the sections, with a query or a mapping (ie, the dict returned by `mqm()`)."""
+        if isinstance(other, MongoQuery):
+            return (
+                self is other
+                or self._sections == other._sections
+                and all(self[section] == other[section] for section in self._sections)
+            )
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        """Representation of all the sections."""
+        return f"MongoQuery({', '.join(f'{section}={self[section]!r}' for section in self._sections)})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the dict returned by `mqm()`, the sections are shared."""
+        return {section: self[section] for section in self._sections}
+
+    def to_find_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments of `Collection.find`.
+
+        Returns:
+            Dict[str, Any]: Filter, projection, sort, skip and limit, with collation and execution options if set.
+        """
+        find_kwargs = {
+            "filter": self._filter,
+            "projection": self.projection,
+            "sort": self._sort,
+            "skip": self._skip,
+            "limit": self._limit,
+        }
+        if self.collation is not None:
+            find_kwargs["collation"] = self.collation
+        for key in EXECUTION_KEYS:
+            if key in self._extra:
+                find_kwargs[key] = self._extra[key]
+        return find_kwargs
+
+    def to_count_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments of `Collection.count_documents`, the projection isn't computed.
+
+        Returns:
+            Dict[str, Any]: Filter, with skip, limit, collation, time budget and hint if set.
+        """
+        count_kwargs: dict[str, Any] = {"filter": self._filter}
+        if self._skip:
+            count_kwargs["skip"] = self._skip
+        if self._limit:
+            count_kwargs["limit"] = self._limit
+        if self.collation is not None:
+            count_kwargs["collation"] = self.collation
+        # Options of the count command, in its own case.
+        if "max_time_ms" in self._extra:
+            count_kwargs["maxTimeMS"] = self._extra["max_time_ms"]
+        if "hint" in self._extra:
+            count_kwargs["hint"] = self._extra["hint"]
+        return count_kwargs
+
+    def to_pipeline(self, collections: dict[str, str] | None = None) -> list[dict[str, Any]]:
+        """Return the aggregation pipeline of the query (see `to_pipeline`).
+
+        Args:
+            collections (Optional[Dict[str, str]]): Collection name by populated path.
+
+        Returns:
+            List[Dict[str, Any]]: Aggregation pipeline.
+        """
+        return to_pipeline(self, collections)
+
+    def fingerprint(self) -> str:
+        """Return the fingerprint of the canonical form of the query (see `fingerprint`).
+
+        Returns:
+            str: Hexadecimal fingerprint, equivalent queries have the same fingerprint.
+        """
+        return fingerprint(self)
+
+    def shape_hash(self) -> str:
+        """Return the fingerprint of the shape of the query, without literal values (see `shape_hash`).
+
+        Returns:
+            str: Hexadecimal shape fingerprint.
+        """
+        return shape_hash(self)
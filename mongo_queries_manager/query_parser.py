@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""QueryParser module.
+
+This module contain a configured parser, used to convert many string queries with the same configuration.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BatchResult", "QueryParser"]
+
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
+from typing import Any, ClassVar, NamedTuple
+from urllib import parse
+
+from mongo_queries_manager.cache import QueryCache
+from mongo_queries_manager.cost import (
+    QueryLimits,
+    check_limit,
+    check_limits,
+    check_populate_depth,
+    check_skip,
+    estimate_cost,
+    populate_cost,
+)
+from mongo_queries_manager.execution import ExecutionOptions, execution_options
+from mongo_queries_manager.helpers import FieldTrie, chunked, merge_sub_filter
+from mongo_queries_manager.mongodb_queries_manager import (
+    MongoDBQueriesManager,
+    PaginationError,
+    QueryLimitError,
+    SchemaError,
+    volatile_cast,
+)
+from mongo_queries_manager.optimizer import optimize_predicates
+from mongo_queries_manager.pagination import decode_page_token, keyset_filter, keyset_sort
+from mongo_queries_manager.query import MongoQuery
+from mongo_queries_manager.regex import regex_caster, rewrite_regex
+from mongo_queries_manager.schema import UNKNOWN_FIELDS, array_fields, compile_schema, non_string_fields
+
+
+def _split_arguments(string_query: str, max_arguments: int | None) -> list[str]:
+    """Split the arguments of a query string.
+
+    Notes:
+        With a maximum, the query is split at most max arguments times by step and the empty arguments (ie, a
+        trailing '&') are dropped, a query with more non empty arguments raises before splitting all of them.
+
+    Args:
+        string_query (str): Unquoted query string.
+        max_arguments (Optional[int]): Maximum number of non empty arguments.
+
+    Returns:
+        List[str]: Arguments of the query string.
+    """
+    if max_arguments is None:
+        return string_query.split("&")
+
+    args: list[str] = []
+    remaining = string_query.lstrip("&")
+    while remaining:
+        max_splits = max_arguments - len(args)
+        if max_splits == 0:
+            raise QueryLimitError(f"Query has more than {max_arguments} arguments")
+        parts = remaining.split("&", max_splits)
+        # The last part is the not split remaining arguments.
+        remaining = parts.pop().lstrip("&") if len(parts) > max_splits else ""
+        args.extend(part for part in parts if part)
+    return args
+
+
+def _sort_population(populate: str) -> int:
+    """Used to sort population list by level (.) into populate value.
+
+    Args:
+        populate (str): Populate value.
+
+    Returns:
+        int: Return the number of . (level) into populate value.
+    """
+    return populate.count(".")
+
+
+class BatchResult(NamedTuple):
+    """Result of a string query parsed by `QueryParser.parse_many`.
+
+    Attributes:
+        query (str): The string query.
+        result (Optional[Dict[str, Any]]): The mongodb query, None if the parsing failed.
+        error (Optional[Exception]): The parsing error, None if the parsing succeeded.
+    """
+
+    query: str
+    result: dict[str, Any] | None
+    error: Exception | None
+
+
+# Parser of a process pool worker, built once per worker by `_init_worker`.
+_worker_parser: QueryParser | None = None
+
+
+def _init_worker(options: dict[str, Any]) -> None:
+    """Build the parser of a process pool worker.
+
+    Args:
+        options (Dict[str, Any]): Parser options, without cache.
+    """
+    global _worker_parser  # noqa: PLW0603
+    _worker_parser = QueryParser(**options)
+
+
+def _parse_chunk(string_queries: list[str]) -> list[tuple[BatchResult, bool]]:
+    """Parse a chunk of string queries into a process pool worker.
+
+    Args:
+        string_queries (List[str]): Chunk of string queries.
+
+    Returns:
+        List[Tuple[BatchResult, bool]]: Batch results, with True if the result can be cached.
+    """
+    assert _worker_parser is not None
+    results = []
+    for string_query in string_queries:
+        token = volatile_cast.set(False)
+        try:
+            results.append(
+                (BatchResult(string_query, _worker_parser._parse(string_query), None), not volatile_cast.get())
+            )
+        except Exception as err:
+            results.append((BatchResult(string_query, None, err), False))
+        finally:
+            volatile_cast.reset(token)
+    return results
+
+
+class QueryParser:
+    """QueryParser class.
+
+    All the configuration work (blacklist, allowed fields, casters, population) is done once at initialization,
+    build one parser per endpoint and reuse it for every request.
+
+    Attributes:
+        blacklist (FrozenSet[str]): Keys ignored by the parser (whatever the operator).
+        allowed_fields (Optional[FieldTrie]): Allowed filter fields (dotted path prefixes), None to allow all fields.
+        populate (bool): Add population into returned query (Manual implementation).
+        keyset (bool): Keyset pagination, 'after' / 'before' page tokens arguments.
+        schema (Optional[Dict[str, Callable]]): Compiled schema, caster of the declared fields by dotted path.
+        unknown_fields (str): Fields missing from the schema are cast by type guessing ('infer') or rejected ('reject').
+        scalar_fields (FrozenSet[str]): Scalar fields of the schema (declared without a list), used by the optimizer.
+        non_string_fields (FrozenSet[str]): Fields of the schema declared with a type which isn't a string, their sort
+            keeps the collation of the regex rewrite.
+        optimize (bool): Optimize the filter predicates, the query has an 'empty' key (True if it can't match).
+        rewrite_regex (bool): Rewrite the regex filters into index friendly predicates, the query has 'collation' and
+            'unindexed' keys.
+        collation (Optional[Dict[str, Any]]): Case insensitive collation of the regex rewrite.
+        regex_output (str): Output format of the regex values, one of `REGEX_OUTPUTS`.
+        limits (Optional[QueryLimits]): Admission limits, the query has a 'cost' key (its estimated cost).
+        execution (Optional[ExecutionOptions]): Execution options added to the query (ie, 'max_time_ms').
+        cache (Optional[QueryCache]): Cache of parsed queries.
+        fingerprint (Hashable): Parser configuration fingerprint, part of the cache key.
+    """
+
+    __slots__ = (
+        "_deferred_keys",
+        "_mongodb_queries_mgr",
+        "_options",
+        "allowed_fields",
+        "blacklist",
+        "cache",
+        "execution",
+        "fingerprint",
+        "keyset",
+        "limits",
+        "optimize",
+        "populate",
+        "rewrite_regex",
+        "collation",
+        "regex_output",
+        "scalar_fields",
+        "non_string_fields",
+        "schema",
+        "unknown_fields",
+    )
+
+    # Cursor modifiers operations, dispatched on their key.
+    _operations: ClassVar[dict[str, Callable[[str], Any]]] = {
+        "sort": MongoDBQueriesManager.sort_logic,
+        "limit": MongoDBQueriesManager.limit_logic,
+        "skip": MongoDBQueriesManager.skip_logic,
+    }
+
+    # Keys of the arguments which aren't filters (when used with '=').
+    _control_keys: ClassVar[frozenset[str]] = frozenset({*_operations, "fields", "$text"})
+
+    def __init__(  # noqa: PLR0913
+        self,
+        blacklist: list[str] | None = None,
+        casters: dict[str, Callable[[Any], Any]] | None = None,
+        populate: bool = False,
+        *,
+        cache: QueryCache | None = None,
+        allowed_fields: list[str] | None = None,
+        keyset: bool = False,
+        schema: Mapping[str, Any] | None = None,
+        unknown_fields: str = "infer",
+        optimize: bool = False,
+        rewrite_regex: bool = False,
+        collation: dict[str, Any] | None = None,
+        regex_output: str = "legacy",
+        regex_max_length: int | None = None,
+        regex_guard: bool = False,
+        limits: QueryLimits | None = None,
+        execution: ExecutionOptions | None = None,
+    ) -> None:
+        """Initialize QueryParser class.
+
+        Args:
+            blacklist (Optional[List[str]]): Filter on all keys except the ones specified.
+            casters (Optional[Dict[str, Callable]]): Custom caster dict, used to define custom type.
+            populate (bool): Add population into returned query (Manual implementation).
+            cache (Optional[QueryCache]): Cache of parsed queries, can be shared between parsers.
+            allowed_fields (Optional[List[str]]): Filter only on the specified fields and their sub fields.
+            keyset (bool): Keyset pagination, 'after' / 'before' page tokens are converted into a range filter on the
+                sort keys ('_id' tie-breaker added to the sort).
+            schema (Optional[Mapping[str, Any]]): Type of the filter fields by dotted path, or nested (ie,
+                {'_id': ObjectId, 'created': datetime}), declared fields are cast with their type. An array field is
+                declared with a list of its item type (ie, {'tags': [str]}).
+            unknown_fields (str): Fields missing from the schema are cast by type guessing ('infer') or raise a
+                `SchemaError` ('reject').
+            optimize (bool): Combine the predicates of each filter key (tightest bounds, single value `$in` as
+                equality, duplicates removed), the query has an 'empty' key, True if the filter provably can't match
+                any document. Only the scalar fields of the schema have contradictions, the predicates of the other
+                fields (which may be arrays) are merged as without optimizer.
+            rewrite_regex (bool): Rewrite the anchored literal prefix regex into a range, the exact match regex into
+                an equality. The query has a 'collation' key (the collation of the rewritten case insensitive exact
+                matches, None without) and an 'unindexed' key (filter keys which are still a regex scan).
+            collation (Optional[Dict[str, Any]]): Case insensitive collation of the index (ie, {'locale': 'en',
+                'strength': 2}), case insensitive exact matches are kept as regex without it, or when the query is
+                sorted on a field not declared with a non string type into the schema.
+            regex_output (str): Output format of the '/pattern/flags' values: the compiled whole value ('legacy'),
+                the compiled pattern with its flags ('python'), a `bson.regex.Regex` ('bson', not compiled) or a
+                `$regex` / `$options` operator ('operator', not compiled).
+            regex_max_length (Optional[int]): Maximum regex pattern length, longer patterns raise a `RegexError`.
+            regex_guard (bool): Regex patterns with nested repeats or repeated alternations (ie, '(a+)+', '(a|aa)+'),
+                which backtrack catastrophically, raise a `RegexError`.
+            limits (Optional[QueryLimits]): Admission limits, a query over a limit raises a `QueryLimitError`. The
+                non empty arguments and list values are counted before casting them, the skip, limit and populate
+                values are checked when read, a missing limit, `$text` with regex and the estimated cost before
+                building the population. The query has a 'cost' key (see `estimate_cost`).
+            execution (Optional[ExecutionOptions]): Execution options, the query has their 'max_time_ms',
+                'batch_size', 'allow_disk_use' and 'hint' keys when set (keyword arguments of `Collection.find`).
+        """
+        if unknown_fields not in UNKNOWN_FIELDS:
+            raise ValueError(f"Unknown fields must be one of {', '.join(UNKNOWN_FIELDS)}")
+
+        self.blacklist: frozenset[str] = frozenset(blacklist or ())
+        self.allowed_fields = FieldTrie(allowed_fields) if allowed_fields is not None else None
+        self.populate = populate
+        self.keyset = keyset
+        self.cache = cache
+        self.schema = compile_schema(schema) if schema is not None else None
+        self.scalar_fields = frozenset(self.schema or ()) - (
+            array_fields(schema) if schema is not None else frozenset()
+        )
+        self.non_string_fields = non_string_fields(schema) if schema is not None else frozenset()
+        self.unknown_fields = unknown_fields
+        self.optimize = optimize
+        self.rewrite_regex = rewrite_regex
+        self.collation = collation
+        self.regex_output = regex_output
+        self.limits = limits
+        self.execution = execution
+        # Keys of the arguments applied after the loop, page tokens only with keyset pagination (not blacklisted).
+        self._deferred_keys: frozenset[str] = frozenset(
+            {"populate", *(("after", "before") if keyset else ())} - (self.blacklist - {"populate"})
+        )
+        self.fingerprint: Hashable = (
+            self.blacklist,
+            None if allowed_fields is None else frozenset(allowed_fields),
+            tuple(sorted((casters or {}).items())),
+            populate,
+            keyset,
+            None if self.schema is None else frozenset(self.schema.items()),
+            self.scalar_fields,
+            unknown_fields,
+            optimize,
+            rewrite_regex,
+            None if collation is None else tuple(sorted(collation.items())),
+            regex_output,
+            regex_max_length,
+            regex_guard,
+            limits,
+            None if execution is None else (execution._replace(hint=None), repr(execution.hint)),
+        )
+        self._mongodb_queries_mgr = MongoDBQueriesManager(
+            casters=casters,
+            regex_cast=(
+                regex_caster(regex_output, max_length=regex_max_length, guard=regex_guard)
+                if regex_output != "legacy" or regex_max_length is not None or regex_guard
+                else None
+            ),
+        )
+        # Options without cache, used to build the parsers of process pool workers.
+        self._options: dict[str, Any] = {
+            "blacklist": blacklist,
+            "casters": casters,
+            "populate": populate,
+            "allowed_fields": allowed_fields,
+            "keyset": keyset,
+            "schema": schema,
+            "unknown_fields": unknown_fields,
+            "optimize": optimize,
+            "rewrite_regex": rewrite_regex,
+            "collation": collation,
+            "regex_output": regex_output,
+            "regex_max_length": regex_max_length,
+            "regex_guard": regex_guard,
+            "limits": limits,
+            "execution": execution,
+        }
+
+    def parse(self, string_query: str) -> dict[str, Any]:
+        """Convert a string query into a MongoDB query dict.
+
+        Notes:
+            With a cache, queries with values depending on the current time or on a custom caster aren't cached.
+
+        Args:
+            string_query (str): A query string of the requested API URL.
+
+        Returns:
+            Dict[str, Any]: Return a mongodb query in dict format.
+        """
+        if self.cache is None:
+            return self._parse(string_query)
+
+        key = (self.fingerprint, string_query)
+        mongodb_query = self.cache.get(key)
+        if mongodb_query is not None:
+            return mongodb_query
+
+        token = volatile_cast.set(False)
+        try:
+            mongodb_query = self._parse(string_query)
+            if not volatile_cast.get():
+                self.cache.put(key, mongodb_query)
+        finally:
+            volatile_cast.reset(token)
+
+        return mongodb_query
+
+    def parse_many(
+        self, string_queries: Iterable[str], *, workers: int | None = None, chunk_size: int = 256
+    ) -> Iterator[BatchResult]:
+        """Convert many string queries into MongoDB query dicts, in order.
+
+        Notes:
+            An error doesn't abort the batch, it is returned into the result of its string query.
+            With workers, string queries are parsed by chunks into a process pool (casters must be picklable),
+            the cacheable results are put into the parser cache.
+
+        Args:
+            string_queries (Iterable[str]): Query strings of the requested API URLs.
+            workers (Optional[int]): Number of process pool workers, None to parse into the current process.
+            chunk_size (int): Number of string queries sent at once to a worker.
+
+        Yields:
+            BatchResult: String query with its mongodb query or its parsing error.
+        """
+        if chunk_size < 1:
+            raise ValueError("Batch chunk_size must be positive")
+
+        if workers is None:
+            for string_query in string_queries:
+                try:
+                    batch_result = BatchResult(string_query, self.parse(string_query), None)
+                except Exception as err:
+                    batch_result = BatchResult(string_query, None, err)
+                yield batch_result
+            return
+
+        # Imported with workers only (cold start), it imports multiprocessing.
+        from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self._options,)) as executor:
+            for results in executor.map(_parse_chunk, chunked(string_queries, chunk_size)):
+                for batch_result, cacheable in results:
+                    if cacheable and self.cache is not None and batch_result.result is not None:
+                        self.cache.put((self.fingerprint, batch_result.query), batch_result.result)
+                    yield batch_result
+
+    def parse_query(self, string_query: str) -> MongoQuery:
+        """Convert a string query into an immutable `MongoQuery`.
+
+        Notes:
+            Without cache, the population and the projection are computed on their first access (ie, not computed
+            by `MongoQuery.to_count_kwargs()`).
+
+        Args:
+            string_query (str): A query string of the requested API URL.
+
+        Returns:
+            MongoQuery: Return a mongodb query, also usable as the dict returned by `parse`.
+        """
+        if self.cache is not None:
+            return MongoQuery.from_dict(self.parse(string_query))
+
+        mongodb_query, populate, projection_args = self._parse_arguments(string_query)
+        if not self.populate and not projection_args:
+            return MongoQuery.from_dict(mongodb_query)
+
+        def load() -> tuple[dict[str, Any] | None, list[dict[str, Any]] | None]:
+            self._project(mongodb_query, populate, projection_args)
+            return mongodb_query["projection"], mongodb_query.get("population")
+
+        return MongoQuery.lazy(mongodb_query, load=load, populated=self.populate)
+
+    def _parse(self, string_query: str) -> dict[str, Any]:
+        """Convert a string query into a MongoDB query dict, without cache.
+
+        Args:
+            string_query (str): A query string of the requested API URL.
+
+        Returns:
+            Dict[str, Any]: Return a mongodb query in dict format.
+        """
+        mongodb_query, populate, projection_args = self._parse_arguments(string_query)
+        self._project(mongodb_query, populate, projection_args)
+        return mongodb_query
+
+    def _parse_arguments(self, string_query: str) -> tuple[dict[str, Any], str, list[str]]:
+        """Convert the arguments of a string query into a MongoDB query dict, except population and projection.
+
+        Notes:
+            Each argument is dispatched on its key, filter arguments are split once into key, operator and value.
+
+        Args:
+            string_query (str): A query string of the requested API URL.
+
+        Returns:
+            Tuple[Dict[str, Any], str, List[str]]: Mongodb query without population and projection, populate
+                argument value and projection arguments.
+        """
+        mongodb_query: dict[str, Any] = {
+            "filter": {},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+        mongodb_filter: dict[str, Any] = mongodb_query["filter"]
+        # Populate / page tokens values, applied after the loop (projection depends on population, range on sort).
+        deferred_values: dict[str, str] = {}
+        projection_args: list[str] = []
+        # Filter predicates (key, sub filter, argument), combined after the loop by the optimizer.
+        predicates: list[tuple[str, Any, str]] | None = [] if self.optimize else None
+
+        limits = self.limits
+        args = _split_arguments(parse.unquote(string_query), limits.max_arguments if limits is not None else None)
+        for arg in args:
+            if arg == "":
+                continue
+
+            key, separator, value = arg.partition("=")
+            if separator and key in self._deferred_keys:
+                if value:
+                    deferred_values[key] = value
+                    if limits is not None and key == "populate" and self.populate:
+                        check_populate_depth(value, limits)
+                continue
+
+            if separator and key in self._control_keys:
+                # Skip blacklisted value
+                if key not in self.blacklist:
+                    self._parse_control(mongodb_query, projection_args, key, arg)
+                continue
+
+            self._parse_filter(mongodb_filter, predicates, arg)
+
+        self._rewrite_filter(mongodb_query, predicates)
+
+        if self.keyset:
+            self._paginate(mongodb_query, after=deferred_values.get("after"), before=deferred_values.get("before"))
+
+        populate = deferred_values.get("populate", "")
+        if self.limits is not None or self.execution is not None:
+            self._admit(mongodb_query, populate if self.populate else "")
+
+        return mongodb_query, populate, projection_args
+
+    def _admit(self, mongodb_query: dict[str, Any], populate: str) -> None:
+        """Check the admission limits of mongodb query and add its cost and execution options, if enabled.
+
+        Args:
+            mongodb_query (Dict[str, Any]): The actual mongodb query, without population, updated in place.
+            populate (str): Populate argument value, empty without population.
+        """
+        cost = None
+        if self.limits is not None:
+            cost = mongodb_query["cost"] = check_limits(mongodb_query, populate, self.limits)
+
+        if self.execution is not None:
+            if cost is None and self.execution.time_per_cost is not None:
+                cost = estimate_cost(mongodb_query) + populate_cost(populate)
+            mongodb_query.update(execution_options(mongodb_query["limit"], cost, self.execution))
+
+    def _parse_control(self, mongodb_query: dict[str, Any], projection_args: list[str], key: str, arg: str) -> None:
+        """Parse a control argument (cursor modifier, projection or text search) into mongodb query.
+
+        Args:
+            mongodb_query (Dict[str, Any]): The actual mongodb query, updated in place.
+            projection_args (List[str]): Projection arguments, updated in place.
+            key (str): Argument key, one of the control keys.
+            arg (str): Control argument (ie, 'limit=10').
+        """
+        if key in self._operations:
+            mongodb_query[key] = self._operations[key](arg)
+            # Checked when read, before casting the next filters.
+            if self.limits is not None and key == "skip":
+                check_skip(mongodb_query["skip"], self.limits)
+            elif self.limits is not None and key == "limit":
+                check_limit(mongodb_query["limit"], self.limits)
+        elif key == "fields":
+            projection_args.append(arg)
+        else:
+            mongodb_query["filter"]["$text"] = {
+                "$search": self._mongodb_queries_mgr.text_operator_logic(text_param=arg)
+            }
+
+    def _rewrite_filter(self, mongodb_query: dict[str, Any], predicates: list[tuple[str, Any, str]] | None) -> None:
+        """Combine the filter predicates with the optimizer and rewrite the regex filters, if enabled.
+
+        Args:
+            mongodb_query (Dict[str, Any]): The actual mongodb query, updated in place.
+            predicates (Optional[List[Tuple[str, Any, str]]]): Predicates of the optimizer, None without optimizer.
+        """
+        if predicates is not None:
+            optimized_filter, mongodb_query["empty"] = optimize_predicates(predicates, self.scalar_fields)
+            mongodb_query["filter"].update(optimized_filter)
+
+        if self.rewrite_regex:
+            # The tie-breaker of keyset pagination is sorted too.
+            sort = keyset_sort(mongodb_query["sort"]) if self.keyset else mongodb_query["sort"]
+            mongodb_query["filter"], mongodb_query["collation"], mongodb_query["unindexed"] = rewrite_regex(
+                mongodb_query["filter"], self.collation, sort, self.non_string_fields
+            )
+
+    def _project(self, mongodb_query: dict[str, Any], populate: str, projection_args: list[str]) -> None:
+        """Add the population and the projection into mongodb query (projection of populated fields).
+
+        Args:
+            mongodb_query (Dict[str, Any]): The actual mongodb query, updated in place.
+            populate (str): Populate argument value (ie, 'user,user.settings').
+            projection_args (List[str]): Projection arguments (ie, 'fields=title,user.name').
+        """
+        if self.populate:
+            self._populate(mongodb_query, populate)
+
+        for projection_arg in projection_args:
+            mongodb_query["projection"] = self._mongodb_queries_mgr.projection_logic(
+                projection_param=projection_arg, population=mongodb_query.get("population")
+            )
+
+    def _parse_filter(
+        self, mongodb_filter: dict[str, Any], predicates: list[tuple[str, Any, str]] | None, arg: str
+    ) -> None:
+        """Parse a filter argument into mongodb filter, skip blacklisted / not allowed fields.
+
+        Notes:
+            A field declared into the schema is cast with its schema caster, without type guessing.
+
+        Args:
+            mongodb_filter (Dict[str, Any]): The actual mongodb filter, updated in place.
+            predicates (Optional[List[Tuple[str, Any, str]]]): Predicates of the optimizer, the sub filter is added
+                to it instead of mongodb filter.
+            arg (str): Filter argument (ie, 'price>5').
+        """
+        key, operator, value = self._mongodb_queries_mgr.split_operation(arg)
+
+        # $exists operation field is the value (ie, '!email')
+        field = value if operator in ("", "!") else key
+        if field in self.blacklist or (self.allowed_fields is not None and not self.allowed_fields.match(field)):
+            return
+
+        cast = None
+        if self.schema is not None:
+            cast = self.schema.get(field)
+            if cast is None and self.unknown_fields == "reject":
+                raise SchemaError(f"Unknown field {field}")
+
+        # Count the list values before casting them.
+        max_list_values = self.limits.max_list_values if self.limits is not None else None
+        if max_list_values is not None and "," in value and value.count(",") >= max_list_values:
+            raise QueryLimitError(f"Filter {field} has more than {max_list_values} values")
+
+        filter_key, sub_filter = self._mongodb_queries_mgr.filter_item_logic(key, operator, value, cast)
+        if predicates is not None:
+            predicates.append((filter_key, sub_filter, arg))
+        else:
+            merge_sub_filter(mongodb_filter, filter_key, sub_filter, arg)
+
+    def _populate(self, mongodb_query: dict[str, Any], populate: str) -> None:
+        """Add the population into mongodb query.
+
+        Args:
+            mongodb_query (Dict[str, Any]): The actual mongodb query, updated in place.
+            populate (str): Populate argument value (ie, 'user,user.settings').
+        """
+        mongodb_query["population"] = []
+        populates_values = populate.split(",") if populate.find(",") > 0 else [populate] if populate else []
+        for populate_value in sorted(populates_values, key=_sort_population):
+            self._mongodb_queries_mgr.format_populate_value(mongodb_query, population_value=populate_value)
+
+    @staticmethod
+    def _paginate(mongodb_query: dict[str, Any], after: str | None, before: str | None) -> None:
+        """Add the keyset pagination range filter and sort into mongodb query.
+
+        Notes:
+            A 'before' page is sorted in reverse order (nearest documents first), reverse the returned documents.
+
+        Args:
+            mongodb_query (Dict[str, Any]): The actual mongodb query, updated in place.
+            after (Optional[str]): Page token from `encode_page_token`, documents after it.
+            before (Optional[str]): Page token from `encode_page_token`, documents before it.
+        """
+        if after and before:
+            raise PaginationError("Fail to paginate both after and before a page token")
+
+        sort = keyset_sort(mongodb_query["sort"])
+        mongodb_query["sort"] = sort
+        if after:
+            mongodb_query["filter"].update(keyset_filter(sort, decode_page_token(after)))
+        elif before:
+            mongodb_query["filter"].update(keyset_filter(sort, decode_page_token(before), before=True))
+            mongodb_query["sort"] = keyset_sort(sort, reverse=True)
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Regex module.
+
+This module contain the cast of the regex values (output format, length and catastrophic backtracking checks) and the
+rewrite of the regex filters into index friendly predicates: an anchored literal prefix is a range, an exact match is
+an equality (with a case insensitive collation if needed).
+"""
+
+from __future__ import annotations
+
+__all__ = ["REGEX_OUTPUTS", "RegexRewrite", "is_regex", "regex_caster", "rewrite_regex"]
+
+import re
+import sys
+from collections.abc import Callable, Collection, Mapping, Sequence
+from functools import lru_cache, reduce
+from operator import or_
+from re import Pattern
+from typing import Any, NamedTuple
+
+from mongo_queries_manager.mongodb_queries_manager import RegexError, compile_regex
+
+# Regex values output formats: the compiled whole value ('legacy'), a compiled pattern ('python'), a
+# `bson.regex.Regex` ('bson') or a `$regex` / `$options` operator ('operator').
+REGEX_OUTPUTS = ("legacy", "python", "bson", "operator")
+
+# Query regex flags, 'g' is ignored (a filter matches or not).
+_FLAGS = {"i": re.IGNORECASE, "m": re.MULTILINE, "g": 0}
+
+# Repeat quantifiers (ie, '+' / '{2,}'), '?' is bounded.
+_REPEAT = re.compile(r"[*+]|\{\d*,?\d*\}")
+
+# Regex metacharacters, a literal prefix stops on the first one.
+_METACHARACTERS = frozenset(".^$*+?{}[]|()\\")
+
+# Quantifiers, the quantified character isn't part of the literal prefix (ie, '^jo?hn').
+_QUANTIFIERS = frozenset("*+?{")
+
+# Query regex format, '/pattern/flags'.
+_QUERY_REGEX = re.compile(r"/(?P<pattern>.*)/(?P<flags>[a-z]*)", re.DOTALL)
+
+_SURROGATES_START = 0xD800
+_SURROGATES_END = 0xDFFF
+
+
+def _split_query_regex(value: str) -> tuple[str, str] | None:
+    """Split a query regex value into pattern and flags.
+
+    Args:
+        value (str): Query regex value (ie, '/^john/i').
+
+    Returns:
+        Optional[Tuple[str, str]]: Pattern and deduplicated flags, without 'g' (ie, ('^john', 'i') for '/^john/ii'),
+            None if the value has no valid flags (ie, '/api/users').
+    """
+    match = _QUERY_REGEX.fullmatch(value)
+    if match is None or not set(match["flags"]) <= _FLAGS.keys():
+        return None
+    return match["pattern"], "".join(dict.fromkeys(match["flags"].replace("g", "")))
+
+
+def _class_end(pattern: str, index: int) -> int:
+    """Return the index following a character class (ie, '[^a-z]').
+
+    Args:
+        pattern (str): Regex pattern.
+        index (int): Index of the class opening bracket.
+
+    Returns:
+        int: Index following the class closing bracket.
+    """
+    index += 1
+    if pattern[index : index + 1] == "^":
+        index += 1
+    if pattern[index : index + 1] == "]":
+        # Leading bracket is a literal.
+        index += 1
+    while index < len(pattern) and pattern[index] != "]":
+        index += 2 if pattern[index] == "\\" else 1
+    return index + 1
+
+
+def _is_disjoint_alternation(group: str) -> bool:
+    """Check if the alternation of a group has literal branches starting with distinct characters (ie, 'jpg|png').
+
+    Args:
+        group (str): Group content, without its parentheses.
+
+    Returns:
+        bool: True if a repeat of the group can't backtrack into another branch.
+    """
+    branches = group.removeprefix("?:").split("|")
+    if any(not branch or not _METACHARACTERS.isdisjoint(branch) for branch in branches):
+        return False
+    # Case insensitive, the 'i' flag makes 'J' and 'j' overlap.
+    first_chars = [branch[0].lower() for branch in branches]
+    return len(set(first_chars)) == len(first_chars)
+
+
+def _has_unsafe_repeat(pattern: str) -> bool:
+    r"""Check if a pattern has a repeated group containing a repeat or an alternation (ie, '(a+)+' / '(a|aa)+').
+
+    Notes:
+        Nested repeats and repeated alternations (which may overlap) backtrack exponentially on a near match, a
+        catastrophic backtracking. An alternation of literals with distinct first characters (ie, '(jpg|png)+') is
+        safe, other alternations are rejected even if their branches can't overlap (ie, '(ab|ac)+', '(a|b\d)+').
+
+    Args:
+        pattern (str): Regex pattern.
+
+    Returns:
+        bool: True if a repeat or an overlapping alternation is nested into a repeated group.
+    """
+    # Repeat found into each open group (the whole pattern first), its alternation and its start index.
+    group_repeats = [False]
+    group_alternations = [False]
+    group_starts = [-1]
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            index += 2
+            continue
+        if char == "[":
+            index = _class_end(pattern, index)
+            continue
+
+        if char == "(":
+            group_repeats.append(False)
+            group_alternations.append(False)
+            group_starts.append(index)
+        elif char == ")" and len(group_repeats) > 1:
+            has_repeat = group_repeats.pop()
+            if group_alternations.pop() and not _is_disjoint_alternation(pattern[group_starts[-1] + 1 : index]):
+                has_repeat = True
+            group_starts.pop()
+            if has_repeat and _REPEAT.match(pattern, index + 1):
+                return True
+            group_repeats[-1] = group_repeats[-1] or has_repeat
+        elif char == "|":
+            group_alternations[-1] = True
+        elif _REPEAT.match(pattern, index):
+            group_repeats[-1] = True
+        index += 1
+    return False
+
+
+def _check_pattern(pattern: str, max_length: int | None, guard: bool) -> None:
+    """Check a regex pattern before it reaches the database.
+
+    Args:
+        pattern (str): Regex pattern.
+        max_length (Optional[int]): Maximum pattern length, None for no limit.
+        guard (bool): Reject the patterns with nested repeats or repeated alternations (catastrophic backtracking).
+    """
+    if max_length is not None and len(pattern) > max_length:
+        raise RegexError(f"Regex pattern is longer than {max_length} characters")
+    if guard and _has_unsafe_repeat(pattern):
+        raise RegexError(f"Regex {pattern} may backtrack catastrophically (nested repeats or overlapping alternation)")
+
+
+def regex_caster(output: str = "legacy", *, max_length: int | None = None, guard: bool = False) -> Callable[[str], Any]:
+    """Build the caster of the query regex values ('/pattern/flags').
+
+    Notes:
+        Python side compilations are memoized, 'bson' and 'operator' outputs aren't compiled (the regex only ships to
+        MongoDB). The 'legacy' output compiles the whole value (slashes and flags included), as `mqm()` does.
+
+    Args:
+        output (str): Output format, one of `REGEX_OUTPUTS`.
+        max_length (Optional[int]): Maximum pattern length, None for no limit.
+        guard (bool): Reject the patterns with nested repeats or repeated alternations (ie, '(a+)+', '(a|aa)+'),
+            which backtrack catastrophically.
+
+    Returns:
+        Callable[[str], Any]: Regex values caster, raises `RegexError`.
+    """
+    if output not in REGEX_OUTPUTS:
+        raise ValueError(f"Regex output must be one of {', '.join(REGEX_OUTPUTS)}")
+    if output == "bson":
+        try:
+            from bson.regex import Regex  # noqa: PLC0415
+        except ImportError as err:
+            raise RegexError("BSON regex output requires pymongo") from err
+
+    # Split and checks of the values, memoized (the same regex values are sent by many requests).
+    @lru_cache(maxsize=1024)
+    def parse_regex(value: str) -> tuple[str, str]:
+        # Without valid flags, the whole value is the pattern (as the legacy output).
+        pattern, flags = _split_query_regex(value) or (value, "")
+        _check_pattern(pattern, max_length, guard)
+        return pattern, flags
+
+    def cast_regex(value: str) -> Any:
+        pattern, flags = parse_regex(value)
+        if output == "bson":
+            return Regex(pattern, flags)
+        if output == "operator":
+            # A new dict per query, a parsed query can be updated by its caller.
+            return {"$regex": pattern, "$options": flags} if flags else {"$regex": pattern}
+        try:
+            if output == "python":
+                return compile_regex(pattern, reduce(or_, (_FLAGS[flag] for flag in flags), 0))
+            return compile_regex(value)
+        except re.error as err:
+            raise RegexError(f"Fail to compile regex {value}") from err
+
+    return cast_regex
+
+
+class RegexRewrite(NamedTuple):
+    """Result of a regex rewrite.
+
+    Attributes:
+        filter (Dict[str, Any]): Filter with the index friendly regex filters rewritten.
+        collation (Optional[Dict[str, Any]]): Collation of the query, set if a case insensitive exact match has been
+            rewritten into an equality.
+        unindexed (List[str]): Filter keys which are still a regex scan.
+    """
+
+    filter: dict[str, Any]
+    collation: dict[str, Any] | None
+    unindexed: list[str]
+
+
+def _regex_parts(condition: Any) -> tuple[str, str] | None:
+    """Split a parsed regex into pattern and flags, whatever its output format.
+
+    Args:
+        condition (Any): Filter condition, a regex (`re.Pattern` / `bson.regex.Regex`, a legacy '/pattern/flags'
+            compiled value) or a `$regex` / `$options` operator.
+
+    Returns:
+        Optional[Tuple[str, str]]: Pattern and flags (ie, ('^john', 'i')), None if the condition isn't a regex.
+    """
+    if isinstance(condition, dict):
+        if "$regex" not in condition or not condition.keys() <= {"$regex", "$options"}:
+            return None
+        regex_parts = _regex_parts(condition["$regex"]) if not isinstance(condition["$regex"], str) else None
+        pattern, flags = regex_parts or (condition["$regex"], "")
+        return pattern, flags + condition.get("$options", "")
+
+    pattern = getattr(condition, "pattern", None)
+    regex_flags = getattr(condition, "flags", None)
+    if not isinstance(pattern, str) or not isinstance(regex_flags, int):
+        return None
+    regex_parts = _split_query_regex(pattern) if isinstance(condition, Pattern) else None
+    if regex_parts is not None:
+        # Legacy output, the whole value is compiled.
+        return regex_parts
+    flags = ("i" if regex_flags & re.IGNORECASE else "") + ("m" if regex_flags & re.MULTILINE else "")
+    return pattern, flags
+
+
+def is_regex(condition: Any) -> bool:
+    """Check if a filter condition is a regex, whatever its output format.
+
+    Args:
+        condition (Any): Filter condition.
+
+    Returns:
+        bool: True for a `re.Pattern`, a `bson.regex.Regex` or a `$regex` operator.
+    """
+    return _regex_parts(condition) is not None
+
+
+def _literal_prefix(pattern: str) -> tuple[str, str]:
+    r"""Split a pattern into its literal prefix and the remaining pattern.
+
+    Args:
+        pattern (str): Regex pattern, without anchor (ie, 'john\.doe.*').
+
+    Returns:
+        Tuple[str, str]: Literal prefix and remaining pattern (ie, ('john.doe', '.*')).
+    """
+    prefix = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\" and index + 1 < len(pattern) and not pattern[index + 1].isalnum():
+            # Escaped metacharacter (ie, '\.'), escaped letters are character classes (ie, '\d').
+            literal, width = pattern[index + 1], 2
+        elif char in _METACHARACTERS:
+            break
+        else:
+            literal, width = char, 1
+
+        if pattern[index + width : index + width + 1] in _QUANTIFIERS:
+            break
+        prefix.append(literal)
+        index += width
+    return "".join(prefix), pattern[index:]
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Return the lowest string greater than all the strings starting with a prefix.
+
+    Args:
+        prefix (str): Literal prefix (ie, 'john').
+
+    Returns:
+        Optional[str]: Upper bound (ie, 'joho'), None if there isn't one.
+    """
+    while prefix:
+        code_point = ord(prefix[-1]) + 1
+        if code_point <= sys.maxunicode:
+            if _SURROGATES_START <= code_point <= _SURROGATES_END:
+                code_point = _SURROGATES_END + 1
+            return prefix[:-1] + chr(code_point)
+        prefix = prefix[:-1]
+    return None
+
+
+def _compares_strings(condition: Any) -> bool:
+    """Check if a condition compares strings, a collation would change its result.
+
+    Args:
+        condition (Any): Condition of a filter key.
+
+    Returns:
+        bool: True if the condition has a string value.
+    """
+    if isinstance(condition, str):
+        return True
+    if isinstance(condition, dict):
+        return any(_compares_strings(value) for value in condition.values())
+    if isinstance(condition, list):
+        return any(_compares_strings(value) for value in condition)
+    return False
+
+
+def _rewrite(regex: Any, pattern: str, flags: str) -> tuple[str, Any]:
+    """Rewrite a regex equality into an index friendly condition.
+
+    Args:
+        regex (Any): Regex condition.
+        pattern (str): Regex pattern.
+        flags (str): Regex flags.
+
+    Returns:
+        Tuple[str, Any]: Rewrite kind ('range', 'equality', 'case_insensitive' or 'unindexed') and condition (the
+            matched value of a case insensitive exact match).
+    """
+    # With the multiline flag, '^' matches after each line break. An alternation isn't anchored by '^'.
+    if not pattern.startswith("^") or "m" in flags or "|" in pattern:
+        return "unindexed", regex
+
+    prefix, remaining_pattern = _literal_prefix(pattern[1:])
+    if remaining_pattern == "$":
+        return ("case_insensitive" if "i" in flags else "equality"), prefix
+    if not prefix or "i" in flags:
+        return "unindexed", regex
+
+    upper_bound = _prefix_upper_bound(prefix)
+    if upper_bound is not None and remaining_pattern == "":
+        return "range", {"$gte": prefix, "$lt": upper_bound}
+    # The remaining pattern is checked on the documents of the prefix range.
+    regex_condition = regex if isinstance(regex, dict) else {"$regex": regex}
+    if upper_bound is None:
+        return "range", {**regex_condition, "$gte": prefix}
+    return "range", {**regex_condition, "$gte": prefix, "$lt": upper_bound}
+
+
+def rewrite_regex(
+    mongodb_filter: Mapping[str, Any],
+    collation: dict[str, Any] | None = None,
+    sort: Sequence[tuple[str, int]] | None = None,
+    non_string_fields: Collection[str] = (),
+) -> RegexRewrite:
+    r"""Rewrite the regex filters into index friendly predicates.
+
+    Notes:
+        Regex of all the output formats are rewritten. A case sensitive anchored literal prefix (ie, '/^john/') is a
+        `$gte` / `$lt` range, with the regex if the pattern doesn't end with the prefix (ie, '/^john.*doe/'). An exact
+        match (ie, '/^john@x\.com$/') is an equality. A case insensitive exact match (ie, '/^john@x\.com$/i') is an
+        equality with the collation (ie, `{'locale': 'en', 'strength': 2}`, the collation of the index), only if no
+        other filter compares strings and the query isn't sorted on a field which may hold strings: the collation
+        applies to the whole query, sort included.
+
+    Args:
+        mongodb_filter (Mapping[str, Any]): Filter from `mqm()` / `QueryParser.parse()`.
+        collation (Optional[Dict[str, Any]]): Case insensitive collation, None to keep the case insensitive regex.
+        sort (Optional[Sequence[Tuple[str, int]]]): Sort of the query, its keys may hold strings.
+        non_string_fields (Collection[str]): Fields which never hold strings (ie, see `non_string_fields`), their sort
+            isn't changed by the collation.
+
+    Returns:
+        RegexRewrite: Rewritten filter, collation of the query and the keys which are still a regex scan.
+    """
+    rewritten_filter: dict[str, Any] = {}
+    case_insensitive: dict[str, str] = {}
+    unindexed: list[str] = []
+    compares_strings = any(key not in non_string_fields for key, _ in sort or ())
+    for key, condition in mongodb_filter.items():
+        regex_parts = _regex_parts(condition)
+        if regex_parts is None:
+            if isinstance(condition, dict) and any(_regex_parts(value) for value in condition.values()):
+                # Regex operand of an operator (ie, {'$ne': re.compile('/^06/')}).
+                unindexed.append(key)
+            compares_strings = compares_strings or key.startswith("$") or _compares_strings(condition)
+            rewritten_filter[key] = condition
+            continue
+
+        kind, rewritten_condition = _rewrite(condition, *regex_parts)
+        if kind == "case_insensitive":
+            case_insensitive[key] = rewritten_condition
+            rewritten_filter[key] = condition
+        elif kind == "unindexed":
+            unindexed.append(key)
+            rewritten_filter[key] = condition
+        else:
+            compares_strings = True
+            rewritten_filter[key] = rewritten_condition
+
+    if not case_insensitive:
+        return RegexRewrite(rewritten_filter, None, unindexed)
+    if collation is None or compares_strings:
+        return RegexRewrite(rewritten_filter, None, [*unindexed, *case_insensitive])
+
+    rewritten_filter.update(case_insensitive)
+    return RegexRewrite(rewritten_filter, collation, unindexed)
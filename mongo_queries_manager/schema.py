@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# Copyright (c) Dangla Théo, 2026
+
+"""Schema module.
+
+This module contain the compilation of a field schema, declared fields are cast with the caster of their type instead
+of the value type guessing.
+"""
+
+from __future__ import annotations
+
+__all__ = ["UNKNOWN_FIELDS", "array_fields", "compile_schema", "non_string_fields"]
+
+from collections.abc import Callable, Iterator, Mapping
+from datetime import datetime
+from typing import Any
+
+from mongo_queries_manager.mongodb_queries_manager import PureCaster
+
+# Behaviours of the fields missing from a schema, cast by type guessing or rejected.
+UNKNOWN_FIELDS = ("infer", "reject")
+
+_BOOLEAN_VALUES = {"true": True, "1": True, "false": False, "0": False}
+
+
+def _bool_cast(value: str) -> bool:
+    """Cast a declared boolean value, case insensitive 'true' / 'false' or '1' / '0'.
+
+    Args:
+        value (str): Value to cast.
+
+    Returns:
+        bool: Cast value.
+    """
+    try:
+        return _BOOLEAN_VALUES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Invalid boolean {value}") from None
+
+
+# Casters of the types which can't cast a string by themselves (ie, bool('false') is True).
+_type_casters: dict[Any, Callable[[str], Any]] = {
+    bool: _bool_cast,
+    datetime: datetime.fromisoformat,
+}
+
+
+def _flatten(schema: Mapping[str, Any], parent_path: str = "") -> Iterator[tuple[str, Any]]:
+    """Flatten a nested schema into dotted paths (ie, {'author': {'name': str}} -> ('author.name', str)).
+
+    Args:
+        schema (Mapping[str, Any]): Schema, a type or a nested schema by field.
+        parent_path (str): Dotted path of the nested schema.
+
+    Yields:
+        Tuple[str, Any]: Dotted path and type of a field.
+    """
+    for field, field_type in schema.items():
+        path = f"{parent_path}{field}"
+        if isinstance(field_type, Mapping):
+            yield from _flatten(field_type, parent_path=f"{path}.")
+        else:
+            yield path, field_type
+
+
+def _item_type(path: str, field_type: Any) -> Any:
+    """Return the item type of an array field type (ie, [str] -> str), the type of a scalar field.
+
+    Args:
+        path (str): Dotted path of the field.
+        field_type (Any): Field type, or a list of its item type for an array field.
+
+    Returns:
+        Any: Type of the values of the field.
+    """
+    if isinstance(field_type, list):
+        if len(field_type) != 1:
+            raise TypeError(f"Schema type of array field {path} must be a list of one type")
+        return field_type[0]
+    return field_type
+
+
+def array_fields(schema: Mapping[str, Any]) -> frozenset[str]:
+    """Return the array fields of a field schema, declared with a list of their item type (ie, {'tags': [str]}).
+
+    Args:
+        schema (Mapping[str, Any]): Type by dotted path, or nested.
+
+    Returns:
+        FrozenSet[str]: Dotted paths of the array fields, the other declared fields are scalar.
+    """
+    return frozenset(path for path, field_type in _flatten(schema) if isinstance(field_type, list))
+
+
+def non_string_fields(schema: Mapping[str, Any]) -> frozenset[str]:
+    """Return the fields of a field schema declared with a type which isn't a string (ie, int, datetime, ObjectId).
+
+    Notes:
+        The fields declared with a callable or a `PureCaster` may hold strings, they aren't returned.
+
+    Args:
+        schema (Mapping[str, Any]): Type by dotted path, or nested.
+
+    Returns:
+        FrozenSet[str]: Dotted paths of the fields which never compare strings.
+    """
+    field_types = ((path, _item_type(path, declared_type)) for path, declared_type in _flatten(schema))
+    return frozenset(
+        path for path, field_type in field_types if isinstance(field_type, type) and not issubclass(field_type, str)
+    )
+
+
+def compile_schema(schema: Mapping[str, Any]) -> dict[str, Callable[[str], Any]]:
+    """Compile a field schema into a caster by dotted path.
+
+    Notes:
+        `bool` accepts 'true' / 'false' / '1' / '0' and `datetime` isoformat dates, other types (ie, `str`, `int`,
+        `ObjectId`, `Decimal128`) or callables are called with the value, a `PureCaster` is memoized. An array field
+        is declared with a list of its item type (ie, [str]), its values are cast with the item type.
+
+    Args:
+        schema (Mapping[str, Any]): Type by dotted path (ie, {'_id': ObjectId, 'created': datetime}), or nested.
+
+    Returns:
+        Dict[str, Callable]: Caster by dotted path.
+    """
+    casters: dict[str, Callable[[str], Any]] = {}
+    for path, declared_type in _flatten(schema):
+        field_type = _item_type(path, declared_type)
+        if isinstance(field_type, PureCaster):
+            casters[path] = field_type.memoized
+        elif field_type in _type_casters:
+            casters[path] = _type_casters[field_type]
+        elif callable(field_type):
+            casters[path] = field_type
+        else:
+            raise TypeError(f"Schema type of field {path} isn't callable")
+    return casters
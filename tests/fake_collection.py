@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+"""In-memory stand-in of a PyMongo collection (`find` only), recording its queries."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import operator
+from typing import Any
+
+_OPERATORS = {
+    "$in": lambda value, values: value in values,
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+    "$ne": operator.ne,
+}
+
+
+def _match(document: dict[str, Any], mongodb_filter: dict[str, Any]) -> bool:
+    for key, value in mongodb_filter.items():
+        if isinstance(value, dict):
+            if not all(_OPERATORS[name](document.get(key), bound) for name, bound in value.items()):
+                return False
+        elif document.get(key) != value:
+            return False
+    return True
+
+
+def _project(document: dict[str, Any], projection: dict[str, Any] | None) -> dict[str, Any]:
+    document = copy.deepcopy(document)
+    if not projection:
+        return document
+    if any(value for key, value in projection.items() if key != "_id"):
+        document = {key: value for key, value in document.items() if key in projection or key == "_id"}
+    for key, value in projection.items():
+        if not value:
+            document.pop(key, None)
+    return document
+
+
+class FakeCollection:
+    def __init__(self, documents: list[dict[str, Any]], name: str = "documents") -> None:
+        """Initialize FakeCollection class."""
+        self.name = name
+        self.documents = documents
+        self.queries: list[dict[str, Any]] = []
+        # Collation and execution options of each query.
+        self.options: list[dict[str, Any]] = []
+
+    def find(  # noqa: PLR0913
+        self,
+        mongodb_filter: dict[str, Any],
+        projection: dict[str, Any] | None = None,
+        sort: list[tuple[str, int]] | None = None,
+        skip: int = 0,
+        limit: int = 0,
+        **options: Any,
+    ) -> list[dict[str, Any]]:
+        self.queries.append(mongodb_filter)
+        self.options.append(options)
+        documents = [document for document in self.documents if _match(document, mongodb_filter)]
+        for key, direction in reversed(sort or []):
+            documents.sort(key=lambda document: document[key], reverse=direction == -1)  # noqa: B023
+        documents = documents[skip : skip + limit if limit else None]
+        return [_project(document, projection) for document in documents]
+
+
+class FakeAsyncCursor:
+    def __init__(self, collection: FakeAsyncCollection, documents: list[dict[str, Any]]) -> None:
+        """Initialize FakeAsyncCursor class."""
+        self.collection = collection
+        self.documents = documents
+
+    async def to_list(self, length: int | None) -> list[dict[str, Any]]:
+        self.collection.in_flight += 1
+        self.collection.max_in_flight = max(self.collection.max_in_flight, self.collection.in_flight)
+        try:
+            await asyncio.sleep(self.collection.delay)
+            if self.collection.error is not None:
+                raise self.collection.error
+        except asyncio.CancelledError:
+            self.collection.cancelled += 1
+            raise
+        finally:
+            self.collection.in_flight -= 1
+        return self.documents[:length]
+
+
+class FakeAsyncCollection(FakeCollection):
+    def __init__(self, documents: list[dict[str, Any]], delay: float = 0, error: Exception | None = None) -> None:
+        """Initialize FakeAsyncCollection class, each query takes `delay` seconds."""
+        super().__init__(documents)
+        self.delay = delay
+        self.error = error
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+
+    def find(self, *args: Any, **kwargs: Any) -> FakeAsyncCursor:  # type: ignore[override]
+        return FakeAsyncCursor(self, super().find(*args, **kwargs))
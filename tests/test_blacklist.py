@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-from mongo_queries_manager import mqm
+import pytest
+from mongo_queries_manager import QueryParser, mqm
+from mongo_queries_manager.helpers import FieldTrie, is_blacklisted_value
 
 
 def test_empty_blacklist_query() -> None:
@@ -31,3 +33,50 @@ def test_blacklist_query() -> None:
         "limit": 0,
         "projection": None,
     }
+
+
+def test_blacklist_operators_query() -> None:
+    query_result = mqm(
+        string_query="status=5&where>5&where!=6&!where&sort=-status&limit=5",
+        blacklist=["where", "limit"],
+    )
+
+    assert query_result == {
+        "filter": {"status": 5},
+        "sort": [("status", -1)],
+        "skip": 0,
+        "limit": 0,
+        "projection": None,
+    }
+
+
+def test_allowed_fields_query() -> None:
+    parser = QueryParser(allowed_fields=["status", "author"], blacklist=["author.password"])
+    query_result = parser.parse(
+        "status=5&price>5&author.name=John&author.password=secret&!author&!deleted_at&authors=1&limit=5"
+    )
+
+    assert query_result == {
+        "filter": {"status": 5, "author.name": "John", "author": {"$exists": False}},
+        "sort": None,
+        "skip": 0,
+        "limit": 5,
+        "projection": None,
+    }
+
+
+def test_field_trie() -> None:
+    field_trie = FieldTrie(["author.name", "status", "status.code", "company.address.city", "company"])
+
+    assert field_trie.match("author.name")
+    assert field_trie.match("author.name.first")
+    assert not field_trie.match("author")
+    assert not field_trie.match("author.email")
+    assert field_trie.match("status.code")
+    assert field_trie.match("company.name")
+    assert not field_trie.match("")
+
+
+def test_deprecated_is_blacklisted_value() -> None:
+    with pytest.deprecated_call():
+        assert [is_blacklisted_value(["token"], arg) for arg in ("token=abc", "status=sent")] == [True, False]
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import pytest
+from mongo_queries_manager import MemoryDocumentCache, QueryCache, QueryParser, mqm
+from mongo_queries_manager import cache as cache_module
+
+_PYTEST_HAS_DATEPARSER: bool
+try:
+    import dateparser  # nopycln: import # noqa: F401
+
+    _PYTEST_HAS_DATEPARSER = True
+except ModuleNotFoundError:
+    _PYTEST_HAS_DATEPARSER = False
+
+
+class TestCache:
+    def test_cache_hit(self) -> None:
+        cache = QueryCache()
+        parser = QueryParser(cache=cache)
+
+        assert parser.parse("price>5&country=GB,US") == parser.parse("price>5&country=GB,US")
+        assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    def test_cache_mutation(self) -> None:
+        parser = QueryParser(cache=QueryCache())
+
+        query_result = parser.parse("price>5&country=GB,US")
+        query_result["filter"]["price"]["$lt"] = 10
+        query_result["filter"]["country"]["$in"].append("FR")
+
+        query_result = parser.parse("price>5&country=GB,US")
+        query_result["filter"]["name"] = "John"
+
+        assert parser.parse("price>5&country=GB,US")["filter"] == {
+            "price": {"$gt": 5},
+            "country": {"$in": ["GB", "US"]},
+        }
+
+    def test_cache_eviction(self) -> None:
+        cache = QueryCache(maxsize=2)
+        parser = QueryParser(cache=cache)
+
+        parser.parse("a=1")
+        parser.parse("b=1")
+        parser.parse("a=1")
+        parser.parse("c=1")
+
+        assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+        parser.parse("a=1")
+        parser.parse("b=1")
+        assert (cache.hits, cache.misses) == (2, 4)
+
+    def test_cache_parser_configuration(self) -> None:
+        cache = QueryCache()
+
+        assert mqm("status=5&latitude=43.6", cache=cache) == {
+            "filter": {"status": 5, "latitude": 43.6},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+        assert mqm("status=5&latitude=43.6", blacklist=["latitude"], cache=cache) == {
+            "filter": {"status": 5},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_cache_custom_caster(self) -> None:
+        cache = QueryCache()
+        parser = QueryParser(casters={"string": str}, cache=cache)
+
+        parser.parse("price=string(5)")
+        parser.parse("price=string(5)")
+
+        assert len(cache) == 0
+
+    def test_cache_iso_date(self) -> None:
+        cache = QueryCache()
+        parser = QueryParser(cache=cache)
+
+        parser.parse("date>2016-01-01T10:00:00")
+        parser.parse("date>2016-01-01T10:00:00")
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    @pytest.mark.skipif(
+        _PYTEST_HAS_DATEPARSER is False,
+        reason="Test skipped because dateparser isn't install.",
+    )
+    def test_cache_date_with_dateparser_lib(self) -> None:
+        cache = QueryCache()
+        parser = QueryParser(cache=cache)
+
+        parser.parse("date>2016-01")
+        parser.parse("date>2016-01")
+
+        assert len(cache) == 0
+
+    def test_cache_clear(self) -> None:
+        cache = QueryCache()
+        parser = QueryParser(cache=cache)
+
+        parser.parse("a=1")
+        parser.parse("a=1")
+        cache.clear()
+
+        assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+    def test_cache_bad_maxsize(self) -> None:
+        with pytest.raises(ValueError) as excinfo:
+            _ = QueryCache(maxsize=0)
+
+        assert excinfo.value.__str__() == "Cache maxsize must be positive"
+
+
+class TestMemoryDocumentCache:
+    def test_get_many(self) -> None:
+        cache = MemoryDocumentCache()
+        cache.set_many("users", {"u0": {"_id": "u0", "name": "John"}}, projection="")
+        documents = cache.get_many("users", ["u0", "u1"], projection="")
+
+        assert documents == {"u0": {"_id": "u0", "name": "John"}}
+        assert cache.get_many("users", ["u0"], projection="[('name', 1)]") == {}
+        assert cache.get_many("posts", ["u0"], projection="") == {}
+        assert (cache.hits, cache.misses) == (1, 3)
+
+        # Cached documents are copies
+        documents["u0"]["name"] = "updated"
+        assert cache.get_many("users", ["u0"], projection="") == {"u0": {"_id": "u0", "name": "John"}}
+
+    def test_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = MemoryDocumentCache(ttl=10)
+        cache.set_many("users", {"u0": {"_id": "u0"}}, projection="")
+
+        now[0] += 9
+        assert cache.get_many("users", ["u0"], projection="") == {"u0": {"_id": "u0"}}
+        now[0] += 1
+        assert cache.get_many("users", ["u0"], projection="") == {}
+        assert len(cache) == 0
+
+    def test_lru_eviction(self) -> None:
+        cache = MemoryDocumentCache(maxsize=2)
+        cache.set_many("users", {"u0": {"_id": "u0"}, "u1": {"_id": "u1"}}, projection="")
+        cache.get_many("users", ["u0"], projection="")
+        cache.set_many("users", {"u2": {"_id": "u2"}}, projection="")
+
+        assert cache.get_many("users", ["u0", "u1", "u2"], projection="") == {"u0": {"_id": "u0"}, "u2": {"_id": "u2"}}
+
+    def test_invalidate(self) -> None:
+        cache = MemoryDocumentCache()
+        cache.set_many("users", {"u0": {"_id": "u0"}, "u1": {"_id": "u1"}}, projection="")
+        cache.set_many("users", {"u0": {"_id": "u0"}}, projection="[('name', 1)]")
+        cache.set_many("posts", {"u0": {"_id": "u0"}}, projection="")
+        cache.invalidate("users", ["u0"])
+
+        assert cache.get_many("users", ["u0", "u1"], projection="") == {"u1": {"_id": "u1"}}
+        assert cache.get_many("users", ["u0"], projection="[('name', 1)]") == {}
+        assert len(cache) == 2  # noqa: PLR2004
+
+        cache.clear("users")
+        assert cache.get_many("posts", ["u0"], projection="") == {"u0": {"_id": "u0"}}
+        assert len(cache) == 1
+
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    def test_bad_configuration(self) -> None:
+        with pytest.raises(ValueError, match="Cache maxsize and ttl must be positive"):
+            MemoryDocumentCache(ttl=0)
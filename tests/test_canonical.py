@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from mongo_queries_manager import QueryParser, canonicalize, fingerprint, mqm, shape_hash
+
+
+class TestCanonicalize:
+    def test_canonicalize(self) -> None:
+        mongodb_query = mqm(
+            "status=sent&country=US,GB,US&price<10&price>5&sort=-created_at,_id,-created_at&fields=title,-_id"
+        )
+
+        assert canonicalize(mongodb_query) == {
+            "filter": {"country": {"$in": ["GB", "US"]}, "price": {"$gt": 5.0, "$lt": 10.0}, "status": "sent"},
+            "sort": [("created_at", -1), ("_id", 1)],
+            "skip": 0,
+            "limit": 0,
+            "projection": {"_id": 0, "title": 1},
+        }
+        assert list(canonicalize(mongodb_query)["filter"]) == ["country", "price", "status"]
+        assert list(canonicalize(mongodb_query)["filter"]["price"]) == ["$gt", "$lt"]
+
+    def test_set_values(self) -> None:
+        mongodb_query = {
+            "filter": {
+                "tags": {"$nin": [True, 1, "a", 1, None, re.compile("b"), re.compile("a")]},
+                "items": {"$in": [{"b": 1}, {"a": 1}, {"a": 1}]},
+            },
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+        assert canonicalize(mongodb_query)["filter"] == {
+            "items": {"$in": [{"a": 1}, {"a": 1}, {"b": 1}]},
+            "tags": {"$nin": [None, re.compile("a"), re.compile("b"), True, 1, "a"]},
+        }
+
+    def test_set_numbers(self) -> None:
+        mongodb_query = {
+            "filter": {"price": {"$in": [2.0, 1, 1.0, True, 2]}},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+        assert canonicalize(mongodb_query)["filter"] == {"price": {"$in": [True, 1, 2.0]}}
+
+    def test_logical_operators(self) -> None:
+        mongodb_query = {
+            "filter": {"$or": [{"b": 1, "a": {"$in": [2, 1]}}, {"a": 0}], "tags": {"$elemMatch": {"y": 1, "x": 2}}},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+        assert canonicalize(mongodb_query)["filter"] == {
+            "$or": [{"a": 0}, {"a": {"$in": [1, 2]}, "b": 1}],
+            "tags": {"$elemMatch": {"x": 2, "y": 1}},
+        }
+
+    def test_embedded_document_is_kept(self) -> None:
+        mongodb_query = {
+            "filter": {"address": {"zip": "75001", "city": "Paris"}},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+        assert list(canonicalize(mongodb_query)["filter"]["address"]) == ["zip", "city"]
+
+    def test_population(self) -> None:
+        mongodb_query = mqm("populate=user,tags,user.company&fields=user.name,user.age", populate=True)
+
+        assert canonicalize(mongodb_query)["population"] == [
+            {"path": "tags", "projection": None},
+            {
+                "path": "user",
+                "projection": {"age": 1, "name": 1},
+                "population": [{"path": "company", "projection": None}],
+            },
+        ]
+
+
+class TestFingerprint:
+    def test_equivalent_queries(self) -> None:
+        parser = QueryParser(populate=True)
+        first_query = parser.parse("a=1&b=John&country=GB,US&populate=user,tags&fields=y,z")
+        second_query = parser.parse("country=US,GB,US&b=John&a=1&populate=tags,user&fields=z,y")
+
+        assert fingerprint(first_query) == fingerprint(second_query)
+        assert fingerprint(first_query) != fingerprint(parser.parse("a=1&b=Jane&country=GB,US"))
+        assert fingerprint(parser.parse("sort=a,b")) != fingerprint(parser.parse("sort=b,a"))
+
+    def test_numbers(self) -> None:
+        mongodb_query = {**mqm(""), "filter": {"a": 1.0, "b": {"$in": [1.0, 2.5]}}}
+
+        assert fingerprint(mongodb_query) == fingerprint(
+            {**mongodb_query, "filter": {"a": 1, "b": {"$in": [2.5, 1, 1.0]}}}
+        )
+        assert fingerprint(mqm("a=1")) == fingerprint(QueryParser(casters={"int": int}).parse("a=int(1)"))
+        assert fingerprint(mqm("a=1")) != fingerprint(mqm("a=true"))
+        assert fingerprint(mqm("a=1")) != fingerprint(mqm("a=1.5"))
+
+    def test_unstable_representation(self) -> None:
+        class Opaque:
+            pass
+
+        class Token:
+            def __repr__(self) -> str:
+                return "Token()"
+
+        mongodb_query = mqm("a=1")
+
+        with pytest.raises(TypeError, match="Value of type .*Opaque has no stable representation"):
+            fingerprint({**mongodb_query, "filter": {"a": Opaque()}})
+        assert fingerprint({**mongodb_query, "filter": {"a": Token()}}) == fingerprint(
+            {**mongodb_query, "filter": {"a": Token()}}
+        )
+        assert fingerprint({**mongodb_query, "filter": {"a": Token()}}) != fingerprint(
+            {**mongodb_query, "filter": {"a": "Token()"}}
+        )
+
+    def test_shape_hash(self) -> None:
+        parser = QueryParser()
+        shape = shape_hash(parser.parse("price>5&status=sent&country=GB,US&sort=-created_at&limit=10"))
+
+        assert shape == shape_hash(parser.parse("status=draft&price>50&country=FR,DE&sort=-created_at&skip=5"))
+        assert shape != shape_hash(parser.parse("status=draft&price<50&country=FR&sort=-created_at"))
+        assert shape != shape_hash(parser.parse("price>5&status=sent&country=GB,US&sort=created_at"))
+        assert shape != shape_hash(parser.parse("price>5&status=sent&country=GB,US&sort=-created_at&fields=title"))
+
+    def test_regex_shape(self) -> None:
+        string_queries = ("name=John", "name=/jo/", "name!=John", "name!=/jo/")
+
+        assert len({shape_hash(mqm(string_query)) for string_query in string_queries}) == len(string_queries)
+        assert shape_hash(mqm("name=/jo/")) == shape_hash(mqm("name=/^smith$/i"))
+        assert shape_hash(mqm("name=/jo/")) == shape_hash(QueryParser(regex_output="operator").parse("name=/jo/i"))
+        assert shape_hash({**mqm(""), "filter": {"name": {"$in": ["John", re.compile("^jo")]}}}) != shape_hash(
+            mqm("name=John,Jane")
+        )
+
+    def test_mongo_query(self) -> None:
+        query = QueryParser().parse_query("b=2&a=1&fields=title")
+
+        assert query.fingerprint() == fingerprint(mqm("a=1&b=2&fields=title"))
+        assert query.shape_hash() == shape_hash(mqm("a=3&b=4&fields=title"))
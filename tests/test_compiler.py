@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+import pytest
+from bson import ObjectId
+from mongo_queries_manager import CompiledParser, FilterError, LimitError, QueryParser, SchemaError, mqm
+
+# Types and values guessed the same way by `mqm()` (only lists of letters are guessed).
+SCHEMA = {
+    "name": str,
+    "price": float,
+    "created": datetime,
+    "active": bool,
+    "author": {"country": str, "age": float},
+}
+
+VALUES: dict[str, list[str]] = {
+    "name": ["John", "Jane Doe", "John,Jane"],
+    "price": ["5", "5.6", "-1e3"],
+    "created": ["2016-01-01", "2016-01-01T10:00:00", "2016-01-01T10:00:00+02:00"],
+    "active": ["true", "False"],
+    "author.country": ["GB", "GB,US,FR"],
+    "author.age": ["30", "18.5"],
+}
+
+OPERATORS = ("=", "!=", ">", ">=", "<", "<=")
+
+
+def _random_arg(rng: random.Random) -> str:
+    """Random argument of a valid string query."""
+    field = rng.choice(list(VALUES))
+    kind = rng.choice(("filter", "filter", "filter", "exists", "sort", "limit", "skip", "fields", "other"))
+    if kind == "filter":
+        operator = rng.choice(OPERATORS)
+        values = [value for value in VALUES[field] if operator in ("=", "!=") or value.find(",") == -1]
+        return f"{field}{operator}{rng.choice(values)}"
+    if kind == "exists":
+        return rng.choice(("", "!")) + field
+    if kind == "sort":
+        return "sort=" + ",".join(
+            rng.choice(("", "+", "-")) + rng.choice(list(VALUES)) for _ in range(rng.randint(0, 3))
+        )
+    if kind in ("limit", "skip"):
+        return f"{kind}={rng.randint(0, 100)}"
+    if kind == "fields":
+        sign = rng.choice(("", "-"))
+        return "fields=" + ",".join(sign + rng.choice(list(VALUES)) for _ in range(rng.randint(0, 3)))
+    return rng.choice(("", "populate=author", "$text=java -coffee", "token=abc", "!token"))
+
+
+def _random_invalid_arg(rng: random.Random) -> str:
+    """Random argument, usually invalid (unknown field, bad value or operator)."""
+    return "".join(
+        rng.choice(["name", "price", "created", "email", "5", "x", "=", "!", "<", ">", ",", "."]) for _ in range(4)
+    )
+
+
+def _parse(parse: Callable[[str], dict[str, Any]], string_query: str) -> Any:
+    """Parse a string query, the error type if it fails."""
+    try:
+        return parse(string_query)
+    except Exception as err:
+        return type(err)
+
+
+class TestCompiledParser:
+    def test_parse(self) -> None:
+        parser = CompiledParser({"_id": ObjectId, **SCHEMA}, blacklist=["token"])
+
+        assert parser.parse(
+            "_id=5f3f7d3b9c6f1d2b3c4d5e6f&name=John,Jane&price>=5&price<10&!created&token=abc&"
+            "sort=-price&skip=5&limit=10&fields=-_id"
+        ) == {
+            "filter": {
+                "_id": ObjectId("5f3f7d3b9c6f1d2b3c4d5e6f"),
+                "name": {"$in": ["John", "Jane"]},
+                "price": {"$gte": 5.0, "$lt": 10.0},
+                "created": {"$exists": False},
+            },
+            "sort": [("price", -1)],
+            "skip": 5,
+            "limit": 10,
+            "projection": {"_id": 0},
+        }
+
+    def test_equivalent_to_mqm(self) -> None:
+        parser = CompiledParser(SCHEMA, blacklist=["token"])
+        rng = random.Random(2026)
+
+        for _ in range(2000):
+            string_query = "&".join(_random_arg(rng) for _ in range(rng.randint(0, 6)))
+            assert _parse(parser.parse, string_query) == _parse(
+                lambda string_query: mqm(string_query, blacklist=["token"]), string_query
+            ), string_query
+
+    def test_equivalent_to_query_parser(self) -> None:
+        schema = {"_id": ObjectId, "zip": str, "count": int, **SCHEMA}
+        parser = CompiledParser(schema, blacklist=["token", "limit"])
+        query_parser = QueryParser(schema=schema, unknown_fields="reject", blacklist=["token", "limit"])
+        rng = random.Random(2020)
+
+        for _ in range(2000):
+            string_query = "&".join(
+                rng.choice((_random_arg, _random_invalid_arg))(rng) for _ in range(rng.randint(0, 4))
+            )
+            assert _parse(parser.parse, string_query) == _parse(query_parser.parse, string_query), string_query
+
+    def test_reject(self) -> None:
+        parser = CompiledParser(SCHEMA, sort_fields=["price"], projection_fields=["name"])
+
+        assert parser.parse("sort=-price&fields=name")["sort"] == [("price", -1)]
+        for string_query in ("email=john@example.com", "!email", "sort=name", "fields=-price", "price>five"):
+            with pytest.raises(SchemaError):
+                parser.parse(string_query)
+        with pytest.raises(FilterError):
+            parser.parse("price>5>6")
+        with pytest.raises(LimitError):
+            parser.parse("limit=-1")
+
+    def test_blacklisted_control_key(self) -> None:
+        parser = CompiledParser(SCHEMA, blacklist=["limit", "$text"])
+
+        assert parser.parse("limit=-1&$text=java&name=John") == {
+            "filter": {"name": "John"},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+    def test_bad_field_name(self) -> None:
+        for schema in ({"price>": float}, {"2016": str}):
+            with pytest.raises(ValueError):
+                CompiledParser(schema)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import pytest
+from mongo_queries_manager import QueryLimitError, QueryLimits, QueryParser, estimate_cost, mqm
+
+
+class TestEstimateCost:
+    def test_predicates(self) -> None:
+        assert estimate_cost(mqm("status=sent&price>5&limit=10")) == pytest.approx(3.1)
+
+    def test_list_values(self) -> None:
+        assert estimate_cost(mqm("status=sent,received,draft&limit=10")) == pytest.approx(2.13)
+
+    def test_regex_and_text(self) -> None:
+        assert estimate_cost(mqm("name=/john/&limit=10")) == pytest.approx(11.1)
+        assert estimate_cost(mqm("$text=john&limit=10")) == pytest.approx(21.1)
+        assert estimate_cost(mqm("$text=john&name=/john/&limit=10")) == pytest.approx(81.1)
+
+    def test_skip_and_limit(self) -> None:
+        assert estimate_cost(mqm("skip=1000&limit=100")) == pytest.approx(3.0)
+        assert estimate_cost(mqm("")) == pytest.approx(11.0)
+
+    def test_population(self) -> None:
+        mongodb_query = mqm("limit=10&populate=user,user.company", populate=True)
+
+        assert estimate_cost(mongodb_query) == pytest.approx(16.1)
+
+
+class TestQueryLimits:
+    parser = QueryParser(
+        populate=True,
+        limits=QueryLimits(
+            max_arguments=5,
+            max_list_values=3,
+            max_skip=100,
+            max_limit=100,
+            max_populate_depth=2,
+            text_with_regex=False,
+            max_cost=30,
+        ),
+    )
+
+    def test_admitted(self) -> None:
+        assert self.parser.parse("status=sent,received&limit=10&populate=user,user.company") == {
+            "filter": {"status": {"$in": ["sent", "received"]}},
+            "sort": None,
+            "skip": 0,
+            "limit": 10,
+            "projection": None,
+            "cost": pytest.approx(17.12),
+            "population": [
+                {"path": "user", "projection": None, "population": [{"path": "company", "projection": None}]}
+            ],
+        }
+
+    def test_max_arguments(self) -> None:
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("a=1&b=2&c=3&d=4&e=5&limit=10")
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("a=1%26b=2%26c=3%26d=4%26e=5&limit=10")
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("a=1&b=2&c=3&d=4&&e=5&&&limit=10&")
+
+    def test_empty_arguments(self) -> None:
+        parser = QueryParser(limits=QueryLimits(max_arguments=3))
+
+        assert parser.parse("a=1&b=2&c=3&")["filter"] == {"a": 1, "b": 2, "c": 3}
+        assert parser.parse("&&a=1&&b=2&&&c=3&&")["filter"] == {"a": 1, "b": 2, "c": 3}
+        with pytest.raises(QueryLimitError):
+            parser.parse("a=1&b=2&c=3&&d=4")
+
+    def test_max_list_values(self) -> None:
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("status=a,b,c,d&limit=10")
+        assert self.parser.parse("status=a,b,c&limit=10")["filter"] == {"status": {"$in": ["a", "b", "c"]}}
+
+    def test_max_skip_and_limit(self) -> None:
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("skip=101&limit=10")
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("limit=101")
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("status=sent")
+
+    def test_checked_when_read(self) -> None:
+        cast_values: list[str] = []
+        parser = QueryParser(
+            casters={"record": cast_values.append},
+            populate=True,
+            limits=QueryLimits(max_skip=100, max_limit=100, max_populate_depth=2),
+        )
+
+        for query_string in ("skip=101", "limit=101", "populate=user.company.country"):
+            with pytest.raises(QueryLimitError):
+                parser.parse(f"{query_string}&price=record(5)&limit=10")
+        assert cast_values == []
+
+    def test_max_populate_depth(self) -> None:
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("limit=10&populate=user,user.company,user.company.country")
+
+    def test_text_with_regex(self) -> None:
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("$text=john&name=/john/&limit=10")
+
+    def test_max_cost(self) -> None:
+        with pytest.raises(QueryLimitError):
+            self.parser.parse("name=/john/&city=/par/&email=/@x/&limit=10")
+
+    def test_mongo_query(self) -> None:
+        assert self.parser.parse_query("status=sent&limit=10").cost == pytest.approx(2.1)
+        assert QueryParser().parse_query("status=sent").cost is None
@@ -3,8 +3,10 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
-from mongo_queries_manager import CustomCasterFail, mqm
+from mongo_queries_manager import CustomCasterFail, PureCaster, QueryCache, QueryParser, mqm
 
 
 class TestCustomCast:
@@ -51,3 +53,52 @@ class TestCustomCast:
             _ = mqm(string_query="price=float(A.B)", casters={"float": float})
 
         assert excinfo.value.__str__() == "Fail to cast float(A.B) with caster float"
+
+    def test_custom_cast_nested(self) -> None:
+        query_result = mqm(string_query="name=string(string(5))", casters={"string": str})
+
+        assert query_result["filter"] == {"name": "string(5)"}
+
+    def test_custom_cast_unknown(self) -> None:
+        query_result = mqm(string_query="price=float(5)&name=(John)", casters={"string": str})
+
+        assert query_result["filter"] == {"price": "float(5)", "name": "(John)"}
+
+    def test_pure_custom_cast(self) -> None:
+        calls: list[str] = []
+
+        def upper(value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        cache = QueryCache()
+        parser = QueryParser(casters={"upper": PureCaster(upper)}, cache=cache)
+
+        assert parser.parse("name=upper(john)&nickname=upper(john)")["filter"] == {"name": "JOHN", "nickname": "JOHN"}
+        assert parser.parse("name=upper(john)&limit=5")["filter"] == {"name": "JOHN"}
+        assert calls == ["john"]
+        assert len(cache) == 2  # noqa: PLR2004
+
+    def test_pure_custom_cast_shared(self) -> None:
+        calls: list[str] = []
+
+        def upper(value: str) -> str:
+            calls.append(value)
+            return value.upper()
+
+        pure_upper = PureCaster(upper)
+        # Memoized values are shared by the parsers using the same caster (ie, a new config of each mqm() call).
+        assert QueryParser(casters={"upper": pure_upper}).parse("name=upper(john)")["filter"] == {"name": "JOHN"}
+        assert mqm("name=upper(john)", casters={"upper": pure_upper, "string": str})["filter"] == {"name": "JOHN"}
+        assert QueryParser(schema={"name": pure_upper}).parse("name=john")["filter"] == {"name": "JOHN"}
+        assert calls == ["john"]
+
+        # Pickled without its memoized values (process pool workers).
+        unpickled = pickle.loads(pickle.dumps(PureCaster(str.upper, maxsize=8)))  # noqa: S301
+        assert (unpickled.func, unpickled.maxsize, unpickled.memoized("a")) == (str.upper, 8, "A")
+
+    def test_pure_custom_cast_fail(self) -> None:
+        with pytest.raises(CustomCasterFail) as excinfo:
+            _ = mqm(string_query="price=float(A.B)", casters={"float": PureCaster(float)})
+
+        assert excinfo.value.__str__() == "Fail to cast float(A.B) with caster float"
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from mongo_queries_manager import mqm
@@ -56,3 +56,17 @@ def test_datetime_query_with_a_datetime_format() -> None:
         "limit": 0,
         "projection": None,
     }
+
+
+def test_datetime_query_with_a_timezone_offset() -> None:
+    query_result = mqm(string_query="date>2022-10-29T12:42:07-05:30", blacklist=[])
+
+    assert query_result == {
+        "filter": {
+            "date": {"$gt": datetime(2022, 10, 29, 12, 42, 7, tzinfo=timezone(-timedelta(hours=5, minutes=30)))}
+        },
+        "sort": None,
+        "skip": 0,
+        "limit": 0,
+        "projection": None,
+    }
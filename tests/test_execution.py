@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import pytest
+from mongo_queries_manager import ExecutionOptions, QueryLimits, QueryParser, find_populated, fingerprint, mqm
+from pymongo import MongoClient
+
+from tests.fake_collection import FakeCollection
+
+
+class TestExecutionOptions:
+    parser = QueryParser(
+        execution=ExecutionOptions(max_time_ms=500, batch_size=100, allow_disk_use=False, hint=[("status", 1)])
+    )
+
+    def test_fixed(self) -> None:
+        assert self.parser.parse("status=sent&limit=20") == {
+            "filter": {"status": "sent"},
+            "sort": None,
+            "skip": 0,
+            "limit": 20,
+            "projection": None,
+            "max_time_ms": 500,
+            "batch_size": 20,
+            "allow_disk_use": False,
+            "hint": [("status", 1)],
+        }
+
+    def test_batch_size(self) -> None:
+        string_queries = ("status=sent", "status=sent&limit=1000")
+
+        assert [self.parser.parse(string_query)["batch_size"] for string_query in string_queries] == [100, 100]
+
+    def test_default_batch_size(self) -> None:
+        parser = QueryParser(execution=ExecutionOptions(max_time_ms=500))
+
+        string_queries = ("status=sent&limit=20", "status=sent")
+
+        assert [parser.parse(string_query).get("batch_size") for string_query in string_queries] == [20, None]
+
+    def test_unset(self) -> None:
+        assert QueryParser(execution=ExecutionOptions(max_time_ms=500)).parse("status=sent") == {
+            "filter": {"status": "sent"},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+            "max_time_ms": 500,
+        }
+
+    def test_scaled_from_cost(self) -> None:
+        parser = QueryParser(execution=ExecutionOptions(max_time_ms=200, time_per_cost=10))
+
+        string_queries = ("status=sent&limit=20", "name=/john/&limit=20", "name=/john/")
+
+        assert [parser.parse(string_query)["max_time_ms"] for string_query in string_queries] == [22, 112, 200]
+
+    def test_scaled_from_limits_cost(self) -> None:
+        parser = QueryParser(
+            populate=True, limits=QueryLimits(max_limit=100), execution=ExecutionOptions(time_per_cost=2)
+        )
+        mongodb_query = parser.parse("status=sent&limit=20&populate=user")
+
+        assert (mongodb_query["cost"], mongodb_query["max_time_ms"]) == (pytest.approx(7.2), 15)
+
+    def test_mongo_query(self) -> None:
+        query = self.parser.parse_query("status=sent&limit=20")
+
+        assert query.to_find_kwargs() == {
+            "filter": {"status": "sent"},
+            "projection": None,
+            "sort": None,
+            "skip": 0,
+            "limit": 20,
+            "max_time_ms": 500,
+            "batch_size": 20,
+            "allow_disk_use": False,
+            "hint": [("status", 1)],
+        }
+        assert query.to_count_kwargs() == {
+            "filter": {"status": "sent"},
+            "limit": 20,
+            "maxTimeMS": 500,
+            "hint": [("status", 1)],
+        }
+        assert fingerprint(query) == fingerprint(mqm("status=sent&limit=20"))
+
+    def test_find_cursor(self) -> None:
+        collection = MongoClient(connect=False).db.collection
+        cursor = collection.find(**self.parser.parse_query("status=sent&limit=20").to_find_kwargs())
+
+        assert cursor.collection is collection
+
+    def test_fingerprint(self) -> None:
+        assert self.parser.fingerprint != QueryParser(execution=ExecutionOptions(max_time_ms=500)).fingerprint
+        assert QueryParser(execution=ExecutionOptions(hint="status_1")).fingerprint == (
+            QueryParser(execution=ExecutionOptions(hint="status_1")).fingerprint
+        )
+
+    def test_find_populated(self) -> None:
+        users = FakeCollection([{"_id": "u0", "name": "user0"}], "users")
+        posts = FakeCollection([{"_id": 0, "status": "sent", "author": "u0"}])
+        parser = QueryParser(populate=True, execution=self.parser.execution)
+
+        documents = find_populated(posts, parser.parse("status=sent&limit=20&populate=author"), {"author": users}.get)
+
+        assert documents == [{"_id": 0, "status": "sent", "author": {"_id": "u0", "name": "user0"}}]
+        assert posts.options == [
+            {"max_time_ms": 500, "batch_size": 20, "allow_disk_use": False, "hint": [("status", 1)]}
+        ]
+        assert users.options == [{}]
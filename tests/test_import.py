@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
+
+
+def test_import_is_lazy() -> None:
+    stdout = subprocess.run(
+        [sys.executable, "-c", "import sys, mongo_queries_manager; print(' '.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    modules = {module.partition(".")[0] for module in stdout.split()}
+
+    assert "dateparser" not in modules
+    assert "json" not in modules
+    # Imported by the async executor / loader and the batch parsing workers only
+    assert "asyncio" not in modules
+    assert "multiprocessing" not in modules
+    assert "concurrent" not in modules
+
+
+def test_lazy_regex_tables() -> None:
+    assert MongoDBQueriesManager.type_regex.match("5").lastgroup == "float"  # type: ignore[union-attr]
+    assert MongoDBQueriesManager.type_regex is MongoDBQueriesManager.type_regex
+    constants = [key for key in MongoDBQueriesManager.regex_dict if isinstance(key, str)]
+    assert constants == ["true", "false", "null", "none"]
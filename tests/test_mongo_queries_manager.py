@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import pytest
 from mongo_queries_manager import FilterError, ListOperatorError, mqm
+from mongo_queries_manager.helpers import parse_query_operation
+from mongo_queries_manager.mongodb_queries_manager import MongoDBQueriesManager
 
 
 def test_empty_url_query() -> None:
@@ -38,3 +40,27 @@ def test_operator_error() -> None:
         _ = mqm(string_query="flag==toto")
 
     assert excinfo.value.__str__() == "Fail to split filter flag==toto with operator ="
+
+
+def test_filter_merge_error() -> None:
+    with pytest.raises(FilterError) as excinfo:
+        _ = mqm(string_query="price=5&price>3")
+
+    assert excinfo.value.__str__() == "Fail to merge filter price>3 with key price"
+
+
+def test_split_operation() -> None:
+    assert MongoDBQueriesManager.split_operation("price>=5") == ("price", ">=", "5")
+    assert MongoDBQueriesManager.split_operation("name=a>b") == ("name", "=", "a>b")
+    assert MongoDBQueriesManager.split_operation("price<=5") == ("price", "<=", "5")
+    assert MongoDBQueriesManager.split_operation("!email") == ("", "!", "email")
+    assert MongoDBQueriesManager.split_operation("phone") == ("", "", "phone")
+
+
+def test_deprecated_parse_query_operation() -> None:
+    mongodb_query = mqm("")
+    with pytest.deprecated_call():
+        for arg in ("price>5", "price<10", "sort=-price", "limit=10", "populate=user", ""):
+            parse_query_operation(mongodb_query, arg, MongoDBQueriesManager(), populate=False)
+
+    assert mongodb_query == mqm("price>5&price<10&sort=-price&limit=10")
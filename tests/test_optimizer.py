@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import re
+from datetime import datetime
+
+from mongo_queries_manager import OptimizedFilter, QueryCache, QueryParser, mqm, optimize_filter
+
+# Scalar fields, 'score' values are numbers or strings.
+SCHEMA = {
+    "price": float,
+    "status": str,
+    "country": str,
+    "email": str,
+    "m": datetime,
+    "score": lambda value: float(value) if value.isdigit() else value,
+    "tags": [float],
+}
+
+
+class TestOptimizer:
+    parser = QueryParser(optimize=True, schema=SCHEMA)
+
+    def test_tightest_bounds(self) -> None:
+        assert self.parser.parse("price>5&price>=7&price<10&price<=12") == {
+            "filter": {"price": {"$gte": 7.0, "$lt": 10.0}},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+            "empty": False,
+        }
+        assert self.parser.parse("price>=5&price>5")["filter"] == {"price": {"$gt": 5.0}}
+        assert self.parser.parse("price>=5&price<=5")["filter"] == {"price": 5.0}
+        assert self.parser.parse("m>=2016-01-01&m>=2017-01-01")["filter"] == {"m": {"$gte": datetime(2017, 1, 1)}}
+
+    def test_single_value_list(self) -> None:
+        assert self.parser.parse("country=US,GB&country=US,FR")["filter"] == {"country": "US"}
+        assert self.parser.parse("country!=US,GB&country!=US")["filter"] == {"country": {"$nin": ["US", "GB"]}}
+        assert optimize_filter({"country": {"$in": ["US"]}, "status": {"$nin": ["draft"]}}, SCHEMA) == OptimizedFilter(
+            {"country": "US", "status": {"$ne": "draft"}}, empty=False
+        )
+
+    def test_duplicates(self) -> None:
+        assert self.parser.parse("status=sent&status=sent&!email&!email")["filter"] == {
+            "status": "sent",
+            "email": {"$exists": False},
+        }
+        assert self.parser.parse("price>5&price!=3&email&email!=a")["filter"] == {
+            "price": {"$gt": 5.0},
+            "email": {"$ne": "a", "$exists": True},
+        }
+
+    def test_contradictions(self) -> None:
+        assert self.parser.parse("price>10&price<5&status=sent") == {
+            "filter": {"price": {"$in": []}, "status": "sent"},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+            "empty": True,
+        }
+        assert self.parser.parse("price>5&price<5")["empty"]
+        assert self.parser.parse("status=sent&status=draft")["empty"]
+        assert self.parser.parse("status=sent&status!=sent")["empty"]
+        assert self.parser.parse("country=US,GB&country=FR")["empty"]
+        assert self.parser.parse("!email&email=a@b.c")["empty"]
+        assert self.parser.parse("!price&price>5")["empty"]
+        assert self.parser.parse("!email&email")["empty"]
+        assert not self.parser.parse("!email&email!=a@b.c")["empty"]
+        assert self.parser.parse("price>5&price>7&price<3")["filter"] == {"price": {"$in": []}}
+
+    def test_exists_contradictions(self) -> None:
+        # A missing field can't match a value, array or not.
+        for parser in (self.parser, QueryParser(optimize=True)):
+            assert parser.parse("!tags&tags=5") == {
+                "filter": {"tags": {"$in": []}},
+                "sort": None,
+                "skip": 0,
+                "limit": 0,
+                "projection": None,
+                "empty": True,
+            }
+            assert parser.parse("!tags&tags>5")["empty"]
+            assert parser.parse("!tags&tags=1,2")["empty"]
+            assert parser.parse("tags&!tags")["empty"]
+            assert parser.parse("!tags&tags!=5")["filter"] == {"tags": {"$ne": 5.0, "$exists": False}}
+
+        assert QueryParser(optimize=True).parse("!tags&tags=null")["filter"] == {
+            "tags": {"$eq": None, "$exists": False}
+        }
+        assert optimize_filter({"tags": {"$exists": False, "$all": [1]}}) == OptimizedFilter(
+            {"tags": {"$exists": False, "$all": [1]}}, empty=False
+        )
+
+    def test_not_optimizable(self) -> None:
+        mongodb_filter = {"email": {"$regex": re.compile("@gmail"), "$ne": "a"}, "tags": {"$elemMatch": {"a": 1}}}
+
+        assert optimize_filter(mongodb_filter) == OptimizedFilter(mongodb_filter, empty=False)
+        assert self.parser.parse("score>5&score<abc")["filter"] == {"score": {"$gt": 5.0, "$lt": "abc"}}
+        assert not self.parser.parse("$text=java&price>5")["empty"]
+
+    def test_array_fields(self) -> None:
+        for parser in (self.parser, QueryParser(optimize=True)):
+            # [1, 10] matches both predicates.
+            assert parser.parse("tags>5&tags<3") == {
+                "filter": {"tags": {"$gt": 5.0, "$lt": 3.0}},
+                "sort": None,
+                "skip": 0,
+                "limit": 0,
+                "projection": None,
+                "empty": False,
+            }
+            assert parser.parse("tags>=5&tags<=5&tags!=7")["filter"] == {
+                "tags": {"$gte": 5.0, "$lte": 5.0, "$ne": 7.0}
+            }
+            # Bounds of the same side are still combined.
+            assert parser.parse("tags>5&tags>=7")["filter"] == {"tags": {"$gte": 7.0}}
+            assert parser.parse("tags>5&tags>7&tags<3")["filter"] == {"tags": {"$gt": 7.0, "$lt": 3.0}}
+            assert parser.parse("tags!=1&tags!=2")["filter"] == {"tags": {"$nin": [1.0, 2.0]}}
+
+        assert QueryParser(optimize=True).parse("country=US,GB&country=US,FR")["filter"] == {
+            "country": {"$in": ["US", "FR"]}
+        }
+        assert optimize_filter({"price": {"$gt": 10, "$lt": 5}}) == OptimizedFilter(
+            {"price": {"$gt": 10, "$lt": 5}}, empty=False
+        )
+        assert optimize_filter({"price": {"$gt": 10, "$lt": 5}}, {"price"}).empty
+        # Without schema, 'price' may be an array.
+        assert QueryParser(optimize=True).parse("price>5&price>7&price<3") == {
+            "filter": {"price": {"$gt": 7.0, "$lt": 3.0}},
+            "sort": None,
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+            "empty": False,
+        }
+
+    def test_mongo_query(self) -> None:
+        query = self.parser.parse_query("price>10&price<5&fields=title")
+
+        assert query.empty
+        assert list(query) == ["filter", "sort", "skip", "limit", "projection", "empty"]
+        assert not QueryParser().parse_query("price>10&price<5").empty
+        assert not QueryParser(optimize=True).parse_query("price>10&price<5").empty
+        assert QueryParser(optimize=True, schema=SCHEMA, cache=QueryCache()).parse_query("price>10&price<5").empty
+
+    def test_disabled(self) -> None:
+        assert "empty" not in mqm("price>5&price<10")
+        assert QueryParser().parse("price>5&price>7")["filter"] == {"price": {"$gt": 7.0}}
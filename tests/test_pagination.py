@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import operator
+from datetime import datetime
+from typing import Any
+
+import pytest
+from bson import ObjectId
+from mongo_queries_manager import PaginationError, QueryParser, encode_page_token, mqm
+
+_OPERATORS = {"$gt": operator.gt, "$lt": operator.lt, "$ne": operator.ne}
+
+
+def _match_operator(name: str, value: Any, bound: Any) -> bool:
+    """Match a range operator, range operators don't match null / missing values (type bracketing)."""
+    if name != "$ne" and value is None:
+        return False
+    return bool(_OPERATORS[name](value, bound))
+
+
+def _match(document: dict[str, Any], mongodb_filter: dict[str, Any]) -> bool:
+    """Minimal filter matcher ($or, equality, $ne and range operators), a missing field is null."""
+    for key, value in mongodb_filter.items():
+        if key == "$or":
+            if not any(_match(document, branch) for branch in value):
+                return False
+        elif isinstance(value, dict):
+            if not all(_match_operator(name, document.get(key), bound) for name, bound in value.items()):
+                return False
+        elif document.get(key) != value:
+            return False
+    return True
+
+
+def _find(documents: list[dict[str, Any]], mongodb_query: dict[str, Any]) -> list[dict[str, Any]]:
+    """Minimal find (filter, sort with null values first and limit)."""
+    results = [document for document in documents if _match(document, mongodb_query["filter"])]
+    for key, direction in reversed(mongodb_query["sort"]):
+        results.sort(
+            key=lambda document: (document.get(key) is not None, document.get(key) or 0),  # noqa: B023
+            reverse=direction == -1,
+        )
+    return results[: mongodb_query["limit"]]
+
+
+class TestKeysetPagination:
+    def test_keyset_disabled(self) -> None:
+        assert mqm("after=abc")["filter"] == {"after": "abc"}
+
+    def test_first_page(self) -> None:
+        parser = QueryParser(keyset=True)
+
+        assert parser.parse("after=&limit=10") == {
+            "filter": {},
+            "sort": [("_id", 1)],
+            "skip": 0,
+            "limit": 10,
+            "projection": None,
+        }
+        assert parser.parse("sort=-created_at,_id")["sort"] == [("created_at", -1), ("_id", 1)]
+
+    def test_after_token(self) -> None:
+        parser = QueryParser(keyset=True)
+        document = {"_id": ObjectId("5f4ea8f1e4b0b7a4c1a7e2d1"), "created_at": datetime(2016, 1, 1, 10), "price": 5}
+        token = encode_page_token(document, sort=[("created_at", -1)])
+
+        assert parser.parse(f"status=sent&sort=-created_at&after={token}") == {
+            "filter": {
+                "status": "sent",
+                "$or": [
+                    {"created_at": {"$lt": datetime(2016, 1, 1, 10)}},
+                    {"created_at": None},
+                    {"created_at": datetime(2016, 1, 1, 10), "_id": {"$gt": ObjectId("5f4ea8f1e4b0b7a4c1a7e2d1")}},
+                ],
+            },
+            "sort": [("created_at", -1), ("_id", 1)],
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+    def test_before_token(self) -> None:
+        parser = QueryParser(keyset=True)
+        token = encode_page_token({"_id": 3, "author": {"name": "John"}}, sort=[("author.name", 1)])
+
+        assert parser.parse(f"sort=author.name&before={token}") == {
+            "filter": {
+                "$or": [
+                    {"author.name": {"$lt": "John"}},
+                    {"author.name": None},
+                    {"author.name": "John", "_id": {"$lt": 3}},
+                ]
+            },
+            "sort": [("author.name", -1), ("_id", -1)],
+            "skip": 0,
+            "limit": 0,
+            "projection": None,
+        }
+
+    def test_pages(self) -> None:
+        parser = QueryParser(keyset=True)
+        documents = [{"_id": index, "price": index % 4, "name": f"item{index % 3}"} for index in range(23)]
+        sort_arg = "sort=-price,name"
+
+        pages, token = [], ""
+        while True:
+            page = _find(documents, parser.parse(f"{sort_arg}&limit=5&after={token}"))
+            if not page:
+                break
+            pages.append(page)
+            token = encode_page_token(page[-1], sort=parser.parse(sort_arg)["sort"])
+
+        assert [document for page in pages for document in page] == _find(
+            documents, {**parser.parse(sort_arg), "limit": None}
+        )
+
+        # Previous page of the last page, from its first document (reversed order).
+        token = encode_page_token(pages[-1][0], sort=parser.parse(sort_arg)["sort"])
+        assert _find(documents, parser.parse(f"{sort_arg}&limit=5&before={token}"))[::-1] == pages[-2]
+
+    def test_pages_with_null_sort_values(self) -> None:
+        parser = QueryParser(keyset=True)
+        documents: list[dict[str, Any]] = [{"_id": index, "price": index % 4 or None} for index in range(23)]
+        for document in documents[::5]:
+            del document["price"]
+
+        for sort_arg in ("sort=price", "sort=-price"):
+            pages, token = [], ""
+            while True:
+                page = _find(documents, parser.parse(f"{sort_arg}&limit=4&after={token}"))
+                if not page:
+                    break
+                pages.append(page)
+                token = encode_page_token(page[-1], sort=parser.parse(sort_arg)["sort"])
+
+            assert [document for page in pages for document in page] == _find(
+                documents, {**parser.parse(sort_arg), "limit": None}
+            )
+
+            for previous_page, page in zip(pages, pages[1:], strict=False):
+                token = encode_page_token(page[0], sort=parser.parse(sort_arg)["sort"])
+                assert _find(documents, parser.parse(f"{sort_arg}&limit=4&before={token}"))[::-1] == previous_page
+
+    def test_null_token_filter(self) -> None:
+        parser = QueryParser(keyset=True)
+        token = encode_page_token({"_id": 3}, sort=[("price", 1)])
+
+        assert parser.parse(f"sort=price&after={token}")["filter"] == {
+            "$or": [{"price": {"$ne": None}}, {"price": None, "_id": {"$gt": 3}}]
+        }
+        assert parser.parse(f"sort=price&before={token}")["filter"] == {"$or": [{"price": None, "_id": {"$lt": 3}}]}
+
+    def test_blacklisted_token(self) -> None:
+        parser = QueryParser(blacklist=["after"], keyset=True)
+        token = encode_page_token({"_id": 3}, sort=None)
+
+        assert parser.parse(f"after={token}")["filter"] == {}
+
+    def test_token_errors(self) -> None:
+        parser = QueryParser(keyset=True)
+        token = encode_page_token({"_id": 3, "price": 5}, sort=[("price", 1)])
+
+        with pytest.raises(PaginationError, match="Page token doesn't match the query sort"):
+            parser.parse(f"after={token}")
+
+        with pytest.raises(PaginationError, match="Fail to decode page token"):
+            parser.parse("after=not-a-token")
+
+        with pytest.raises(PaginationError, match="Fail to paginate both after and before a page token"):
+            parser.parse(f"sort=price&after={token}&before={token}")
+
+        with pytest.raises(PaginationError, match="Fail to encode"):
+            encode_page_token({"_id": 3, "price": object()}, sort=[("price", 1)])
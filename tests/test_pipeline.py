@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+from typing import Any
+
+from mongo_queries_manager import mqm, to_pipeline
+from mongo_queries_manager.helpers import ensure_population_paths
+
+
+def _lookup(path: str, collection: str, pipeline: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    lookup_field = f"_lookup_{path}"
+    return [
+        {
+            "$lookup": {
+                "from": collection,
+                "localField": path,
+                "foreignField": "_id",
+                "pipeline": pipeline,
+                "as": lookup_field,
+            }
+        },
+        {
+            "$set": {
+                path: {
+                    "$cond": {
+                        "if": {"$isArray": f"${path}"},
+                        "then": f"${lookup_field}",
+                        "else": {"$arrayElemAt": [f"${lookup_field}", 0]},
+                    }
+                }
+            }
+        },
+        {"$unset": lookup_field},
+    ]
+
+
+class TestPipeline:
+    def test_empty_query(self) -> None:
+        assert to_pipeline(mqm("")) == []
+
+    def test_pipeline(self) -> None:
+        mongodb_query = mqm("status=sent&price>=5.6&sort=-created_at,_id&skip=20&limit=10&fields=-_id")
+
+        assert to_pipeline(mongodb_query) == [
+            {"$match": {"status": "sent", "price": {"$gte": 5.6}}},
+            {"$sort": {"created_at": -1, "_id": 1}},
+            {"$skip": 20},
+            {"$limit": 10},
+            {"$project": {"_id": 0}},
+        ]
+
+    def test_population_pipeline(self) -> None:
+        mongodb_query = mqm(
+            "status=sent&limit=10&populate=author,author.company,comments"
+            "&fields=title,author.name,author.company.name",
+            populate=True,
+        )
+
+        assert to_pipeline(mongodb_query, collections={"author": "users", "author.company": "companies"}) == [
+            {"$match": {"status": "sent"}},
+            {"$limit": 10},
+            {"$project": {"title": 1, "author": 1, "comments": 1}},
+            *_lookup(
+                "author",
+                "users",
+                [
+                    {"$project": {"name": 1, "company": 1}},
+                    *_lookup("company", "companies", [{"$project": {"name": 1}}]),
+                ],
+            ),
+            *_lookup("comments", "comments", []),
+        ]
+
+    def test_population_exclusion_projection(self) -> None:
+        mongodb_query = mqm("populate=author&fields=-created_at,-author.password", populate=True)
+
+        assert to_pipeline(mongodb_query) == [
+            {"$project": {"created_at": 0}},
+            *_lookup("author", "author", [{"$project": {"password": 0}}]),
+        ]
+
+
+def test_ensure_population_paths() -> None:
+    population = [{"path": "author", "projection": None}]
+
+    assert ensure_population_paths({"title": 1, "_id": 0}, population) == {"title": 1, "_id": 0, "author": 1}
+    assert ensure_population_paths({"_id": 0}, population) == {"_id": 0}
+    assert ensure_population_paths({"author": 1}, population) == {"author": 1}
+    assert ensure_population_paths(None, population) is None
+    assert ensure_population_paths({"title": 1}, None) == {"title": 1}
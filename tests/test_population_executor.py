@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+from mongo_queries_manager import MemoryDocumentCache, find_populated, mqm, populate_documents
+
+from tests.fake_collection import FakeCollection
+
+
+class TestPopulationExecutor:
+    def setup_method(self) -> None:
+        self.companies = FakeCollection(
+            [{"_id": f"c{index}", "name": f"company{index}"} for index in range(2)], "companies"
+        )
+        self.users = FakeCollection(
+            [
+                {"_id": f"u{index}", "name": f"user{index}", "password": "secret", "company": f"c{index % 2}"}
+                for index in range(4)
+            ],
+            "users",
+        )
+        self.posts = FakeCollection(
+            [
+                {"_id": index, "title": f"post{index}", "author": f"u{index % 3}", "readers": ["u0", "u3", "u9"]}
+                for index in range(6)
+            ]
+        )
+        self.collections = {"author": self.users, "readers": self.users, "author.company": self.companies}
+
+    def test_find_populated(self) -> None:
+        mongodb_query = mqm(
+            "_id<3&sort=-_id&populate=author,author.company&fields=title,author.name,author.company.name",
+            populate=True,
+        )
+        documents = find_populated(self.posts, mongodb_query, self.collections.__getitem__)
+
+        assert documents == [
+            {
+                "_id": 2,
+                "title": "post2",
+                "author": {"_id": "u2", "name": "user2", "company": {"_id": "c0", "name": "company0"}},
+            },
+            {
+                "_id": 1,
+                "title": "post1",
+                "author": {"_id": "u1", "name": "user1", "company": {"_id": "c1", "name": "company1"}},
+            },
+            {
+                "_id": 0,
+                "title": "post0",
+                "author": {"_id": "u0", "name": "user0", "company": {"_id": "c0", "name": "company0"}},
+            },
+        ]
+        # One query per level, with deduplicated ids
+        assert self.users.queries == [{"_id": {"$in": ["u2", "u1", "u0"]}}]
+        assert self.companies.queries == [{"_id": {"$in": ["c0", "c1"]}}]
+
+    def test_populate_references_list(self) -> None:
+        mongodb_query = mqm("limit=2&populate=readers&fields=-readers._id,-readers.password", populate=True)
+        documents = find_populated(self.posts, mongodb_query, self.collections.__getitem__)
+
+        # Missing reference (u9) is removed, '_id' excluded from the populated documents
+        assert [document["readers"] for document in documents] == [
+            [{"name": "user0", "company": "c0"}, {"name": "user3", "company": "c1"}],
+            [{"name": "user0", "company": "c0"}, {"name": "user3", "company": "c1"}],
+        ]
+        assert self.users.queries == [{"_id": {"$in": ["u0", "u3", "u9"]}}]
+
+    def test_populate_chunks(self) -> None:
+        documents = [{"_id": index, "author": f"u{index}"} for index in range(5)]
+        populate_documents(
+            documents, [{"path": "author", "projection": {"name": 1}}], self.collections.__getitem__, chunk_size=2
+        )
+
+        assert documents[3] == {"_id": 3, "author": {"_id": "u3", "name": "user3"}}
+        assert documents[4] == {"_id": 4, "author": None}
+        assert self.users.queries == [
+            {"_id": {"$in": ["u0", "u1"]}},
+            {"_id": {"$in": ["u2", "u3"]}},
+            {"_id": {"$in": ["u4"]}},
+        ]
+
+    def test_populate_without_references(self) -> None:
+        documents = [{"_id": 1}]
+        populate_documents(documents, [{"path": "author", "projection": None}], self.collections.__getitem__)
+
+        assert documents == [{"_id": 1}]
+        assert self.users.queries == []
+
+    def test_populate_with_cache(self) -> None:
+        cache = MemoryDocumentCache()
+        population = [{"path": "author", "projection": {"name": 1}}]
+        populate_documents([{"author": "u0"}, {"author": "u1"}], population, self.collections.__getitem__, cache=cache)
+        documents = [{"author": "u1"}, {"author": "u2"}]
+        populate_documents(documents, population, self.collections.__getitem__, cache=cache)
+
+        assert documents == [{"author": {"_id": "u1", "name": "user1"}}, {"author": {"_id": "u2", "name": "user2"}}]
+        # Only the missing documents are queried
+        assert self.users.queries == [{"_id": {"$in": ["u0", "u1"]}}, {"_id": {"$in": ["u2"]}}]
+
+        cache.invalidate("users", ["u1"])
+        populate_documents([{"author": "u1"}, {"author": "u2"}], population, self.collections.__getitem__, cache=cache)
+        assert self.users.queries[-1] == {"_id": {"$in": ["u1"]}}
+
+    def test_find_populated_with_cache(self) -> None:
+        cache = MemoryDocumentCache()
+        mongodb_query = mqm("_id<2&populate=author,author.company&fields=author.name", populate=True)
+        first_documents = find_populated(self.posts, mongodb_query, self.collections.__getitem__, cache=cache)
+        documents = find_populated(self.posts, mongodb_query, self.collections.__getitem__, cache=cache)
+
+        assert documents == first_documents
+        assert documents[0]["author"] == {"_id": "u0", "name": "user0", "company": {"_id": "c0", "name": "company0"}}
+        assert len(self.users.queries) == len(self.companies.queries) == 1
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from mongo_queries_manager import (
+    MemoryDocumentCache,
+    PopulationLoader,
+    find_populated_async,
+    mqm,
+    populate_documents_async,
+)
+
+from tests.fake_collection import FakeAsyncCollection
+
+DELAY = 0.05
+
+
+class TestAsyncPopulationExecutor:
+    def setup_method(self) -> None:
+        self.users = FakeAsyncCollection([{"_id": f"u{index}", "name": f"user{index}"} for index in range(3)], DELAY)
+        self.tags = FakeAsyncCollection([{"_id": f"t{index}", "label": f"tag{index}"} for index in range(3)], DELAY)
+        self.settings = FakeAsyncCollection([{"_id": "s0", "theme": "dark", "owner": "u1"}], DELAY)
+        self.posts = FakeAsyncCollection(
+            [{"_id": index, "author": f"u{index}", "tags": [f"t{index}", "t0"], "settings": "s0"} for index in range(3)]
+        )
+        self.collections = {
+            "author": self.users,
+            "tags": self.tags,
+            "settings": self.settings,
+            "settings.owner": self.users,
+        }
+
+    def test_find_populated_async(self) -> None:
+        mongodb_query = mqm(
+            "_id<2&populate=author,tags,settings,settings.owner&fields=author.name,tags.label,settings.owner.name",
+            populate=True,
+        )
+        documents = asyncio.run(find_populated_async(self.posts, mongodb_query, self.collections.__getitem__))
+
+        assert documents == [
+            {
+                "_id": 0,
+                "author": {"_id": "u0", "name": "user0"},
+                "tags": [{"_id": "t0", "label": "tag0"}, {"_id": "t0", "label": "tag0"}],
+                "settings": {"_id": "s0", "theme": "dark", "owner": {"_id": "u1", "name": "user1"}},
+            },
+            {
+                "_id": 1,
+                "author": {"_id": "u1", "name": "user1"},
+                "tags": [{"_id": "t1", "label": "tag1"}, {"_id": "t0", "label": "tag0"}],
+                "settings": {"_id": "s0", "theme": "dark", "owner": {"_id": "u1", "name": "user1"}},
+            },
+        ]
+        assert self.users.queries == [{"_id": {"$in": ["u0", "u1"]}}, {"_id": {"$in": ["u1"]}}]
+
+    def test_find_populated_async_options(self) -> None:
+        mongodb_query = {**mqm("_id<2&limit=1"), "collation": {"locale": "en", "strength": 2}, "max_time_ms": 500}
+        asyncio.run(find_populated_async(self.posts, mongodb_query, self.collections.__getitem__))
+
+        assert self.posts.options == [{"collation": {"locale": "en", "strength": 2}, "max_time_ms": 500}]
+
+    def test_siblings_are_concurrent(self) -> None:
+        population = [{"path": path, "projection": None} for path in ("author", "tags", "settings")]
+        documents = [{"_id": 0, "author": "u0", "tags": ["t0"], "settings": "s0"}]
+
+        start = time.perf_counter()
+        asyncio.run(populate_documents_async(documents, population, self.collections.__getitem__))
+
+        # Close to the slowest query, not to the sum of the queries
+        assert time.perf_counter() - start < DELAY * 2.5  # noqa: PLR2004
+        assert documents[0]["settings"] == {"_id": "s0", "theme": "dark", "owner": "u1"}
+
+    def test_max_concurrency(self) -> None:
+        documents = [{"_id": index, "author": f"u{index}"} for index in range(3)]
+        population = [{"path": "author", "projection": None}]
+        asyncio.run(populate_documents_async(documents, population, self.collections.__getitem__, chunk_size=1))
+        assert self.users.max_in_flight == 3  # noqa: PLR2004
+
+        self.users.max_in_flight = 0
+        documents = [{"_id": index, "author": f"u{index}"} for index in range(3)]
+        asyncio.run(
+            populate_documents_async(
+                documents, population, self.collections.__getitem__, chunk_size=1, max_concurrency=2
+            )
+        )
+        assert self.users.max_in_flight == 2  # noqa: PLR2004
+        assert documents[2] == {"_id": 2, "author": {"_id": "u2", "name": "user2"}}
+
+    def test_failure_cancels_siblings(self) -> None:
+        self.tags.delay = 0
+        self.tags.error = RuntimeError("connection lost")
+        self.users.delay = 10
+        documents = [{"_id": 0, "author": "u0", "tags": ["t0"]}]
+        population = [{"path": "author", "projection": None}, {"path": "tags", "projection": None}]
+
+        with pytest.raises(RuntimeError, match="connection lost"):
+            asyncio.run(populate_documents_async(documents, population, self.collections.__getitem__))
+        assert self.users.cancelled == 1
+
+    def test_abandoned_request_cancels_queries(self) -> None:
+        self.users.delay = 10
+        documents = [{"_id": 0, "author": "u0"}]
+        population = [{"path": "author", "projection": None}]
+
+        async def abandoned_request() -> None:
+            await asyncio.wait_for(populate_documents_async(documents, population, self.collections.__getitem__), 0.05)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(abandoned_request())
+        assert self.users.cancelled == 1
+        assert documents == [{"_id": 0, "author": "u0"}]
+
+    def test_populate_with_cache_and_loader(self) -> None:
+        cache = MemoryDocumentCache()
+        loader = PopulationLoader()
+        population = [{"path": "author", "projection": None}]
+
+        async def requests() -> None:
+            await populate_documents_async(
+                [{"author": "u0"}], population, self.collections.__getitem__, loader=loader, cache=cache
+            )
+            await asyncio.gather(
+                *(
+                    populate_documents_async(
+                        [{"author": author}], population, self.collections.__getitem__, loader=loader, cache=cache
+                    )
+                    for author in ("u0", "u1", "u2")
+                )
+            )
+
+        asyncio.run(requests())
+        assert self.users.queries == [{"_id": {"$in": ["u0"]}}, {"_id": {"$in": ["u1", "u2"]}}]
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from mongo_queries_manager import PopulationLoader, populate_documents_async
+
+from tests.fake_collection import FakeAsyncCollection
+
+POPULATION = [{"path": "author", "projection": {"name": 1}}]
+
+
+class TestPopulationLoader:
+    def setup_method(self) -> None:
+        self.users = FakeAsyncCollection([{"_id": f"u{index}", "name": f"user{index}"} for index in range(5)], 0.01)
+
+    async def _request(self, loader: PopulationLoader, authors: list[str], delay: float = 0) -> list[dict[str, Any]]:
+        await asyncio.sleep(delay)
+        documents = [{"_id": index, "author": author} for index, author in enumerate(authors)]
+        await populate_documents_async(documents, POPULATION, {"author": self.users}.__getitem__, loader=loader)
+        return documents
+
+    def test_concurrent_requests_are_batched(self) -> None:
+        loader = PopulationLoader()
+
+        async def requests() -> list[list[dict[str, Any]]]:
+            return await asyncio.gather(
+                self._request(loader, ["u0", "u1"]),
+                self._request(loader, ["u1", "u2"]),
+                self._request(loader, ["u4"]),
+            )
+
+        first, second, third = asyncio.run(requests())
+
+        assert [document["author"] for document in second] == [
+            {"_id": "u1", "name": "user1"},
+            {"_id": "u2", "name": "user2"},
+        ]
+        assert third == [{"_id": 0, "author": {"_id": "u4", "name": "user4"}}]
+        assert self.users.queries == [{"_id": {"$in": ["u0", "u1", "u2", "u4"]}}]
+        assert (loader.loads, loader.batches, loader.batch_sizes, loader.mean_batch_size) == (3, 1, {4: 1}, 4)
+
+        # Each request has its own documents
+        first[1]["author"]["name"] = "updated"
+        assert second[0]["author"] == {"_id": "u1", "name": "user1"}
+
+    def test_window(self) -> None:
+        async def requests(loader: PopulationLoader) -> None:
+            await asyncio.gather(self._request(loader, ["u0"]), self._request(loader, ["u1"], delay=0.005))
+
+        asyncio.run(requests(PopulationLoader()))
+        assert self.users.queries == [{"_id": {"$in": ["u0"]}}, {"_id": {"$in": ["u1"]}}]
+
+        self.users.queries.clear()
+        asyncio.run(requests(PopulationLoader(window=0.05)))
+        assert self.users.queries == [{"_id": {"$in": ["u0", "u1"]}}]
+
+    def test_max_batch_size(self) -> None:
+        loader = PopulationLoader(max_batch_size=2)
+
+        async def requests() -> None:
+            await asyncio.gather(*(self._request(loader, [f"u{index}"]) for index in range(5)))
+
+        asyncio.run(requests())
+        assert loader.batch_sizes == {2: 2, 1: 1}
+
+    def test_load_larger_than_max_batch_size(self) -> None:
+        loader = PopulationLoader(max_batch_size=2)
+        authors = ["u0", "u1", "u2", "u3", "u4"]
+
+        documents = asyncio.run(self._request(loader, authors))
+
+        assert [document["author"]["_id"] for document in documents] == authors
+        assert self.users.queries == [
+            {"_id": {"$in": ["u0", "u1"]}},
+            {"_id": {"$in": ["u2", "u3"]}},
+            {"_id": {"$in": ["u4"]}},
+        ]
+        assert (loader.loads, loader.batches, loader.batch_sizes) == (1, 3, {2: 2, 1: 1})
+
+    def test_error_is_fanned_out(self) -> None:
+        self.users.error = RuntimeError("connection lost")
+        loader = PopulationLoader()
+
+        async def requests() -> list[Any]:
+            return await asyncio.gather(
+                self._request(loader, ["u0"]), self._request(loader, ["u1"]), return_exceptions=True
+            )
+
+        assert [str(result) for result in asyncio.run(requests())] == ["connection lost", "connection lost"]
+        assert loader.batches == 1
+
+    def test_cancelled_request(self) -> None:
+        loader = PopulationLoader()
+
+        async def requests() -> list[dict[str, Any]]:
+            cancelled = asyncio.ensure_future(self._request(loader, ["u0"]))
+            remaining = asyncio.ensure_future(self._request(loader, ["u1"]))
+            await asyncio.sleep(0.005)
+            cancelled.cancel()
+            return await remaining
+
+        assert asyncio.run(requests()) == [{"_id": 0, "author": {"_id": "u1", "name": "user1"}}]
+
+    def test_bad_configuration(self) -> None:
+        with pytest.raises(ValueError, match="Loader window must be positive"):
+            PopulationLoader(window=-1)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from mongo_queries_manager import MongoQuery, ProjectionError, QueryCache, QueryParser, mqm, to_pipeline
+
+
+class TestMongoQuery:
+    def test_mapping(self) -> None:
+        string_query = "status=sent&price>=5.6&sort=-created_at&skip=5&limit=10&fields=-_id"
+        query = QueryParser().parse_query(string_query)
+
+        assert query == mqm(string_query)
+        assert dict(query) == mqm(string_query)
+        assert query.to_dict() == mqm(string_query)
+        assert query["filter"] is query.filter
+        assert list(query) == ["filter", "sort", "skip", "limit", "projection"]
+        assert "population" not in query
+        assert query.get("population") is None
+
+    def test_population(self) -> None:
+        string_query = "populate=user,user.company&fields=title,user.name,user.company.name"
+        query = QueryParser(populate=True).parse_query(string_query)
+
+        assert len(query) == len(mqm(string_query, populate=True))
+        assert query == mqm(string_query, populate=True)
+        assert query.to_pipeline({"user": "users"}) == to_pipeline(mqm(string_query, populate=True), {"user": "users"})
+
+    def test_lazy_projection(self) -> None:
+        query = QueryParser(populate=True).parse_query("status=sent&limit=5&fields={bad json}&populate=user")
+
+        assert query.to_count_kwargs() == {"filter": {"status": "sent"}, "limit": 5}
+        with pytest.raises(ProjectionError):
+            query.to_find_kwargs()
+
+    def test_find_kwargs(self) -> None:
+        query = QueryParser().parse_query("status=sent&sort=price&skip=10&fields=title")
+
+        assert query.to_find_kwargs() == {
+            "filter": {"status": "sent"},
+            "projection": {"title": 1},
+            "sort": [("price", 1)],
+            "skip": 10,
+            "limit": 0,
+        }
+        assert query.to_count_kwargs() == {"filter": {"status": "sent"}, "skip": 10}
+
+    def test_hash_and_equality(self) -> None:
+        parser = QueryParser(populate=True)
+        first_query = parser.parse_query("price>5&price<10&status=sent&populate=user")
+        second_query = parser.parse_query("status=sent&price<10&price>5&populate=user")
+        third_query = parser.parse_query("status=sent&price<10&price>6&populate=user")
+
+        assert first_query == second_query
+        assert hash(first_query) == hash(second_query)
+        assert first_query != third_query
+        assert len({first_query, second_query, third_query}) == len([first_query, third_query])
+
+        # The hash follows the (shared) sections, it isn't cached.
+        first_query.filter["price"]["$gt"] = 6.0
+        assert first_query == third_query
+        assert hash(first_query) == hash(third_query)
+
+    def test_immutable(self) -> None:
+        query = MongoQuery({"status": "sent"})
+
+        with pytest.raises(AttributeError):
+            query.limit = 5  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            del query.filter  # type: ignore[misc]
+
+    def test_cache(self) -> None:
+        parser = QueryParser(cache=QueryCache())
+        parser.parse("status=sent&fields=title")
+        query = parser.parse_query("status=sent&fields=title")
+
+        assert parser.cache is not None
+        assert parser.cache.hits == 1
+        assert query == MongoQuery({"status": "sent"}, projection={"title": 1})
+
+    def test_from_dict(self) -> None:
+        mongodb_query: dict[str, Any] = mqm("status=sent&populate=user", populate=True)
+
+        assert MongoQuery.from_dict(mongodb_query) == mongodb_query
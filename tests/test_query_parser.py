@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import pytest
+from mongo_queries_manager import BatchResult, LimitError, PureCaster, QueryCache, QueryParser, mqm
+
+
+class TestQueryParser:
+    def test_parse(self) -> None:
+        parser = QueryParser()
+
+        assert parser.parse("status=sent&price>=5.6&limit=10&skip=5&sort=-created_at&fields=-_id") == {
+            "filter": {"status": "sent", "price": {"$gte": 5.6}},
+            "sort": [("created_at", -1)],
+            "skip": 5,
+            "limit": 10,
+            "projection": {"_id": 0},
+        }
+
+    def test_parse_reuse(self) -> None:
+        parser = QueryParser(blacklist=["latitude"], casters={"string": str}, populate=True)
+        string_queries = [
+            "price=string(5)&latitude=43.6046256&populate=user&fields=user.name",
+            "name=John&populate=user,settings",
+            "",
+        ]
+
+        for string_query in string_queries:
+            assert parser.parse(string_query) == mqm(
+                string_query, blacklist=["latitude"], casters={"string": str}, populate=True
+            )
+
+    def test_parse_results_are_independent(self) -> None:
+        parser = QueryParser()
+        first_result = parser.parse("price>5")
+        first_result["filter"]["price"]["$lt"] = 10
+
+        assert parser.parse("price>5")["filter"] == {"price": {"$gt": 5}}
+
+    def test_mqm_config_reuse(self) -> None:
+        blacklist = ["latitude"]
+        calls: list[str] = []
+
+        def pure_string(value: str) -> str:
+            calls.append(value)
+            return value
+
+        casters = {"pure_string": PureCaster(pure_string)}
+        assert mqm("price=pure_string(5)&latitude=1", blacklist, casters)["filter"] == {"price": "5"}
+        assert mqm("price=pure_string(5)&latitude=1", blacklist, casters)["filter"] == {"price": "5"}
+        assert calls == ["5"]
+
+        # The configuration is read on every call.
+        blacklist[:] = ["price"]
+        assert mqm("price=pure_string(5)&latitude=1", blacklist, casters)["filter"] == {"latitude": 1}
+
+    def test_mqm_unhashable_caster(self) -> None:
+        class Upper:
+            __hash__ = None  # type: ignore[assignment]
+
+            def __call__(self, value: str) -> str:
+                return value.upper()
+
+        assert mqm("name=upper(john)", casters={"upper": Upper()})["filter"] == {"name": "JOHN"}
+
+
+class TestParseMany:
+    string_queries = ("price>5", "limit=-1", "price=string(5)&populate=user", "name=John&limit=10")
+
+    def test_parse_many(self) -> None:
+        parser = QueryParser(casters={"string": str}, populate=True)
+        batch_results = list(parser.parse_many(self.string_queries))
+
+        assert [batch_result.query for batch_result in batch_results] == list(self.string_queries)
+        assert batch_results[0] == BatchResult("price>5", parser.parse("price>5"), None)
+        assert batch_results[1].result is None
+        assert isinstance(batch_results[1].error, LimitError)
+        assert batch_results[2].result == parser.parse("price=string(5)&populate=user")
+        assert batch_results[3].result == parser.parse("name=John&limit=10")
+
+    def test_parse_many_is_lazy(self) -> None:
+        batch_results = QueryParser().parse_many(iter(("price>5", "limit=-1")))
+
+        assert next(batch_results).error is None
+        assert isinstance(next(batch_results).error, LimitError)
+
+    def test_parse_many_workers(self) -> None:
+        cache = QueryCache()
+        parser = QueryParser(casters={"string": str, "pure_string": PureCaster(str)}, populate=True, cache=cache)
+        batch_results = list(
+            parser.parse_many(self.string_queries + ("price=pure_string(5)",), workers=2, chunk_size=2)
+        )
+        expected_results = list(QueryParser(casters={"string": str}, populate=True).parse_many(self.string_queries))
+
+        assert [(batch_result.query, batch_result.result) for batch_result in batch_results[:-1]] == [
+            (batch_result.query, batch_result.result) for batch_result in expected_results
+        ]
+        assert isinstance(batch_results[1].error, LimitError)
+        assert batch_results[-1].result == parser.parse("price=pure_string(5)")
+
+        # Cacheable results are put into the parser cache (not the failed one, nor the custom caster one).
+        assert len(cache) == 3  # noqa: PLR2004
+
+    def test_parse_many_chunk_size(self) -> None:
+        with pytest.raises(ValueError, match="Batch chunk_size must be positive"):
+            list(QueryParser().parse_many(self.string_queries, workers=2, chunk_size=0))
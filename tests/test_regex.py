@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from bson.objectid import ObjectId
+from bson.regex import Regex
+from mongo_queries_manager import QueryParser, RegexError, RegexRewrite, fingerprint, mqm, rewrite_regex
+
+COLLATION = {"locale": "en", "strength": 2}
+
+
+class TestRegexRewrite:
+    parser = QueryParser(rewrite_regex=True, collation=COLLATION)
+
+    def test_prefix_range(self) -> None:
+        assert self.parser.parse("name=/^john/&limit=5") == {
+            "filter": {"name": {"$gte": "john", "$lt": "joho"}},
+            "sort": None,
+            "skip": 0,
+            "limit": 5,
+            "projection": None,
+            "collation": None,
+            "unindexed": [],
+        }
+        assert self.parser.parse(r"email=/^john\.doe@/")["filter"] == {
+            "email": {"$gte": "john.doe@", "$lt": "john.doeA"}
+        }
+
+    def test_prefix_with_pattern(self) -> None:
+        assert self.parser.parse("name=/^john.*doe/")["filter"] == {
+            "name": {"$regex": re.compile("/^john.*doe/"), "$gte": "john", "$lt": "joho"}
+        }
+        assert self.parser.parse("name=/^jo?hn/")["filter"] == {
+            "name": {"$regex": re.compile("/^jo?hn/"), "$gte": "j", "$lt": "k"}
+        }
+
+    def test_exact_match(self) -> None:
+        assert self.parser.parse("name=/^john$/")["filter"] == {"name": "john"}
+
+    def test_case_insensitive_exact_match(self) -> None:
+        mongodb_query = self.parser.parse(r"email=/^john@x\.com$/i&price>5")
+
+        assert mongodb_query["filter"] == {"email": "john@x.com", "price": {"$gt": 5.0}}
+        assert mongodb_query["collation"] == COLLATION
+        assert mongodb_query["unindexed"] == []
+
+    def test_case_insensitive_with_string_filter(self) -> None:
+        mongodb_query = self.parser.parse(r"email=/^john@x\.com$/i&status=sent")
+
+        assert mongodb_query["filter"] == {"email": re.compile(r"/^john@x\.com$/i"), "status": "sent"}
+        assert mongodb_query["collation"] is None
+        assert mongodb_query["unindexed"] == ["email"]
+
+    def test_case_insensitive_without_collation(self) -> None:
+        mongodb_query = QueryParser(rewrite_regex=True).parse(r"email=/^john@x\.com$/i")
+
+        assert mongodb_query["collation"] is None
+        assert mongodb_query["unindexed"] == ["email"]
+
+    def test_case_insensitive_with_sort(self) -> None:
+        mongodb_query = self.parser.parse(r"email=/^john@x\.com$/i&sort=name")
+
+        assert mongodb_query["filter"] == {"email": re.compile(r"/^john@x\.com$/i")}
+        assert mongodb_query["collation"] is None
+        assert mongodb_query["unindexed"] == ["email"]
+
+    def test_case_insensitive_with_non_string_sort(self) -> None:
+        parser = QueryParser(rewrite_regex=True, collation=COLLATION, schema={"price": float, "_id": ObjectId})
+
+        mongodb_query = parser.parse(r"email=/^john@x\.com$/i&sort=-price")
+        assert mongodb_query["filter"] == {"email": "john@x.com"}
+        assert mongodb_query["collation"] == COLLATION
+        assert parser.parse(r"email=/^john@x\.com$/i&sort=name")["collation"] is None
+
+    def test_case_insensitive_with_keyset(self) -> None:
+        query_string = r"email=/^john@x\.com$/i&sort=-price"
+        keyset_parser = QueryParser(rewrite_regex=True, collation=COLLATION, keyset=True, schema={"price": float})
+        assert keyset_parser.parse(query_string)["collation"] is None
+
+        keyset_parser = QueryParser(
+            rewrite_regex=True, collation=COLLATION, keyset=True, schema={"price": float, "_id": ObjectId}
+        )
+        assert keyset_parser.parse(query_string)["collation"] == COLLATION
+
+    def test_unindexed(self) -> None:
+        mongodb_query = self.parser.parse("name=/john/&city=/^par/i&tag=/^a|b/&text=/^a/m&phone!=/^06/")
+
+        assert mongodb_query["filter"] == mqm("name=/john/&city=/^par/i&tag=/^a|b/&text=/^a/m&phone!=/^06/")["filter"]
+        assert mongodb_query["unindexed"] == ["name", "city", "tag", "text", "phone"]
+
+    def test_rewrite_regex(self) -> None:
+        assert rewrite_regex({"name": re.compile("^john", re.IGNORECASE), "code": re.compile("^ab")}) == RegexRewrite(
+            {"name": re.compile("^john", re.IGNORECASE), "code": {"$gte": "ab", "$lt": "ac"}}, None, ["name"]
+        )
+
+        mongodb_filter = {"email": re.compile("^john$", re.IGNORECASE)}
+        assert rewrite_regex(mongodb_filter, COLLATION, [("age", 1)]) == RegexRewrite(mongodb_filter, None, ["email"])
+        assert rewrite_regex(mongodb_filter, COLLATION, [("age", 1)], {"age"}) == RegexRewrite(
+            {"email": "john"}, COLLATION, []
+        )
+
+    def test_mongo_query(self) -> None:
+        query = self.parser.parse_query(r"email=/^john@x\.com$/i&limit=5")
+
+        assert query.collation == COLLATION
+        assert query.to_find_kwargs()["collation"] == COLLATION
+        assert query.to_count_kwargs() == {"filter": {"email": "john@x.com"}, "limit": 5, "collation": COLLATION}
+        assert fingerprint(query) != fingerprint(mqm("email=john@x.com&limit=5"))
+        assert "collation" not in QueryParser().parse_query("limit=5").to_find_kwargs()
+
+
+class TestRegexOutput:
+    def test_legacy(self) -> None:
+        assert QueryParser().parse(r"email=/@gmail\.com$/i")["filter"] == mqm(r"email=/@gmail\.com$/i")["filter"]
+
+    def test_python(self) -> None:
+        assert QueryParser(regex_output="python").parse(r"email=/@gmail\.com$/gi&phone!=/^06/")["filter"] == {
+            "email": re.compile(r"@gmail\.com$", re.IGNORECASE),
+            "phone": {"$ne": re.compile("^06")},
+        }
+
+    def test_repeated_flags(self) -> None:
+        python_parser = QueryParser(regex_output="python")
+
+        assert python_parser.parse("a=/a/ii&b=/b/mm&c=/c/imi")["filter"] == {
+            "a": re.compile("a", re.IGNORECASE),
+            "b": re.compile("b", re.MULTILINE),
+            "c": re.compile("c", re.IGNORECASE | re.MULTILINE),
+        }
+        assert QueryParser(regex_output="operator").parse("a=/a/ii")["filter"] == {
+            "a": {"$regex": "a", "$options": "i"}
+        }
+        assert QueryParser(regex_output="bson").parse("a=/a/mm")["filter"] == {"a": Regex("a", "m")}
+
+    def test_bson(self) -> None:
+        mongodb_filter = QueryParser(regex_output="bson").parse(r"email=/@gmail\.com$/mi")["filter"]
+
+        assert mongodb_filter == {"email": Regex(r"@gmail\.com$", "mi")}
+        assert mongodb_filter["email"].flags == re.IGNORECASE | re.MULTILINE
+
+    def test_operator(self) -> None:
+        assert QueryParser(regex_output="operator").parse(r"email=/@gmail\.com$/i&name=/^jo/")["filter"] == {
+            "email": {"$regex": r"@gmail\.com$", "$options": "i"},
+            "name": {"$regex": "^jo"},
+        }
+
+    def test_rewrite(self) -> None:
+        for regex_output in ("python", "bson", "operator"):
+            parser = QueryParser(regex_output=regex_output, rewrite_regex=True, collation=COLLATION)
+
+            assert parser.parse("name=/^john/")["filter"] == {"name": {"$gte": "john", "$lt": "joho"}}
+            assert parser.parse(r"email=/^john@x\.com$/i")["filter"] == {"email": "john@x.com"}
+            assert parser.parse("city=/par/")["unindexed"] == ["city"]
+
+    def test_mongo_query_hash(self) -> None:
+        parser = QueryParser(regex_output="bson")
+
+        assert hash(parser.parse_query("email=/a/i")) == hash(parser.parse_query("email=/a/i"))
+
+    def test_invalid_output(self) -> None:
+        with pytest.raises(ValueError):
+            QueryParser(regex_output="pcre")
+
+
+class TestRegexGuard:
+    parser = QueryParser(regex_output="bson", regex_max_length=32, regex_guard=True)
+
+    def test_nested_repeats(self) -> None:
+        for string_query in ("a=/(a+)+$/", r"a=/^(\w*\s?)*$/", "a=/((ab)*c)+/", "a=/(x{2,})*/", "a=/(.*a){20}/"):
+            with pytest.raises(RegexError):
+                self.parser.parse(string_query)
+
+    def test_repeated_alternations(self) -> None:
+        for string_query in ("a=/(a|aa)+$/", "a=/(a|a)*b/", "a=/^((a|ab)c)+$/", "a=/(?:x|xy){2,}/", "a=/(J|j)+/"):
+            with pytest.raises(RegexError):
+                self.parser.parse(string_query)
+
+    def test_safe_patterns(self) -> None:
+        for string_query in ("a=/^(ab)+$/", "a=/[(]a+[)]+/", r"a=/^\(a+\)+$/", "a=/(a|b)?c*/", "a=/^\\d{3}-\\d+$/"):
+            assert self.parser.parse(string_query)["filter"]["a"]
+
+    def test_disjoint_alternations(self) -> None:
+        for string_query in (r"a=/\.(jpg|png)+$/", "a=/(?:get|post)*/", "a=/^((a|b)c)+$/"):
+            assert self.parser.parse(string_query)["filter"]["a"]
+
+    def test_max_length(self) -> None:
+        with pytest.raises(RegexError):
+            self.parser.parse(f"a=/{'a' * 33}/")
+        assert self.parser.parse(f"a=/{'a' * 32}/")["filter"] == {"a": Regex("a" * 32)}
+
+    def test_value_without_flags(self) -> None:
+        assert QueryParser(regex_output="python").parse("path=/api/users")["filter"] == {
+            "path": re.compile("/api/users")
+        }
+        assert self.parser.parse("path=/api/users")["filter"] == {"path": Regex("/api/users")}
+        assert QueryParser(regex_output="operator").parse("path=/api/users")["filter"] == {
+            "path": {"$regex": "/api/users"}
+        }
+
+    def test_invalid_regex(self) -> None:
+        with pytest.raises(RegexError):
+            QueryParser(regex_output="python").parse("a=/(a/")
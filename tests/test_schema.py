@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# Copyright (c) Modos Team, 2020
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from bson import Decimal128, ObjectId
+from mongo_queries_manager import PureCaster, QueryCache, QueryParser, SchemaError
+
+SCHEMA = {
+    "_id": ObjectId,
+    "zip": str,
+    "price": Decimal128,
+    "created": datetime,
+    "active": bool,
+    "author": {"name": str, "age": int},
+}
+
+
+class TestSchema:
+    def test_declared_fields(self) -> None:
+        parser = QueryParser(schema=SCHEMA)
+
+        assert parser.parse(
+            "_id=5f3f7d3b9c6f1d2b3c4d5e6f&zip=01234&price>=5.6&created<2016-01-01T10:00:00&active=false"
+        )["filter"] == {
+            "_id": ObjectId("5f3f7d3b9c6f1d2b3c4d5e6f"),
+            "zip": "01234",
+            "price": {"$gte": Decimal128("5.6")},
+            "created": {"$lt": datetime(2016, 1, 1, 10, 0)},
+            "active": False,
+        }
+
+    def test_declared_fields_are_not_guessed(self) -> None:
+        parser = QueryParser(schema=SCHEMA)
+
+        assert parser.parse("zip=null&author.name=/john/i&author.age!=5")["filter"] == {
+            "zip": "null",
+            "author.name": "/john/i",
+            "author.age": {"$ne": 5},
+        }
+
+    def test_declared_list(self) -> None:
+        parser = QueryParser(schema=SCHEMA)
+
+        assert parser.parse("zip=01234,75001&author.age!=1,2")["filter"] == {
+            "zip": {"$in": ["01234", "75001"]},
+            "author.age": {"$nin": [1, 2]},
+        }
+
+    def test_array_field(self) -> None:
+        parser = QueryParser(schema={"tags": [str], "scores": [int]})
+
+        assert parser.parse("tags=01234&scores>5")["filter"] == {"tags": "01234", "scores": {"$gt": 5}}
+        assert parser.scalar_fields == frozenset()
+        assert QueryParser(schema=SCHEMA).scalar_fields == {
+            "_id",
+            "zip",
+            "price",
+            "created",
+            "active",
+            "author.name",
+            "author.age",
+        }
+
+    def test_exists(self) -> None:
+        parser = QueryParser(schema=SCHEMA, unknown_fields="reject")
+
+        assert parser.parse("!zip&author.name")["filter"] == {
+            "zip": {"$exists": False},
+            "author.name": {"$exists": True},
+        }
+        with pytest.raises(SchemaError):
+            parser.parse("!email")
+
+    def test_unknown_fields_infer(self) -> None:
+        parser = QueryParser(schema=SCHEMA)
+
+        assert parser.parse("zip=01234&code=01234&country=GB,US")["filter"] == {
+            "zip": "01234",
+            "code": 1234,
+            "country": {"$in": ["GB", "US"]},
+        }
+
+    def test_unknown_fields_reject(self) -> None:
+        parser = QueryParser(schema=SCHEMA, unknown_fields="reject", blacklist=["token"])
+
+        assert parser.parse("zip=01234&token=abc&limit=10")["filter"] == {"zip": "01234"}
+        with pytest.raises(SchemaError, match="Unknown field author.email"):
+            parser.parse("zip=01234&author.email=john@example.com")
+
+    def test_bad_value(self) -> None:
+        parser = QueryParser(schema=SCHEMA)
+
+        for string_query in ("_id=1234", "active=yes", "created>yesterday", "author.age=1,two"):
+            with pytest.raises(SchemaError):
+                parser.parse(string_query)
+
+    def test_pure_caster(self) -> None:
+        parser = QueryParser(schema={"price": PureCaster(Decimal)})
+
+        assert parser.parse("price=5.60")["filter"] == {"price": Decimal("5.60")}
+        assert parser.schema is not None
+        assert parser.schema["price"]("5.60") is parser.schema["price"]("5.60")
+
+    def test_bad_schema(self) -> None:
+        with pytest.raises(TypeError, match="Schema type of field author.name isn't callable"):
+            QueryParser(schema={"author": {"name": "str"}})
+        with pytest.raises(TypeError, match="Schema type of array field tags must be a list of one type"):
+            QueryParser(schema={"tags": [str, int]})
+        with pytest.raises(ValueError):
+            QueryParser(schema=SCHEMA, unknown_fields="ignore")
+
+    def test_array_fingerprint(self) -> None:
+        assert QueryParser(schema={"tags": [str]}).fingerprint != QueryParser(schema={"tags": str}).fingerprint
+
+    def test_cache_fingerprint(self) -> None:
+        cache = QueryCache()
+        QueryParser(cache=cache).parse("zip=01234")
+
+        assert QueryParser(schema=SCHEMA, cache=cache).parse("zip=01234")["filter"] == {"zip": "01234"}
+        assert cache.hits == 0
@@ -45,6 +45,13 @@ class TestTypes:
             "projection": None,
         }
 
+    def test_type_integer_cast_as_float(self) -> None:
+        query_result = mqm(string_query="price=5&stock=\u0661\u0662")
+
+        assert type(query_result["filter"]["price"]) is float
+        assert type(query_result["filter"]["stock"]) is int
+        assert query_result["filter"] == {"price": 5.0, "stock": 12}
+
     # Type float tests part
     def test_type_float(self) -> None:
         query_result = mqm(string_query="price=5.5")